@@ -1,11 +1,23 @@
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
 import numpy as np
 import math
-from scipy.optimize import brentq
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import yaml
+
+# --- SATURATED GAIN KERNEL ---
+def _solve_gain_for_target_pout(g0_linear, P_s_mW, target_Pout_mW: float, n_iter: int = 50):
+    """
+    Saturated linear gain G satisfying G = g0 * exp((1 - G) * P_in / P_s) with G * P_in = target_Pout_mW.
+    With u = ln(g0 / G) the output power is P_s * u / (1 - exp(u) / g0), which rises monotonically
+    from 0 to infinity on u in (0, ln g0) when g0 > 2, so a fixed-count bisection on u converges for
+    every element at once. Accepts floats or NumPy arrays; elements with g0 <= 2 must be masked by the caller.
+    """
+    exp, log = (math.exp, math.log) if np.ndim(g0_linear) == 0 else (np.exp, np.log)
+    lo = 0.0 * g0_linear
+    hi = log(g0_linear)
+    for _ in range(n_iter):
+        u = 0.5 * (lo + hi)
+        too_low = P_s_mW * u < target_Pout_mW * (1.0 - exp(u) / g0_linear)
+        lo = lo + (u - lo) * too_low
+        hi = u + (hi - u) * too_low
+    return g0_linear * exp(-0.5 * (lo + hi))
 
 # --- EuropaSOA CLASS DEFINITION ---
 class EuropaSOA:
@@ -67,6 +79,11 @@ class EuropaSOA:
         if self.W_um <= 1e-9 or Lt_um <= 1e-9: return 0.0
         return J_kA_cm2 * self.W_um * Lt_um / 100.0
 
+    def calculate_current_mA_from_J_vectorized(self, J_kA_cm2: float, L_active_um_array: np.ndarray) -> np.ndarray:
+        Lt_um = np.asarray(L_active_um_array, dtype=float) + self.L_tapers_total_um
+        current_mA = J_kA_cm2 * self.W_um * Lt_um / 100.0
+        return np.where((self.W_um > 1e-9) & (Lt_um > 1e-9), current_mA, 0.0)
+
     def _get_g_pk_dB(self, T_C: float, J_kA_cm2: float) -> float:
         L_for_RSM = self.L_active_um
         if J_kA_cm2 <= 1e-9: return -float('inf')
@@ -121,6 +138,38 @@ class EuropaSOA:
         max_f_val = 4.0 / fwhm_nm
         return 0.0 if abs(max_f_val) < 1e-12 else (f_val * (10**(0.1 * g_pk_dB))) / max_f_val
 
+    def _calculate_g0_linear_at_L_vec(self, L_val_um: float, lambda_nm: np.ndarray, T_C: float, J_kA_cm2: float) -> np.ndarray:
+        original_L_temp_store = self.L_active_um
+        self.L_active_um = L_val_um
+        g_pk_dB = self._get_g_pk_dB(T_C, J_kA_cm2)
+        lambda_pk_nm = self._get_lambda_pk_nm(T_C, J_kA_cm2)
+        fwhm_nm = self._get_fwhm_nm(T_C, J_kA_cm2)
+        self.L_active_um = original_L_temp_store
+        if math.isnan(lambda_pk_nm) or g_pk_dB == -float('inf') or fwhm_nm <= 1e-9: return np.zeros_like(lambda_nm)
+        f_val_denominator = (lambda_pk_nm - lambda_nm)**2 + (fwhm_nm / 2.0)**2
+        max_f_val = 4.0 / fwhm_nm
+        if abs(max_f_val) < 1e-12: return np.zeros_like(lambda_nm)
+        g0_linear = (fwhm_nm / np.maximum(f_val_denominator, 1e-12) * (10**(0.1 * g_pk_dB))) / max_f_val
+        at_peak = np.where(np.abs(lambda_nm - lambda_pk_nm) < 1e-9, 10**(g_pk_dB / 10.0), 0.0)
+        return np.where(f_val_denominator < 1e-12, at_peak, g0_linear)
+
+    def get_unsaturated_gain_vec(self, lambda_nm: np.ndarray, T_C: float, J_kA_cm2: float, output_in_dB: bool = True) -> np.ndarray:
+        """get_unsaturated_gain evaluated for an array of wavelengths"""
+        lambda_nm = np.asarray(lambda_nm, dtype=float)
+        if J_kA_cm2 <= 1e-9: return np.full(lambda_nm.shape, -float('inf') if output_in_dB else 0.0)
+        if self.L_active_um_orig > 440:
+            L_extrap_input = min(self.L_active_um_orig, 900.0)
+            L_ref1, L_ref2 = 440.0, 430.0
+            g0_at_L_ref1_linear = self._calculate_g0_linear_at_L_vec(L_ref1, lambda_nm, T_C, J_kA_cm2)
+            g0_at_L_ref2_linear = self._calculate_g0_linear_at_L_vec(L_ref2, lambda_nm, T_C, J_kA_cm2)
+            slope = (g0_at_L_ref1_linear - g0_at_L_ref2_linear) / (L_ref1 - L_ref2)
+            g0_linear = g0_at_L_ref1_linear + slope * (L_extrap_input - L_ref1)
+        else:
+            g0_linear = self._calculate_g0_linear_at_L_vec(self.L_active_um_orig, lambda_nm, T_C, J_kA_cm2)
+        g0_linear = np.maximum(g0_linear, 0.0)
+        if not output_in_dB: return g0_linear
+        return np.where(g0_linear > 1e-9, 10 * np.log10(np.maximum(g0_linear, 1e-300)), g0_linear)
+
     def get_unsaturated_gain(self, lambda_nm: float, T_C: float, J_kA_cm2: float, output_in_dB: bool = True) -> float:
         if J_kA_cm2 <= 1e-9: return -float('inf') if output_in_dB else 0.0
         if 40 <= self.L_active_um_orig <= 440:
@@ -144,6 +193,23 @@ class EuropaSOA:
                 0.001763 * (T_C - 60.07) * (J_kA_cm2 - 4.571) -
                 0.008584 * (lambda_nm - 1310.8) * (J_kA_cm2 - 4.571))
 
+    def get_output_saturation_power_dBm_vec(self, lambda_nm: np.ndarray, J_kA_cm2: float, T_C: float) -> np.ndarray:
+        """get_output_saturation_power_dBm evaluated for an array of wavelengths"""
+        return self.get_output_saturation_power_dBm(np.asarray(lambda_nm, dtype=float), J_kA_cm2, T_C)
+
+    def get_output_saturation_power_J_coefficients(self, lambda_nm: np.ndarray, T_C: float):
+        """
+        get_output_saturation_power_dBm rearranged as c0 + c1 * dJ + c2 * dJ**2 with dJ = J_kA_cm2 - 4.571,
+        for sweeping current density at fixed wavelengths. Returns (c0, c1, c2); c0 and c1 follow lambda_nm's shape.
+        """
+        lambda_nm = np.asarray(lambda_nm, dtype=float)
+        d_lambda = lambda_nm - 1310.8
+        d_T = T_C - 60.07
+        c0 = (-74.08 + 0.06226 * lambda_nm - 0.008877 * T_C + 0.994 * 4.571 +
+              0.01752 * d_lambda**2 - 0.00002341 * d_T**2 - 0.001266 * d_lambda * d_T)
+        c1 = 0.994 - 0.001763 * d_T - 0.008584 * d_lambda
+        return c0, c1, -0.08721
+
     def _newton_iteration_for_gain(self, P_os_mW: float, g0_linear: float, P_in_mW: float) -> float:
         if g0_linear <= 2.000001: return g0_linear
         denominator_Ps_calc = g0_linear * math.log(2.0)
@@ -194,24 +260,78 @@ class EuropaSOA:
         if delta_P_optical_mW < 0: return 0.0
         return (delta_P_optical_mW / P_electrical_mW) * 100.0
 
-    def find_Pin_for_target_Pout(self, target_Pout_mW: float, I_mA: float, lambda_nm: float, T_C: float) -> float | None:
+    def _get_J_for_current_kA_cm2(self, I_mA: float) -> float:
         original_L_temp = self.L_active_um
         self.L_active_um = self.L_active_um_orig
         J_kA_cm2 = self.calculate_current_density_kA_cm2(I_mA)
         self.L_active_um = original_L_temp
+        return J_kA_cm2
+
+    def find_Pin_for_target_Pout(self, target_Pout_mW: float, I_mA: float, lambda_nm: float, T_C: float) -> float | None:
+        J_kA_cm2 = self._get_J_for_current_kA_cm2(I_mA)
         if (J_kA_cm2 <= 1e-9 and I_mA > 1e-9) or (I_mA <= 1e-9 and target_Pout_mW > 1e-9): return None
+        if target_Pout_mW <= 1e-9: return 0.0
 
-        def objective_func(Pin_mW_local: float) -> float:
-            if Pin_mW_local <= 0: return target_Pout_mW * 100 + 1
-            gain_linear = self.get_saturated_gain(lambda_nm, T_C, J_kA_cm2, Pin_mW_local, output_in_dB=False)
-            return gain_linear * Pin_mW_local - target_Pout_mW
+        g0_linear = self.get_unsaturated_gain(lambda_nm, T_C, J_kA_cm2, output_in_dB=False)
+        if g0_linear <= 2.000001:
+            # Below g0 = 2 the gain model does not saturate
+            if g0_linear <= 1e-9: return None
+            G_linear = g0_linear
+        else:
+            P_os_mW = 10**(self.get_output_saturation_power_dBm(lambda_nm, J_kA_cm2, T_C) / 10.0)
+            P_s_mW = P_os_mW * (g0_linear - 2.0) / (g0_linear * math.log(2.0))
+            if P_s_mW <= 1e-12: return None
+            G_linear = _solve_gain_for_target_pout(g0_linear, P_s_mW, target_Pout_mW)
 
-        if target_Pout_mW <= 1e-9: return 0.0
-        try:
-            result = brentq(objective_func, 1e-7, max(target_Pout_mW * 10, 1e-5))
-            # brentq can return a tuple or single value, we need the root value
-            if isinstance(result, tuple):
-                return result[0]  # Return the root value from the tuple
-            return result  # Return the single value
-        except (ValueError, RuntimeError):
-            return None 
\ No newline at end of file
+        # Keep the P_in bracket this solver has always searched
+        Pin_mW = target_Pout_mW / G_linear
+        return Pin_mW if 1e-7 <= Pin_mW <= max(target_Pout_mW * 10, 1e-5) else None
+
+    def find_Pin_for_target_Pout_vec(self, target_Pout_mW: float, I_mA: float, lambda_nm: np.ndarray, T_C: float) -> np.ndarray:
+        """Required P_in (mW) for each wavelength in lambda_nm; NaN where the target is not reachable"""
+        lambda_nm = np.asarray(lambda_nm, dtype=float)
+        J_kA_cm2 = self._get_J_for_current_kA_cm2(I_mA)
+        if (J_kA_cm2 <= 1e-9 and I_mA > 1e-9) or (I_mA <= 1e-9 and target_Pout_mW > 1e-9):
+            return np.full(lambda_nm.shape, np.nan)
+        if target_Pout_mW <= 1e-9: return np.zeros(lambda_nm.shape)
+
+        g0_linear = self.get_unsaturated_gain_vec(lambda_nm, T_C, J_kA_cm2, output_in_dB=False)
+        P_os_mW = 10**(self.get_output_saturation_power_dBm_vec(lambda_nm, J_kA_cm2, T_C) / 10.0)
+        # Below g0 = 2 the gain model does not saturate; solve the rest with a placeholder g0 of 4
+        saturating = g0_linear > 2.000001
+        g0_sat = np.where(saturating, g0_linear, 4.0)
+        P_s_mW = P_os_mW * (g0_sat - 2.0) / (g0_sat * math.log(2.0))
+        G_sat = _solve_gain_for_target_pout(g0_sat, np.maximum(P_s_mW, 1e-12), target_Pout_mW)
+        G_linear = np.where(saturating, np.where(P_s_mW <= 1e-12, 0.0, G_sat), g0_linear)
+
+        # Keep the P_in bracket this solver has always searched
+        with np.errstate(divide='ignore'):
+            Pin_mW = target_Pout_mW / G_linear
+        in_bracket = (Pin_mW >= 1e-7) & (Pin_mW <= max(target_Pout_mW * 10, 1e-5))
+        return np.where(in_bracket, Pin_mW, np.nan)
+
+    def sweep_wavelengths(self, wavelengths: np.ndarray, current_ma: float, target_pout_mw: float, T_C: float):
+        """
+        Operating point at a fixed drive current and target P_out for every wavelength in one pass.
+        Returns (wpe_percent, gain_dB, pin_dBm, sat_dBm) arrays; NaN where the target is not reachable.
+        At the solved P_in the saturated gain is exactly target_pout_mw / P_in, so gain and WPE need no further Newton solve.
+        """
+        wavelengths = np.asarray(wavelengths, dtype=float)
+        J_kA_cm2 = self._get_J_for_current_kA_cm2(current_ma)
+        pin_mw = self.find_Pin_for_target_Pout_vec(target_pout_mw, current_ma, wavelengths, T_C)
+        sat_dbm = self.get_output_saturation_power_dBm_vec(wavelengths, J_kA_cm2, T_C)
+
+        if target_pout_mw <= 1e-9:
+            gain_db = self.get_unsaturated_gain_vec(wavelengths, T_C, J_kA_cm2)
+        else:
+            gain_db = 10 * np.log10(target_pout_mw / pin_mw)
+
+        P_electrical_mW = current_ma * self.get_operating_voltage(current_ma) if current_ma > 1e-9 else 0.0
+        if P_electrical_mW <= 1e-9:
+            wpe = np.where(np.isnan(pin_mw), np.nan, 0.0)
+        else:
+            wpe = np.maximum(target_pout_mw - pin_mw, 0.0) / P_electrical_mW * 100.0
+
+        with np.errstate(divide='ignore'):
+            pin_dbm = 10 * np.log10(pin_mw)
+        return wpe, gain_db, pin_dbm, sat_dbm
@@ -1,6 +1,50 @@
 import math
+import numpy as np
 from EuropaSOA import EuropaSOA
 
+def _optimum_current_kernel(soa, wavelengths_nm, temp_c: float, target_pout_mw: float):
+    """
+    Bisect the current density (1-15 kA/cm²) at which the saturation power averaged over
+    wavelengths_nm reaches 2 dB above target_pout_mw; falls back to the upper bound when unreachable.
+    Returns (j_opt, current_ma, avg_saturation_power_mw, margin_db).
+    """
+    target_saturation_power_mw = target_pout_mw * 10**(2.0 / 10.0)  # 2dB above target Pout
+    
+    # Psat is quadratic in J at fixed wavelength and temperature: expand it once, then each
+    # bisection step is a handful of array operations over the wavelengths
+    c0, c1, c2 = soa.get_output_saturation_power_J_coefficients(wavelengths_nm, temp_c)
+    c0_ln = c0 * (math.log(10.0) / 10.0)
+    c1_ln = c1 * (math.log(10.0) / 10.0)
+    c2_ln = c2 * (math.log(10.0) / 10.0)
+    
+    n = len(wavelengths_nm)
+    
+    def avg_saturation_power_mw(j_kA_cm2):
+        d_J = j_kA_cm2 - 4.571
+        return float(np.exp(c0_ln + d_J * (c1_ln + c2_ln * d_J)).sum()) / n
+    
+    j_min = 1.0  # kA/cm²
+    j_max = 15.0  # kA/cm²
+    j_opt = None
+    for _ in range(25):  # Max 25 iterations
+        j_test = (j_min + j_max) / 2
+        avg_sat_mw = avg_saturation_power_mw(j_test)
+        if avg_sat_mw >= target_saturation_power_mw:
+            j_opt = j_test
+            j_max = j_test
+        else:
+            j_min = j_test
+        if j_max - j_min < 0.005:  # Tighter convergence threshold
+            break
+    
+    # If we didn't find a solution within the range, use the maximum
+    if j_opt is None:
+        j_opt = j_max
+        avg_sat_mw = avg_saturation_power_mw(j_opt)
+    
+    current_ma = soa.calculate_current_mA_from_J(j_opt)
+    return j_opt, current_ma, avg_sat_mw, 10 * math.log10(avg_sat_mw / target_pout_mw)
+
 class Guide3A:
     """
     Represents a Europa Photonic Integrated Circuit (PIC) with enhanced Guide3A functionality.
@@ -15,6 +59,10 @@ class Guide3A:
     # Supported fiber input types
     SUPPORTED_FIBER_TYPES = ['pm', 'sm']
     
+    # Parameters that determine the module configuration and cannot be updated in place
+    STRUCTURAL_PARAMETERS = ['pic_architecture', 'fiber_input_type', 'num_fibers',
+                             'soa_width_um', 'soa_active_length_um']
+    
     def __init__(self, pic_architecture: str, fiber_input_type: str = 'pm', num_fibers: int = 40, **kwargs):
         """
         Initialize Guide3A with specified architecture and module configuration.
@@ -167,6 +215,32 @@ class Guide3A:
         if not (0 <= self.digital_core_efficiency <= 100):
             raise ValueError(f"Digital core efficiency must be between 0 and 100%: {self.digital_core_efficiency}")
     
+    def update_parameters(self, **kwargs):
+        """
+        Update loss, performance and module parameters in place and re-validate.
+        An update that fails validation leaves the instance unchanged.
+        
+        The architecture, fiber type, fiber count and SOA geometry fix the module
+        configuration and need a new instance.
+        
+        Args:
+            **kwargs: Parameter values keyed by attribute name (io_in_loss, target_pout, etc.)
+        """
+        for name in kwargs:
+            if name in self.STRUCTURAL_PARAMETERS or not hasattr(self, name):
+                raise ValueError(f"Cannot update parameter in place: {name}")
+        
+        # Restore the previous values if the update does not validate
+        previous = {name: getattr(self, name) for name in kwargs}
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+        try:
+            self._validate_parameters()
+        except ValueError:
+            for name, value in previous.items():
+                setattr(self, name, value)
+            raise
+    
     def get_total_loss(self):
         """
         Calculate total loss for the PIC architecture.
@@ -699,66 +773,22 @@ Performance Metrics:
             verbose=False
         )
         
+        wavelengths_nm = np.asarray(wavelengths, dtype=float)
+        
         def find_optimum_current_density(target_pout_db: float, case_name: str):
             """Find optimum current density for a given target Pout"""
-            # Target Pout in mW
             target_pout_mw = 10**(target_pout_db / 10.0)
-            
-            # Target saturation power (2dB above target Pout)
-            target_saturation_power_mw = target_pout_mw * 10**(2.0 / 10.0)  # 2dB above target Pout
-            
-            # Binary search for optimum current density
-            j_min = 1.0  # kA/cm²
-            j_max = 15.0  # kA/cm² (increased from 10.0)
-            j_opt = None
-            
-            for _ in range(25):  # Max 25 iterations
-                j_test = (j_min + j_max) / 2
-                
-                # Calculate average saturation power across all wavelengths
-                saturation_powers = []
-                for wavelength in wavelengths:
-                    saturation_power_dbm = soa.get_output_saturation_power_dBm(
-                        wavelength, j_test, self.soa_temperature_c
-                    )
-                    saturation_power_mw = 10**(saturation_power_dbm / 10.0)
-                    saturation_powers.append(saturation_power_mw)
-                
-                avg_saturation_power_mw = sum(saturation_powers) / len(saturation_powers)
-                
-                if avg_saturation_power_mw >= target_saturation_power_mw:
-                    j_opt = j_test
-                    j_max = j_test
-                else:
-                    j_min = j_test
-                
-                if j_max - j_min < 0.005:  # Tighter convergence threshold
-                    break
-            
-            # If we didn't find a solution within the range, use the maximum
-            if j_opt is None:
-                j_opt = j_max
-                # Recalculate with maximum current density
-                saturation_powers = []
-                for wavelength in wavelengths:
-                    saturation_power_dbm = soa.get_output_saturation_power_dBm(
-                        wavelength, j_opt, self.soa_temperature_c
-                    )
-                    saturation_power_mw = 10**(saturation_power_dbm / 10.0)
-                    saturation_powers.append(saturation_power_mw)
-                avg_saturation_power_mw = sum(saturation_powers) / len(saturation_powers)
-            
-            # Calculate corresponding current
-            current_ma = soa.calculate_current_mA_from_J(j_opt)
+            j_opt, current_ma, avg_saturation_power_mw, margin_db = _optimum_current_kernel(
+                soa, wavelengths_nm, self.soa_temperature_c, target_pout_mw)
             
             return {
                 'current_density_kA_cm2': j_opt,
                 'current_ma': current_ma,
                 'target_pout_db': target_pout_db,
-                'target_saturation_power_mw': target_saturation_power_mw,
+                'target_saturation_power_mw': target_pout_mw * 10**(2.0 / 10.0),
                 'avg_saturation_power_mw': avg_saturation_power_mw,
                 'avg_saturation_power_db': 10 * math.log10(avg_saturation_power_mw),
-                'margin_db': 10 * math.log10(avg_saturation_power_mw / target_pout_mw)
+                'margin_db': margin_db
             }
         
         # Calculate for median case
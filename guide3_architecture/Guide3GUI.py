@@ -1,14 +1,259 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from EuropaSOA import EuropaSOA
+from Guide3A import Guide3A
 import math
+import re
+import copy
+import functools
 import yaml
 import os
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
+# Use the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# dBm -> mW as exp(dBm * ln(10) / 10), avoiding the generic float power path
+_LN10_OVER_10 = math.log(10.0) / 10.0
+
+# Plain decimal or scientific number, checked before float() so bad entries skip the exception path
+_NUMBER_RE = re.compile(r'\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*')
+
+def _parse_or_nan(text):
+    """float(text), or NaN when the entry is not a plain number"""
+    return float(text) if _NUMBER_RE.fullmatch(text) else math.nan
+
+# Row templates for the per-wavelength SOA table
+_ROW_FMT = "{wl:<12.2f} {ug:<12.2f} {sp:<12.2f} {pin:<12.2f} {sg:<12.2f} {wpe:<8.2f}\n"
+_NA_ROW_FMT = "{wl:<12.2f} {ug:<12.2f} {sp:<12.2f} {na:<12} {na:<12} {na:<8}\n"
+
+# (x, y) axis titles for each plot type
+_PLOT_AXIS_TITLES = {
+    'wpe_vs_length': ("Active Length (µm)", "Wall Plug Efficiency (%)"),
+    'gain_vs_length': ("Active Length (µm)", "Gain (dB)"),
+    'pin_vs_length': ("Active Length (µm)", "Required P_in (dBm)"),
+    'wpe_vs_wavelength': ("Wavelength (nm)", "Wall Plug Efficiency (%)"),
+    'gain_vs_wavelength': ("Wavelength (nm)", "Gain (dB)"),
+    'pin_vs_wavelength': ("Wavelength (nm)", "Required P_in (dBm)"),
+    'saturation_vs_wavelength': ("Wavelength (nm)", "Saturation Power (dBm)")
+}
+
+# Wheel event sequences routed to the canvas under the pointer
+_WHEEL_SEQUENCES = ("<MouseWheel>", "<Button-4>", "<Button-5>",
+                    "<Shift-MouseWheel>", "<Shift-Button-4>", "<Shift-Button-5>")
+
+# Checkbox label and subplot title of each plot type, e.g. 'Wpe Vs Length'
+_PLOT_DISPLAY_NAMES = {plot_name: plot_name.replace('_', ' ').title() for plot_name in _PLOT_AXIS_TITLES}
+
+# Info message shown after Guide3A results are copied into the EuropaSOA tab
+_SOA_UPDATE_MSG_TEMPLATE = """EuropaSOA target Pout and current density values updated:
+Median: {median_pout:.2f} dBm, {median_j:.2f} kA/cm²
+3σ: {sigma}"""
+
+# Per-case sections of the Guide3A report, shared by the median and 3σ cases
+_GUIDE3A_TARGET_POUT_TEMPLATE = """Target Pout Calculation for SOA:
+- Base Target Pout: {base_target_pout_db:.2f} dBm
+- SOA Penalty: {soa_penalty_db:.1f} dB
+- Wavelength Penalty (10*log10({num_wavelengths})): {wavelength_penalty_db:.2f} dB
+- Loss from SOA to Output: {soa_to_output_loss_db:.2f} dB
+- Target Pout of SOA: {soa_output_requirement_db:.2f} dBm
+  (Calculated as: Base Target Pout + SOA Penalty + Wavelength Penalty + Loss from SOA to Output)
+
+"""
+_GUIDE3A_SOA_CURRENT_TEMPLATE = """SOA Current Analysis:
+- Target Pout of SOA: {soa_output_requirement_db:.2f} dBm
+- Optimum Current Density: {current_density_kA_cm2:.2f} kA/cm²
+- Optimum Current: {current_ma:.1f} mA
+- Target Saturation Power: {target_saturation_power_mw:.2f} mW (2dB above target Pout)
+- Average Saturation Power: {avg_saturation_power_mw:.2f} mW ({avg_saturation_power_db:.2f} dBm)
+- Power Margin: {margin_db:.2f} dB
+
+PIC Performance:
+"""
+_GUIDE3A_PIC_POWER_TEMPLATE = """- SOA Current: {current_ma:.1f} mA
+- Operating Voltage: {operating_voltage_v:.2f} V
+- Electrical Power per SOA: {electrical_power_mw:.1f} mW
+- SOAs per PIC: {soas_per_pic}
+- Total PIC Power Consumption: {total_pic_power_mw:.1f} mW ({total_pic_power_w:.3f} W)
+"""
+_GUIDE3A_PIC_EFFICIENCY_TEMPLATE = """- Target Pout per Fiber: {target_pout_mw:.3f} mW
+- Total Optical Power: {total_optical_power_mw:.1f} mW
+- PIC Efficiency: {pic_efficiency_percent:.2f}%
+- Heat Load: {heat_load_w:.3f} W
+"""
+_GUIDE3A_MODULE_TEMPLATE = """- Digital Core Power: {digital_core_power_w:.3f} W
+- Analog Core Power: {analog_core_power_w:.3f} W
+- Thermal Power: {thermal_power_w:.3f} W
+- Total Module Power: {total_module_power_w:.3f} W
+- Total Optical Power: {total_optical_power_w:.3f} W
+- Module Efficiency: {module_efficiency_percent:.2f}%
+"""
+
+@functools.lru_cache(maxsize=1)
+def _get_plotly():
+    """plotly.graph_objects and make_subplots, imported on the first plot rather than at startup"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    return go, make_subplots
+
+@functools.lru_cache(maxsize=32)
+def _format_component_count(items):
+    """Component Count lines of the Guide3A report for a tuple of (component, count) pairs"""
+    return "".join(f"- {component.replace('_', ' ').title()}: {count}\n" for component, count in items)
+
+# Default text of each numeric Guide3A input, keyed by Guide3A parameter name
+_GUIDE3A_INPUT_DEFAULTS = {
+    'operating_wavelength_nm': "1310",
+    'temperature_c': "40",
+    'io_in_loss': "1.5",
+    'io_out_loss': "1.5",
+    'connector_in_loss': "0.25",
+    'connector_out_loss': "0.25",
+    'wg_in_loss': "0.25",
+    'wg_out_loss': "0.25",
+    'tap_in_loss': "0.3",
+    'tap_out_loss': "0.3",
+    'psr_loss': "0.5",
+    'phase_shifter_loss': "0.5",
+    'coupler_loss': "0.2",
+    'target_pout': "-3.3",
+    'target_pout_3sigma': "-0.3",
+    'soa_penalty': "2",
+    'soa_penalty_3sigma': "2",
+    'idac_voltage_overhead': "0.4",
+    'ir_drop_nominal': "0.1",
+    'ir_drop_3sigma': "0.2",
+    'vrm_efficiency': "80",
+    'tec_cop_nominal': "4",
+    'tec_cop_3sigma': "2",
+    'tec_power_efficiency': "80",
+    'driver_peripherals_power': "1.0",
+    'mcu_power': "0.5",
+    'misc_power': "0.25",
+    'digital_core_efficiency': "80",
+}
+
+# (parameter name, label) of the Guide3A inputs laid out as a plain label/entry column
+_GUIDE3A_LINK_FIELDS = (
+    ('target_pout', "Target Pout [dBm] [-10 to 20]:"),
+    ('target_pout_3sigma', "Target Pout 3σ [dBm] [-10 to 20]:"),
+    ('soa_penalty', "Penalty due to SOA in dB:"),
+    ('soa_penalty_3sigma', "Penalty due to SOA 3σ in dB:"),
+)
+
+_GUIDE3A_SPEC_SECTIONS = (
+    ("Analog Specifications", (
+        ('idac_voltage_overhead', "IDAC Voltage Overhead (V):"),
+        ('ir_drop_nominal', "IR Drop - Nominal (V):"),
+        ('ir_drop_3sigma', "IR Drop - 3σ (V):"),
+        ('vrm_efficiency', "Analog Supply Efficiency (%):"),
+    )),
+    ("Digital Specifications", (
+        ('driver_peripherals_power', "Driver Peripherals Power (W):"),
+        ('mcu_power', "MCU Power Consumption (W):"),
+        ('misc_power', "MISC Power Consumption (W):"),
+        ('digital_core_efficiency', "Digital Supply Efficiency (%):"),
+    )),
+    ("Thermal Specifications", (
+        ('tec_cop_nominal', "TEC COP - Nominal:"),
+        ('tec_cop_3sigma', "TEC COP - 3σ:"),
+        ('tec_power_efficiency', "TEC Supply Efficiency (%):"),
+    )),
+)
+
+# Configuration-file key of each Guide3A input saved with the configuration; the tap losses are not saved
+_GUIDE3A_CONFIG_KEYS = {
+    'operating_wavelength_nm': 'operating_wavelength',
+    'temperature_c': 'temperature',
+    'io_in_loss': 'io_in_loss',
+    'io_out_loss': 'io_out_loss',
+    'connector_in_loss': 'connector_in_loss',
+    'connector_out_loss': 'connector_out_loss',
+    'wg_in_loss': 'wg_in_loss',
+    'wg_out_loss': 'wg_out_loss',
+    'psr_loss': 'psr_loss',
+    'phase_shifter_loss': 'phase_shifter_loss',
+    'coupler_loss': 'coupler_loss',
+    'target_pout': 'target_pout',
+    'target_pout_3sigma': 'target_pout_3sigma',
+    'soa_penalty': 'soa_penalty',
+    'soa_penalty_3sigma': 'soa_penalty_3sigma',
+    'idac_voltage_overhead': 'idac_voltage_overhead',
+    'ir_drop_nominal': 'ir_drop_nominal',
+    'ir_drop_3sigma': 'ir_drop_3sigma',
+    'vrm_efficiency': 'vrm_efficiency',
+    'tec_cop_nominal': 'tec_cop_nominal',
+    'tec_cop_3sigma': 'tec_cop_3sigma',
+    'tec_power_efficiency': 'tec_power_efficiency',
+    'driver_peripherals_power': 'driver_peripherals_power',
+    'mcu_power': 'mcu_power',
+    'misc_power': 'misc_power',
+    'digital_core_efficiency': 'digital_core_efficiency',
+}
+
+# Default configuration; each window takes its own copy, which Update Defaults then edits
+_DEFAULT_CONFIG = {
+    'device_parameters': {
+        'width_um': 2.0,
+        'active_length_um': 790
+    },
+    'operation_parameters': {
+        'pout_median_dbm': 9.23,
+        'pout_sigma_dbm': 12.23,
+        'j_density_median': 3.76,
+        'j_density_sigma': 7.15,
+        'temperature_c': 40
+    },
+    'wavelength_config': {
+        'num_wavelengths': 8,
+        'wavelengths': ["1301.47", "1303.73", "1306.01", "1308.28", "1310.57", "1312.87", "1315.17", "1317.48"]
+    },
+    'link_loss_modes': {
+        'median_loss': True,
+        'sigma_loss': True
+    },
+    'guide3a_parameters': {
+        'fiber_input_type': 'pm',
+        'pic_architecture': 'psrless',
+        'num_fibers': 40,
+        'operating_wavelength': 1310,
+        'temperature': 40,
+        'io_in_loss': 1.5,
+        'io_out_loss': 1.5,
+        'connector_in_loss': 0.25,
+        'connector_out_loss': 0.25,
+        'wg_in_loss': 0.25,
+        'wg_out_loss': 0.25,
+        'psr_loss': 0.5,
+        'phase_shifter_loss': 0.5,
+        'coupler_loss': 0.2,
+        'target_pout': -3.3,
+        'target_pout_3sigma': -0.3,
+        'soa_penalty': 2,
+        'soa_penalty_3sigma': 2,
+        'idac_voltage_overhead': 0.4,
+        'ir_drop_nominal': 0.1,
+        'ir_drop_3sigma': 0.2,
+        'vrm_efficiency': 80,
+        'tec_cop_nominal': 4,
+        'tec_cop_3sigma': 2,
+        'tec_power_efficiency': 80,
+        'driver_peripherals_power': 1.0,
+        'mcu_power': 0.5,
+        'misc_power': 0.25,
+        'digital_core_efficiency': 80
+    }
+}
+
 class Guide3GUI(tk.Tk):
+    # PIC architectures offered for each fiber input type
+    _PM_ARCHITECTURES = ("psrless",)
+    _SM_ARCHITECTURES = ("psr", "pol_control")
+
     def __init__(self):
         super().__init__()
         self.title("Guide3 GUI")
@@ -16,67 +261,69 @@ class Guide3GUI(tk.Tk):
         self.geometry("1500x1400")
         self.resizable(True, True)
         self.link_loss_modes = {"median-loss": tk.BooleanVar(), "3-sigma-loss": tk.BooleanVar()}
-        # Initialize default wavelengths
-        self.default_wavelengths = ["1301.47", "1303.73", "1306.01", "1308.28", "1310.57", "1312.87", "1315.17", "1317.48"]
-        
-        # Default configuration
-        self.default_config = {
-            'device_parameters': {
-                'width_um': 2.0,
-                'active_length_um': 790
-            },
-            'operation_parameters': {
-                'pout_median_dbm': 9.23,
-                'pout_sigma_dbm': 12.23,
-                'j_density_median': 3.76,
-                'j_density_sigma': 7.15,
-                'temperature_c': 40
-            },
-            'wavelength_config': {
-                'num_wavelengths': 8,
-                'wavelengths': self.default_wavelengths
-            },
-            'link_loss_modes': {
-                'median_loss': True,
-                'sigma_loss': True
-            },
-            'guide3a_parameters': {
-                'fiber_input_type': 'pm',
-                'pic_architecture': 'psrless',
-                'num_fibers': 40,
-                'operating_wavelength': 1310,
-                'temperature': 40,
-                'io_in_loss': 1.5,
-                'io_out_loss': 1.5,
-                'connector_in_loss': 0.25,
-                'connector_out_loss': 0.25,
-                'wg_in_loss': 0.25,
-                'wg_out_loss': 0.25,
-                'psr_loss': 0.5,
-                'phase_shifter_loss': 0.5,
-                'coupler_loss': 0.2,
-                'target_pout': -3.3,
-                'target_pout_3sigma': -0.3,
-                'soa_penalty': 2,
-                'soa_penalty_3sigma': 2,
-                'idac_voltage_overhead': 0.4,
-                'ir_drop_nominal': 0.1,
-                'ir_drop_3sigma': 0.2,
-                'vrm_efficiency': 80,
-                'tec_cop_nominal': 4,
-                'tec_cop_3sigma': 2,
-                'tec_power_efficiency': 80,
-                'driver_peripherals_power': 1.0,
-                'mcu_power': 0.5,
-                'misc_power': 0.25,
-                'digital_core_efficiency': 80
-            }
-        }
+        # Default configuration, with the default wavelengths sharing its wavelength list
+        self.default_config = copy.deepcopy(_DEFAULT_CONFIG)
+        self.default_wavelengths = self.default_config['wavelength_config']['wavelengths']
+        
+        # Plot sweeps run off the Tk thread so the window stays responsive
+        self._plot_executor = ThreadPoolExecutor(max_workers=1)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        # Last generated figure and its (plots, median, sigma) selection, reused when the selection repeats;
+        # only the Tk thread assigns these
+        self._plot_figure = None
+        self._plot_figure_key = None
+        # All plot inputs of the last figure; an unchanged click shows that figure again
+        self._plot_inputs_key = None
+        # Pending after() ids for the debounced fiber type and Use Guide3A Results handlers
+        self._pending_fiber_type_id = None
+        self._pending_update_id = None
+        # Pending after() ids for debounced Calculate clicks, keyed by the calculation they run
+        self._pending_calc_ids = {}
+        # Fiber type the architecture combobox was last configured for
+        self._last_fiber_type = None
+        # Parsed config files as {path: ((st_mtime_ns, st_size), config)} for repeated Load Config clicks
+        self._config_file_cache = {}
+        # Wheel deltas not yet applied, keyed by (canvas, axis); flushed once the event queue drains
+        self._wheel_deltas = {}
+        # Canvases that scroll with the wheel, mapped to whether Shift+wheel scrolls them horizontally
+        self._wheel_canvases = {}
+        # Canvases whose scrollregion is due to be recomputed once the event queue drains, and the
+        # region last applied to each canvas
+        self._pending_scroll_regions = set()
+        self._scroll_regions = {}
+        # Numeric Guide3A inputs keyed by parameter name, filled by _guide3a_entry as the tab is built
+        self._guide3a_var_map = {}
         
         self._create_widgets()
-        
-        # Auto-calculate with default values
-        self.auto_calculate_defaults()
+        self._bind_wheel_dispatch()
+        
+        # Guide3A model shared by the SOA calculation and plots; rebuilt when the architecture, fiber
+        # type or fiber count changes, while numeric inputs are marked dirty and applied in place
+        self._guide3a = None
+        self._guide3a_dirty = set()
+        # Last SOA output and current density results of the shared instance as {calculation: (args, result)};
+        # dropped together with the instance and whenever a Guide3A input changes
+        self._guide3a_results = {}
+        for var in (self.fiber_input_type_var, self.num_fibers_var, self.guide3a_architecture_var):
+            var.trace_add("write", self._invalidate_guide3a)
+        # Parsed Guide3A floats; an entry is dropped when its variable is written and re-parsed on next use
+        self._guide3a_float_cache = {}
+        for name, var in self._guide3a_var_map.items():
+            var.trace_add("write", lambda *_, name=name: self._mark_guide3a_dirty(name))
+        
+        # Formatted SOA case reports keyed on their inputs; dropped whenever an SOA or Guide3A input changes
+        self._soa_result_cache = {}
+        for var in (self.w_um_var, self.l_active_var, self.temp_var,
+                    self.j_density_median_var, self.j_density_sigma_var, *self.wavelength_vars):
+            var.trace_add("write", self._clear_soa_result_cache)
+        
+        # (values, blank) arrays for all wavelength entries, parsed on first use after an entry changes
+        self._wavelength_array_cache = None
+        for var in self.wavelength_vars:
+            var.trace_add("write", self._clear_wavelength_array_cache)
+        
+        # Auto-calculate with default values once the window has been drawn
+        self.after_idle(self.auto_calculate_defaults)
 
     def _create_widgets(self):
         # Main frame
@@ -126,23 +373,23 @@ class Guide3GUI(tk.Tk):
         ttk.Button(wavelength_control_frame, text="Save Wavelength Set", command=self.save_wavelength_set).pack(side=tk.LEFT, padx=(10, 0))
         
         # Individual wavelength inputs (grid layout: 4 rows x 8 columns) - below the controls
-        self.wavelength_vars = []
+        # Defaults fill the first entries and the rest start blank
+        defaults = self.default_wavelengths[:32]
+        self.wavelength_vars = [tk.StringVar(value=value) for value in defaults + [""] * (32 - len(defaults))]
         self.wavelength_entries = []
         
         # Create a frame for the wavelength grid
         wavelength_grid_frame = ttk.Frame(wavelength_config_frame)
-        wavelength_grid_frame.pack(fill=tk.X)
         
-        for row in range(4):
-            for col in range(8):
-                wavelength_index = row * 8 + col
-                ttk.Label(wavelength_grid_frame, text=f"λ{wavelength_index+1}:").grid(row=row, column=col*2, padx=(0, 2), sticky='e')
-                wavelength_var = tk.StringVar(value=self.default_wavelengths[wavelength_index] if wavelength_index < len(self.default_wavelengths) else "")
-                wavelength_entry = ttk.Entry(wavelength_grid_frame, textvariable=wavelength_var, width=8)
-                wavelength_entry.grid(row=row, column=col*2+1, padx=(0, 5), sticky='w')
-                
-                self.wavelength_vars.append(wavelength_var)
-                self.wavelength_entries.append(wavelength_entry)
+        for wavelength_index, wavelength_var in enumerate(self.wavelength_vars):
+            row, col = divmod(wavelength_index, 8)
+            label = ttk.Label(wavelength_grid_frame, text=f"λ{wavelength_index+1}:")
+            label.grid(row=row, column=col*2, padx=(0, 2), sticky='e')
+            wavelength_entry = ttk.Entry(wavelength_grid_frame, textvariable=wavelength_var, width=8)
+            wavelength_entry.grid(row=row, column=col*2+1, padx=(0, 5), sticky='w')
+            self.wavelength_entries.append(wavelength_entry)
+        # Pack the grid once it is complete so its parent sees the final size in one pass
+        wavelength_grid_frame.pack(fill=tk.X)
 
         # Notebook for tabs (model-specific content)
         notebook = ttk.Notebook(main_frame)
@@ -155,64 +402,26 @@ class Guide3GUI(tk.Tk):
         # Create main frame for Guide3A
         guide3a_main_frame = ttk.Frame(self.guide3a_tab)
         guide3a_main_frame.pack(fill='both', expand=True, padx=10, pady=10)
+        # Inputs and results split 40/60; uniform keeps the columns in proportion to their weights
+        guide3a_main_frame.columnconfigure(0, weight=2, uniform='guide3a_split')
+        guide3a_main_frame.columnconfigure(1, weight=3, uniform='guide3a_split')
+        guide3a_main_frame.rowconfigure(0, weight=1)
         
         # Left side - Input parameters with scrolling (40% width)
         input_container = ttk.Frame(guide3a_main_frame)
-        input_container.place(relx=0, rely=0, relwidth=0.4, relheight=1.0)
+        input_container.grid(row=0, column=0, sticky='nsew')
         
-        # Create canvas with both scrollbars for input parameters
-        input_canvas = tk.Canvas(input_container)
-        input_v_scrollbar = ttk.Scrollbar(input_container, orient="vertical", command=input_canvas.yview)
-        input_h_scrollbar = ttk.Scrollbar(input_container, orient="horizontal", command=input_canvas.xview)
-        input_scrollable_frame = ttk.Frame(input_canvas)
-
-        # Function to update scroll region
-        def update_input_scroll_region(event=None):
-            input_canvas.configure(scrollregion=input_canvas.bbox("all"))
-
-        input_scrollable_frame.bind("<Configure>", update_input_scroll_region)
-
-        input_canvas.create_window((0, 0), window=input_scrollable_frame, anchor="nw")
-        input_canvas.configure(yscrollcommand=input_v_scrollbar.set, xscrollcommand=input_h_scrollbar.set)
-
-        # Function to handle canvas resize
-        def on_canvas_configure(event):
-            # Update the scrollable frame width to match canvas width
-            input_canvas.itemconfig(1, width=event.width)
-
-        input_canvas.bind("<Configure>", on_canvas_configure)
-
-        # Pack the canvas and scrollbars
-        input_canvas.pack(side="left", fill="both", expand=True)
-        input_v_scrollbar.pack(side="right", fill="y")
-        input_h_scrollbar.pack(side="bottom", fill="x")
-        
-        # Bind mouse wheel scrolling
-        input_canvas.bind_all("<MouseWheel>", lambda event: input_canvas.yview_scroll(int(-1*(event.delta/120)), "units"))
-        input_canvas.bind_all("<Shift-MouseWheel>", lambda event: input_canvas.xview_scroll(int(-1*(event.delta/120)), "units"))
+        # Scrollable inputs frame, kept as wide as the canvas
+        input_canvas, input_scrollable_frame = self._create_scrollable_inputs(input_container, fit_width=True)
         
-        # Bind scroll region updates to all child widgets
-        def bind_scroll_updates(widget):
-            widget.bind("<Configure>", update_input_scroll_region)
-            for child in widget.winfo_children():
-                bind_scroll_updates(child)
-
-        # Create 4 quadrants
+        # Two input columns: link and loss inputs, then the module specifications
         # Top-left quadrant
         top_left_frame = ttk.Frame(input_scrollable_frame)
         top_left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5), pady=(0, 5))
         
-        # Top-right quadrant
-        top_right_frame = ttk.Frame(input_scrollable_frame)
-        top_right_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0), pady=(0, 5))
-        
         # Bottom-left quadrant
         bottom_left_frame = ttk.Frame(input_scrollable_frame)
-        bottom_left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5), pady=(5, 0))
-        
-        # Bottom-right quadrant
-        bottom_right_frame = ttk.Frame(input_scrollable_frame)
-        bottom_right_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0), pady=(5, 0))
+        bottom_left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0), pady=(5, 0))
 
         # --- Module Configuration (Top-left) ---
         module_config_frame = ttk.LabelFrame(top_left_frame, text="Module Configuration", padding="10")
@@ -251,36 +460,14 @@ class Guide3GUI(tk.Tk):
         self.num_fibers_entry.pack(anchor='w', padx=5, pady=(0, 10))
 
         # Guide3A wavelength and temperature variables (hidden, used for calculations)
-        self.guide3a_wavelength_var = tk.StringVar(value="1310")
-        self.guide3a_temp_var = tk.StringVar(value="40")
+        for name in ('operating_wavelength_nm', 'temperature_c'):
+            self._guide3a_var_map[name] = tk.StringVar(value=_GUIDE3A_INPUT_DEFAULTS[name])
         
         # Link Requirements Frame (moved below Module Configuration)
         link_requirements_frame = ttk.LabelFrame(top_left_frame, text="Link requirement per λ", padding="10")
         link_requirements_frame.pack(fill=tk.X, pady=5)
         
-        # Target Pout
-        ttk.Label(link_requirements_frame, text="Target Pout [dBm] [-10 to 20]:").pack(pady=(5, 2), anchor='w')
-        self.guide3a_target_pout_var = tk.StringVar(value="-3.3")
-        self.guide3a_target_pout_entry = ttk.Entry(link_requirements_frame, textvariable=self.guide3a_target_pout_var, width=15)
-        self.guide3a_target_pout_entry.pack(anchor='w', padx=5)
-        
-        # Target Pout 3σ
-        ttk.Label(link_requirements_frame, text="Target Pout 3σ [dBm] [-10 to 20]:").pack(pady=(5, 2), anchor='w')
-        self.guide3a_target_pout_3sigma_var = tk.StringVar(value="-0.3")
-        self.guide3a_target_pout_3sigma_entry = ttk.Entry(link_requirements_frame, textvariable=self.guide3a_target_pout_3sigma_var, width=15)
-        self.guide3a_target_pout_3sigma_entry.pack(anchor='w', padx=5)
-        
-        # Penalty due to SOA
-        ttk.Label(link_requirements_frame, text="Penalty due to SOA in dB:").pack(pady=(5, 2), anchor='w')
-        self.guide3a_soa_penalty_var = tk.StringVar(value="2")
-        self.guide3a_soa_penalty_entry = ttk.Entry(link_requirements_frame, textvariable=self.guide3a_soa_penalty_var, width=15)
-        self.guide3a_soa_penalty_entry.pack(anchor='w', padx=5)
-        
-        # Penalty due to SOA 3σ
-        ttk.Label(link_requirements_frame, text="Penalty due to SOA 3σ in dB:").pack(pady=(5, 2), anchor='w')
-        self.guide3a_soa_penalty_3sigma_var = tk.StringVar(value="2")
-        self.guide3a_soa_penalty_3sigma_entry = ttk.Entry(link_requirements_frame, textvariable=self.guide3a_soa_penalty_3sigma_var, width=15)
-        self.guide3a_soa_penalty_3sigma_entry.pack(anchor='w', padx=5)
+        self._guide3a_fields(link_requirements_frame, _GUIDE3A_LINK_FIELDS)
         
         # Loss Components Frame (moved below Link Requirements)
         loss_components_frame = ttk.LabelFrame(top_left_frame, text="Loss Components (dB)", padding="10")
@@ -291,159 +478,62 @@ class Guide3GUI(tk.Tk):
         io_loss_frame.pack(fill=tk.X, pady=2)
         
         ttk.Label(io_loss_frame, text="Input Loss:").pack(pady=(2, 0), anchor='w')
-        self.guide3a_io_in_loss_var = tk.StringVar(value="1.5")
-        self.guide3a_io_in_loss_entry = ttk.Entry(io_loss_frame, textvariable=self.guide3a_io_in_loss_var, width=15)
-        self.guide3a_io_in_loss_entry.pack(anchor='w', padx=5, pady=(0, 5))
+        self._guide3a_entry(io_loss_frame, 'io_in_loss', pady=(0, 5))
         
         ttk.Label(io_loss_frame, text="Output Loss:").pack(pady=(2, 0), anchor='w')
-        self.guide3a_io_out_loss_var = tk.StringVar(value="1.5")
-        self.guide3a_io_out_loss_entry = ttk.Entry(io_loss_frame, textvariable=self.guide3a_io_out_loss_var, width=15)
-        self.guide3a_io_out_loss_entry.pack(anchor='w', padx=5, pady=(0, 5))
+        self._guide3a_entry(io_loss_frame, 'io_out_loss', pady=(0, 5))
         
         # Connector Loss Group
         connector_loss_frame = ttk.LabelFrame(loss_components_frame, text="Connector Loss", padding="5")
         connector_loss_frame.pack(fill=tk.X, pady=2)
         
         ttk.Label(connector_loss_frame, text="Input Loss:").pack(pady=(2, 0), anchor='w')
-        self.guide3a_connector_in_loss_var = tk.StringVar(value="0.25")
-        self.guide3a_connector_in_loss_entry = ttk.Entry(connector_loss_frame, textvariable=self.guide3a_connector_in_loss_var, width=15)
-        self.guide3a_connector_in_loss_entry.pack(anchor='w', padx=5, pady=(0, 5))
+        self._guide3a_entry(connector_loss_frame, 'connector_in_loss', pady=(0, 5))
         
         ttk.Label(connector_loss_frame, text="Output Loss:").pack(pady=(2, 0), anchor='w')
-        self.guide3a_connector_out_loss_var = tk.StringVar(value="0.25")
-        self.guide3a_connector_out_loss_entry = ttk.Entry(connector_loss_frame, textvariable=self.guide3a_connector_out_loss_var, width=15)
-        self.guide3a_connector_out_loss_entry.pack(anchor='w', padx=5, pady=(0, 5))
+        self._guide3a_entry(connector_loss_frame, 'connector_out_loss', pady=(0, 5))
         
         # Waveguide Routing Loss Group
         waveguide_loss_frame = ttk.LabelFrame(loss_components_frame, text="Waveguide Routing Loss", padding="5")
         waveguide_loss_frame.pack(fill=tk.X, pady=2)
         
         ttk.Label(waveguide_loss_frame, text="Input Loss:").pack(pady=(2, 0), anchor='w')
-        self.guide3a_wg_in_loss_var = tk.StringVar(value="0.25")
-        self.guide3a_wg_in_loss_entry = ttk.Entry(waveguide_loss_frame, textvariable=self.guide3a_wg_in_loss_var, width=15)
-        self.guide3a_wg_in_loss_entry.pack(anchor='w', padx=5, pady=(0, 5))
+        self._guide3a_entry(waveguide_loss_frame, 'wg_in_loss', pady=(0, 5))
         
         ttk.Label(waveguide_loss_frame, text="Output Loss:").pack(pady=(2, 0), anchor='w')
-        self.guide3a_wg_out_loss_var = tk.StringVar(value="0.25")
-        self.guide3a_wg_out_loss_entry = ttk.Entry(waveguide_loss_frame, textvariable=self.guide3a_wg_out_loss_var, width=15)
-        self.guide3a_wg_out_loss_entry.pack(anchor='w', padx=5, pady=(0, 5))
+        self._guide3a_entry(waveguide_loss_frame, 'wg_out_loss', pady=(0, 5))
         
         # Tap Loss Group
         tap_loss_frame = ttk.LabelFrame(loss_components_frame, text="Tap Loss", padding="5")
         tap_loss_frame.pack(fill=tk.X, pady=2)
         
         ttk.Label(tap_loss_frame, text="Input Loss:").pack(pady=(2, 0), anchor='w')
-        self.guide3a_tap_in_loss_var = tk.StringVar(value="0.3")
-        self.guide3a_tap_in_loss_entry = ttk.Entry(tap_loss_frame, textvariable=self.guide3a_tap_in_loss_var, width=15)
-        self.guide3a_tap_in_loss_entry.pack(anchor='w', padx=5, pady=(0, 5))
+        self._guide3a_entry(tap_loss_frame, 'tap_in_loss', pady=(0, 5))
         
         ttk.Label(tap_loss_frame, text="Output Loss:").pack(pady=(2, 0), anchor='w')
-        self.guide3a_tap_out_loss_var = tk.StringVar(value="0.3")
-        self.guide3a_tap_out_loss_entry = ttk.Entry(tap_loss_frame, textvariable=self.guide3a_tap_out_loss_var, width=15)
-        self.guide3a_tap_out_loss_entry.pack(anchor='w', padx=5, pady=(0, 5))
+        self._guide3a_entry(tap_loss_frame, 'tap_out_loss', pady=(0, 5))
         
         # PSR Loss
         ttk.Label(loss_components_frame, text="PSR Loss:").pack(pady=(5, 2), anchor='w')
-        self.guide3a_psr_loss_var = tk.StringVar(value="0.5")
-        self.guide3a_psr_loss_entry = ttk.Entry(loss_components_frame, textvariable=self.guide3a_psr_loss_var, width=15)
-        self.guide3a_psr_loss_entry.pack(anchor='w', padx=5)
+        self.guide3a_psr_loss_entry = self._guide3a_entry(loss_components_frame, 'psr_loss')
         
         # Phase Shifter Loss
         ttk.Label(loss_components_frame, text="Phase Shifter Loss:").pack(pady=(5, 2), anchor='w')
-        self.guide3a_phase_shifter_loss_var = tk.StringVar(value="0.5")
-        self.guide3a_phase_shifter_entry = ttk.Entry(loss_components_frame, textvariable=self.guide3a_phase_shifter_loss_var, width=15)
-        self.guide3a_phase_shifter_entry.pack(anchor='w', padx=5)
+        self.guide3a_phase_shifter_entry = self._guide3a_entry(loss_components_frame, 'phase_shifter_loss')
         
         # Coupler Loss
         ttk.Label(loss_components_frame, text="Coupler Loss:").pack(pady=(5, 2), anchor='w')
-        self.guide3a_coupler_loss_var = tk.StringVar(value="0.2")
-        self.guide3a_coupler_loss_entry = ttk.Entry(loss_components_frame, textvariable=self.guide3a_coupler_loss_var, width=15)
-        self.guide3a_coupler_loss_entry.pack(anchor='w', padx=5)
-        
-        # Analog Specifications Frame (Bottom-left quadrant)
-        analog_specs_frame = ttk.LabelFrame(bottom_left_frame, text="Analog Specifications", padding="10")
-        analog_specs_frame.pack(fill=tk.X, pady=5)
-        
-        # IDAC Voltage Overhead
-        ttk.Label(analog_specs_frame, text="IDAC Voltage Overhead (V):").pack(pady=(5, 2), anchor='w')
-        self.guide3a_idac_voltage_overhead_var = tk.StringVar(value="0.4")
-        self.guide3a_idac_voltage_overhead_entry = ttk.Entry(analog_specs_frame, textvariable=self.guide3a_idac_voltage_overhead_var, width=15)
-        self.guide3a_idac_voltage_overhead_entry.pack(anchor='w', padx=5)
-        
-        # IR Drop - Nominal
-        ttk.Label(analog_specs_frame, text="IR Drop - Nominal (V):").pack(pady=(5, 2), anchor='w')
-        self.guide3a_ir_drop_nominal_var = tk.StringVar(value="0.1")
-        self.guide3a_ir_drop_nominal_entry = ttk.Entry(analog_specs_frame, textvariable=self.guide3a_ir_drop_nominal_var, width=15)
-        self.guide3a_ir_drop_nominal_entry.pack(anchor='w', padx=5)
-        
-        # IR Drop - 3σ
-        ttk.Label(analog_specs_frame, text="IR Drop - 3σ (V):").pack(pady=(5, 2), anchor='w')
-        self.guide3a_ir_drop_3sigma_var = tk.StringVar(value="0.2")
-        self.guide3a_ir_drop_3sigma_entry = ttk.Entry(analog_specs_frame, textvariable=self.guide3a_ir_drop_3sigma_var, width=15)
-        self.guide3a_ir_drop_3sigma_entry.pack(anchor='w', padx=5)
-        
-        # Analog Supply Efficiency
-        ttk.Label(analog_specs_frame, text="Analog Supply Efficiency (%):").pack(pady=(5, 2), anchor='w')
-        self.guide3a_vrm_efficiency_var = tk.StringVar(value="80")
-        self.guide3a_vrm_efficiency_entry = ttk.Entry(analog_specs_frame, textvariable=self.guide3a_vrm_efficiency_var, width=15)
-        self.guide3a_vrm_efficiency_entry.pack(anchor='w', padx=5)
-        
-        # Digital Specifications Frame
-        digital_specs_frame = ttk.LabelFrame(bottom_left_frame, text="Digital Specifications", padding="10")
-        digital_specs_frame.pack(fill=tk.X, pady=5)
-        
-        # Driver Peripherals Power Consumption
-        ttk.Label(digital_specs_frame, text="Driver Peripherals Power (W):").pack(pady=(5, 2), anchor='w')
-        self.guide3a_driver_peripherals_power_var = tk.StringVar(value="1.0")
-        self.guide3a_driver_peripherals_power_entry = ttk.Entry(digital_specs_frame, textvariable=self.guide3a_driver_peripherals_power_var, width=15)
-        self.guide3a_driver_peripherals_power_entry.pack(anchor='w', padx=5)
-        
-        # MCU Power Consumption
-        ttk.Label(digital_specs_frame, text="MCU Power Consumption (W):").pack(pady=(5, 2), anchor='w')
-        self.guide3a_mcu_power_var = tk.StringVar(value="0.5")
-        self.guide3a_mcu_power_entry = ttk.Entry(digital_specs_frame, textvariable=self.guide3a_mcu_power_var, width=15)
-        self.guide3a_mcu_power_entry.pack(anchor='w', padx=5)
-        
-        # MISC Power Consumption
-        ttk.Label(digital_specs_frame, text="MISC Power Consumption (W):").pack(pady=(5, 2), anchor='w')
-        self.guide3a_misc_power_var = tk.StringVar(value="0.25")
-        self.guide3a_misc_power_entry = ttk.Entry(digital_specs_frame, textvariable=self.guide3a_misc_power_var, width=15)
-        self.guide3a_misc_power_entry.pack(anchor='w', padx=5)
-        
-        # Digital Supply Efficiency
-        ttk.Label(digital_specs_frame, text="Digital Supply Efficiency (%):").pack(pady=(5, 2), anchor='w')
-        self.guide3a_digital_core_efficiency_var = tk.StringVar(value="80")
-        self.guide3a_digital_core_efficiency_entry = ttk.Entry(digital_specs_frame, textvariable=self.guide3a_digital_core_efficiency_var, width=15)
-        self.guide3a_digital_core_efficiency_entry.pack(anchor='w', padx=5)
-        
-        # Thermal Specifications Frame
-        thermal_specs_frame = ttk.LabelFrame(bottom_left_frame, text="Thermal Specifications", padding="10")
-        thermal_specs_frame.pack(fill=tk.X, pady=5)
-        
-        # TEC COP - Nominal
-        ttk.Label(thermal_specs_frame, text="TEC COP - Nominal:").pack(pady=(5, 2), anchor='w')
-        self.guide3a_tec_cop_nominal_var = tk.StringVar(value="4")
-        self.guide3a_tec_cop_nominal_entry = ttk.Entry(thermal_specs_frame, textvariable=self.guide3a_tec_cop_nominal_var, width=15)
-        self.guide3a_tec_cop_nominal_entry.pack(anchor='w', padx=5)
-        
-        # TEC COP - 3σ
-        ttk.Label(thermal_specs_frame, text="TEC COP - 3σ:").pack(pady=(5, 2), anchor='w')
-        self.guide3a_tec_cop_3sigma_var = tk.StringVar(value="2")
-        self.guide3a_tec_cop_3sigma_entry = ttk.Entry(thermal_specs_frame, textvariable=self.guide3a_tec_cop_3sigma_var, width=15)
-        self.guide3a_tec_cop_3sigma_entry.pack(anchor='w', padx=5)
-        
-        # TEC Supply Efficiency
-        ttk.Label(thermal_specs_frame, text="TEC Supply Efficiency (%):").pack(pady=(5, 2), anchor='w')
-        self.guide3a_tec_power_efficiency_var = tk.StringVar(value="80")
-        self.guide3a_tec_power_efficiency_entry = ttk.Entry(thermal_specs_frame, textvariable=self.guide3a_tec_power_efficiency_var, width=15)
-        self.guide3a_tec_power_efficiency_entry.pack(anchor='w', padx=5)
-        
-        # Bind scroll updates to all input widgets for proper vertical scrolling
-        bind_scroll_updates(input_scrollable_frame)
+        self.guide3a_coupler_loss_entry = self._guide3a_entry(loss_components_frame, 'coupler_loss')
+        
+        # Analog, Digital and Thermal Specifications Frames (Bottom-left quadrant)
+        for title, fields in _GUIDE3A_SPEC_SECTIONS:
+            specs_frame = ttk.LabelFrame(bottom_left_frame, text=title, padding="10")
+            specs_frame.pack(fill=tk.X, pady=5)
+            self._guide3a_fields(specs_frame, fields)
         
         # Update scroll region after all widgets are created
         input_canvas.update_idletasks()
-        update_input_scroll_region()
+        self._update_scroll_region(input_canvas)
         
         # Initialize field states for default PM fiber type
         self._update_architecture_dependent_fields()
@@ -452,12 +542,13 @@ class Guide3GUI(tk.Tk):
         
         # Right side - Results Display (60% width)
         guide3a_results_frame = ttk.LabelFrame(guide3a_main_frame, text="Guide3A Results", padding="10")
-        guide3a_results_frame.place(relx=0.4, rely=0, relwidth=0.6, relheight=1.0)
+        guide3a_results_frame.grid(row=0, column=1, sticky='nsew')
         
         # Action buttons at the top of results section
         action_frame = ttk.Frame(guide3a_results_frame)
         action_frame.pack(fill=tk.X, pady=(0, 10))
-        ttk.Button(action_frame, text="Calculate", command=self.calculate_guide3a).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(action_frame, text="Calculate",
+                   command=lambda: self._schedule_calculation(self.calculate_guide3a)).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(action_frame, text="Reset", command=self.reset_guide3a).pack(side=tk.LEFT, padx=5)
         ttk.Button(action_frame, text="Transfer to EuropaSOA", command=self.transfer_to_europasoa).pack(side=tk.LEFT, padx=5)
         
@@ -469,63 +560,29 @@ class Guide3GUI(tk.Tk):
         median_results_frame = ttk.LabelFrame(results_split_frame, text="Median Loss Case", padding="5")
         median_results_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
-        # Create canvas with scrollbars for median results
-        guide3a_median_canvas = tk.Canvas(median_results_frame)
-        guide3a_median_v_scrollbar = ttk.Scrollbar(median_results_frame, orient="vertical", command=guide3a_median_canvas.yview)
+        # Median results text scrolls itself
+        guide3a_median_v_scrollbar = ttk.Scrollbar(median_results_frame, orient="vertical")
+        self.guide3a_median_results_text = tk.Text(median_results_frame, wrap=tk.WORD, height=40,
+                                                   yscrollcommand=guide3a_median_v_scrollbar.set)
+        guide3a_median_v_scrollbar.config(command=self.guide3a_median_results_text.yview)
         
-        self.guide3a_median_results_text = tk.Text(guide3a_median_canvas, wrap=tk.WORD, height=40)
-        self.guide3a_median_results_text.configure(yscrollcommand=guide3a_median_v_scrollbar.set)
-        
-        guide3a_median_canvas.create_window((0, 0), window=self.guide3a_median_results_text, anchor="nw")
-        guide3a_median_canvas.configure(yscrollcommand=guide3a_median_v_scrollbar.set)
-        
-        # Pack the canvas and scrollbars
-        guide3a_median_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Pack the text and scrollbar
+        self.guide3a_median_results_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         guide3a_median_v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Right side - 3σ Case Results
         sigma_results_frame = ttk.LabelFrame(results_split_frame, text="3σ Loss Case", padding="5")
         sigma_results_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
         
-        # Create canvas with scrollbars for sigma results
-        guide3a_sigma_canvas = tk.Canvas(sigma_results_frame)
-        guide3a_sigma_v_scrollbar = ttk.Scrollbar(sigma_results_frame, orient="vertical", command=guide3a_sigma_canvas.yview)
-        
-        self.guide3a_sigma_results_text = tk.Text(guide3a_sigma_canvas, wrap=tk.WORD, height=40)
-        self.guide3a_sigma_results_text.configure(yscrollcommand=guide3a_sigma_v_scrollbar.set)
-        
-        guide3a_sigma_canvas.create_window((0, 0), window=self.guide3a_sigma_results_text, anchor="nw")
-        guide3a_sigma_canvas.configure(yscrollcommand=guide3a_sigma_v_scrollbar.set)
+        # Sigma results text scrolls itself
+        guide3a_sigma_v_scrollbar = ttk.Scrollbar(sigma_results_frame, orient="vertical")
+        self.guide3a_sigma_results_text = tk.Text(sigma_results_frame, wrap=tk.WORD, height=40,
+                                                  yscrollcommand=guide3a_sigma_v_scrollbar.set)
+        guide3a_sigma_v_scrollbar.config(command=self.guide3a_sigma_results_text.yview)
         
-        # Pack the canvas and scrollbars
-        guide3a_sigma_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Pack the text and scrollbar
+        self.guide3a_sigma_results_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         guide3a_sigma_v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # Configure scroll regions when text content changes
-        def configure_guide3a_median_scroll_region(event):
-            guide3a_median_canvas.configure(scrollregion=guide3a_median_canvas.bbox("all"))
-        
-        def configure_guide3a_sigma_scroll_region(event):
-            guide3a_sigma_canvas.configure(scrollregion=guide3a_sigma_canvas.bbox("all"))
-        
-        def resize_guide3a_median_canvas(event):
-            # Update the text widget width and height to match canvas dimensions
-            guide3a_median_canvas.itemconfig(1, width=event.width-10, height=event.height-10)  # Subtract some padding
-        
-        def resize_guide3a_sigma_canvas(event):
-            # Update the text widget width and height to match canvas dimensions
-            guide3a_sigma_canvas.itemconfig(1, width=event.width-10, height=event.height-10)  # Subtract some padding
-        
-        # Create text windows
-        guide3a_median_canvas.create_window((0, 0), window=self.guide3a_median_results_text, anchor="nw")
-        guide3a_sigma_canvas.create_window((0, 0), window=self.guide3a_sigma_results_text, anchor="nw")
-        
-        # Bind resize events
-        guide3a_median_canvas.bind("<Configure>", resize_guide3a_median_canvas)
-        guide3a_sigma_canvas.bind("<Configure>", resize_guide3a_sigma_canvas)
-        
-        self.guide3a_median_results_text.bind("<Configure>", configure_guide3a_median_scroll_region)
-        self.guide3a_sigma_results_text.bind("<Configure>", configure_guide3a_sigma_scroll_region)
 
         # EuropaSOA Tab (second tab)
         self.soa_tab = ttk.Frame(notebook)
@@ -534,50 +591,21 @@ class Guide3GUI(tk.Tk):
         # Create main horizontal frame for inputs and results
         soa_main_frame = ttk.Frame(self.soa_tab)
         soa_main_frame.pack(fill='both', expand=True, padx=10, pady=10)
+        # Inputs and results split 20/80; uniform keeps the columns in proportion to their weights
+        soa_main_frame.columnconfigure(0, weight=1, uniform='soa_split')
+        soa_main_frame.columnconfigure(1, weight=4, uniform='soa_split')
+        soa_main_frame.rowconfigure(0, weight=1)
         
-        # Left side - Input parameters with scrolling
+        # Left side - Input parameters with scrolling (20% width)
         input_container = ttk.Frame(soa_main_frame)
-        input_container.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
+        input_container.grid(row=0, column=0, sticky='nsew', padx=(0, 10))
         
-        # Create canvas with both scrollbars for input parameters
-        input_canvas = tk.Canvas(input_container)
-        input_v_scrollbar = ttk.Scrollbar(input_container, orient="vertical", command=input_canvas.yview)
-        input_h_scrollbar = ttk.Scrollbar(input_container, orient="horizontal", command=input_canvas.xview)
-        input_scrollable_frame = ttk.Frame(input_canvas)
+        # Scrollable inputs frame
+        _, input_scrollable_frame = self._create_scrollable_inputs(input_container)
 
-        input_scrollable_frame.bind(
-            "<Configure>",
-            lambda e: input_canvas.configure(scrollregion=input_canvas.bbox("all"))
-        )
-
-        input_canvas.create_window((0, 0), window=input_scrollable_frame, anchor="nw")
-        input_canvas.configure(yscrollcommand=input_v_scrollbar.set, xscrollcommand=input_h_scrollbar.set)
-
-        # Pack the canvas and scrollbars
-        input_canvas.pack(side="left", fill="both", expand=True)
-        input_v_scrollbar.pack(side="right", fill="y")
-        input_h_scrollbar.pack(side="bottom", fill="x")
-        
-        # Bind mouse wheel scrolling
-        input_canvas.bind_all("<MouseWheel>", lambda event: input_canvas.yview_scroll(int(-1*(event.delta/120)), "units"))
-        input_canvas.bind_all("<Shift-MouseWheel>", lambda event: input_canvas.xview_scroll(int(-1*(event.delta/120)), "units"))
-
-        # Create 4 quadrants
-        # Top-left quadrant
+        # Single input column
         top_left_frame = ttk.Frame(input_scrollable_frame)
         top_left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5), pady=(0, 5))
-        
-        # Top-right quadrant
-        top_right_frame = ttk.Frame(input_scrollable_frame)
-        top_right_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0), pady=(0, 5))
-        
-        # Bottom-left quadrant
-        bottom_left_frame = ttk.Frame(input_scrollable_frame)
-        bottom_left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5), pady=(5, 0))
-        
-        # Bottom-right quadrant
-        bottom_right_frame = ttk.Frame(input_scrollable_frame)
-        bottom_right_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0), pady=(5, 0))
 
         # --- Device Parameters (Top-left) ---
         device_frame = ttk.LabelFrame(top_left_frame, text="Device Parameters", padding="10")
@@ -636,17 +664,16 @@ class Guide3GUI(tk.Tk):
 
         # Wavelength configuration moved to common section at top
 
-        # Right side - Results Display
+        # Right side - Results Display (80% width)
         results_frame = ttk.LabelFrame(soa_main_frame, text="Results", padding="10")
-        results_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
-        results_frame.pack_configure(expand=True, fill=tk.BOTH)
-        results_frame.place(relx=0.2, rely=0, relwidth=0.8, relheight=1.0)
+        results_frame.grid(row=0, column=1, sticky='nsew')
         
         # Action buttons at the top of results section
         action_frame = ttk.Frame(results_frame)
         action_frame.pack(fill=tk.X, pady=(0, 10))
         
-        ttk.Button(action_frame, text="Calculate", command=self.calculate_soa).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(action_frame, text="Calculate",
+                   command=lambda: self._schedule_calculation(self.calculate_soa)).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(action_frame, text="Reset", command=self.reset_soa).pack(side=tk.LEFT, padx=5)
         ttk.Button(action_frame, text="Use Guide3A Results", command=self.use_guide3a_results).pack(side=tk.LEFT, padx=5)
         
@@ -654,36 +681,23 @@ class Guide3GUI(tk.Tk):
         plot_options_frame = ttk.LabelFrame(results_frame, text="Plot Options", padding="10")
         plot_options_frame.pack(fill=tk.X, pady=(0, 10))
         
-        # Create checkboxes for different plot types
-        self.plot_vars = {
-            'wpe_vs_length': tk.BooleanVar(),
-            'gain_vs_length': tk.BooleanVar(),
-            'pin_vs_length': tk.BooleanVar(),
-            'wpe_vs_wavelength': tk.BooleanVar(),
-            'gain_vs_wavelength': tk.BooleanVar(),
-            'pin_vs_wavelength': tk.BooleanVar(),
-            'saturation_vs_wavelength': tk.BooleanVar()
-        }
-        
-        # Set defaults
-        for var in self.plot_vars.values():
-            var.set(True)
-        
-        # Create checkboxes in a grid
-        row = 0
-        col = 0
-        for plot_name, var in self.plot_vars.items():
-            display_name = plot_name.replace('_', ' ').replace('vs', 'vs').title()
-            ttk.Checkbutton(plot_options_frame, text=display_name, variable=var).grid(
+        # Create checkboxes for different plot types, all selected by default
+        self.plot_vars = {plot_name: tk.BooleanVar(value=True) for plot_name in _PLOT_DISPLAY_NAMES}
+        
+        # Create checkboxes in a grid of 4 columns
+        for index, (plot_name, var) in enumerate(self.plot_vars.items()):
+            row, col = divmod(index, 4)
+            ttk.Checkbutton(plot_options_frame, text=_PLOT_DISPLAY_NAMES[plot_name], variable=var).grid(
                 row=row, column=col, sticky='w', padx=5, pady=2)
-            col += 1
-            if col > 3:  # 4 columns
-                col = 0
-                row += 1
         
         # Plot button - use grid instead of pack
-        ttk.Button(plot_options_frame, text="Generate Plots", command=self.generate_plots).grid(
-            row=row+1, column=0, columnspan=4, sticky='w', padx=5, pady=(10, 0))
+        self.generate_plots_button = ttk.Button(plot_options_frame, text="Generate Plots", command=self.generate_plots)
+        self.generate_plots_button.grid(row=row+1, column=0, sticky='w', padx=5, pady=(10, 0))
+        
+        # Progress indicator shown while the plot worker is busy
+        self.plot_progress = ttk.Progressbar(plot_options_frame, mode='indeterminate', length=150)
+        self.plot_progress.grid(row=row+1, column=1, columnspan=3, sticky='w', padx=5, pady=(10, 0))
+        self.plot_progress.grid_remove()
         
         # Create horizontal split for median and 3σ cases
         results_split_frame = ttk.Frame(results_frame)
@@ -693,65 +707,29 @@ class Guide3GUI(tk.Tk):
         median_results_frame = ttk.LabelFrame(results_split_frame, text="Median Loss Case", padding="5")
         median_results_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
-        # Create canvas with scrollbars for median results
-        median_canvas = tk.Canvas(median_results_frame)
-        median_v_scrollbar = ttk.Scrollbar(median_results_frame, orient="vertical", command=median_canvas.yview)
-        
-        self.median_results_text = tk.Text(median_canvas, wrap=tk.WORD, height=40)
-        self.median_results_text.configure(yscrollcommand=median_v_scrollbar.set)
-        
-        median_canvas.create_window((0, 0), window=self.median_results_text, anchor="nw")
-        median_canvas.configure(yscrollcommand=median_v_scrollbar.set)
+        # Median results text scrolls itself
+        median_v_scrollbar = ttk.Scrollbar(median_results_frame, orient="vertical")
+        self.median_results_text = tk.Text(median_results_frame, wrap=tk.WORD, height=40,
+                                           yscrollcommand=median_v_scrollbar.set)
+        median_v_scrollbar.config(command=self.median_results_text.yview)
         
-        # Pack the canvas and scrollbars
-        median_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Pack the text and scrollbar
+        self.median_results_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         median_v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Bind mouse wheel scrolling for median results
-        median_canvas.bind_all("<MouseWheel>", lambda event: median_canvas.yview_scroll(int(-1*(event.delta/120)), "units"))
-        
         # Right side - 3-Sigma Results
         sigma_results_frame = ttk.LabelFrame(results_split_frame, text="3σ Loss Case", padding="5")
         sigma_results_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
         
-        # Create canvas with scrollbars for sigma results
-        sigma_canvas = tk.Canvas(sigma_results_frame)
-        sigma_v_scrollbar = ttk.Scrollbar(sigma_results_frame, orient="vertical", command=sigma_canvas.yview)
-        
-        self.sigma_results_text = tk.Text(sigma_canvas, wrap=tk.WORD, height=40)
-        self.sigma_results_text.configure(yscrollcommand=sigma_v_scrollbar.set)
+        # Sigma results text scrolls itself
+        sigma_v_scrollbar = ttk.Scrollbar(sigma_results_frame, orient="vertical")
+        self.sigma_results_text = tk.Text(sigma_results_frame, wrap=tk.WORD, height=40,
+                                          yscrollcommand=sigma_v_scrollbar.set)
+        sigma_v_scrollbar.config(command=self.sigma_results_text.yview)
         
-        sigma_canvas.create_window((0, 0), window=self.sigma_results_text, anchor="nw")
-        sigma_canvas.configure(yscrollcommand=sigma_v_scrollbar.set)
-        
-        # Pack the canvas and scrollbars
-        sigma_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Pack the text and scrollbar
+        self.sigma_results_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         sigma_v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # Bind mouse wheel scrolling for sigma results
-        sigma_canvas.bind_all("<MouseWheel>", lambda event: sigma_canvas.yview_scroll(int(-1*(event.delta/120)), "units"))
-        
-        # Configure scroll regions when text content changes
-        def configure_soa_median_scroll_region(event):
-            median_canvas.configure(scrollregion=median_canvas.bbox("all"))
-        
-        def configure_soa_sigma_scroll_region(event):
-            sigma_canvas.configure(scrollregion=sigma_canvas.bbox("all"))
-        
-        def resize_soa_median_canvas(event):
-            # Update the text widget width to match canvas width
-            median_canvas.itemconfig(1, width=event.width-10)  # Subtract some padding
-        
-        def resize_soa_sigma_canvas(event):
-            # Update the text widget width to match canvas width
-            sigma_canvas.itemconfig(1, width=event.width-10)  # Subtract some padding
-        
-        # Bind resize events
-        median_canvas.bind("<Configure>", resize_soa_median_canvas)
-        sigma_canvas.bind("<Configure>", resize_soa_sigma_canvas)
-        
-        self.median_results_text.bind("<Configure>", configure_soa_median_scroll_region)
-        self.sigma_results_text.bind("<Configure>", configure_soa_sigma_scroll_region)
 
     def auto_calculate_defaults(self):
         """Automatically calculate and display results for default inputs"""
@@ -761,6 +739,18 @@ class Guide3GUI(tk.Tk):
         # Calculate SOA results and display them (second tab)
         self.calculate_soa()
 
+    def _schedule_calculation(self, calculate):
+        """Run a Calculate handler once, 150 ms after the last of a burst of clicks"""
+        pending_id = self._pending_calc_ids.get(calculate)
+        if pending_id is not None:
+            self.after_cancel(pending_id)
+        self._pending_calc_ids[calculate] = self.after(150, self._run_calculation, calculate)
+
+    def _run_calculation(self, calculate):
+        """Run a debounced Calculate handler"""
+        del self._pending_calc_ids[calculate]
+        calculate()
+
     def load_defaults(self):
         """Load the default configuration values"""
         try:
@@ -793,52 +783,8 @@ class Guide3GUI(tk.Tk):
                 self.fiber_input_type_var.set(self.default_config['guide3a_parameters']['fiber_input_type'])
                 self.guide3a_architecture_var.set(self.default_config['guide3a_parameters']['pic_architecture'])
                 self.num_fibers_var.set(str(self.default_config['guide3a_parameters']['num_fibers']))
-                self.guide3a_wavelength_var.set(str(self.default_config['guide3a_parameters']['operating_wavelength']))
-                self.guide3a_temp_var.set(str(self.default_config['guide3a_parameters']['temperature']))
-                self.guide3a_io_in_loss_var.set(str(self.default_config['guide3a_parameters']['io_in_loss']))
-                self.guide3a_io_out_loss_var.set(str(self.default_config['guide3a_parameters']['io_out_loss']))
-                self.guide3a_connector_in_loss_var.set(str(self.default_config['guide3a_parameters']['connector_in_loss']))
-                self.guide3a_connector_out_loss_var.set(str(self.default_config['guide3a_parameters']['connector_out_loss']))
-                self.guide3a_wg_in_loss_var.set(str(self.default_config['guide3a_parameters']['wg_in_loss']))
-                self.guide3a_wg_out_loss_var.set(str(self.default_config['guide3a_parameters']['wg_out_loss']))
-                self.guide3a_psr_loss_var.set(str(self.default_config['guide3a_parameters']['psr_loss']))
-                self.guide3a_phase_shifter_loss_var.set(str(self.default_config['guide3a_parameters']['phase_shifter_loss']))
-                self.guide3a_coupler_loss_var.set(str(self.default_config['guide3a_parameters']['coupler_loss']))
-                self.guide3a_target_pout_var.set(str(self.default_config['guide3a_parameters']['target_pout']))
-                self.guide3a_soa_penalty_var.set(str(self.default_config['guide3a_parameters']['soa_penalty']))
-                self.guide3a_target_pout_3sigma_var.set(str(self.default_config['guide3a_parameters']['target_pout_3sigma']))
-                self.guide3a_soa_penalty_3sigma_var.set(str(self.default_config['guide3a_parameters']['soa_penalty_3sigma']))
-                
-                # Load module parameters
-                self.guide3a_idac_voltage_overhead_var.set(str(self.default_config['guide3a_parameters']['idac_voltage_overhead']))
-                self.guide3a_ir_drop_nominal_var.set(str(self.default_config['guide3a_parameters']['ir_drop_nominal']))
-                self.guide3a_ir_drop_3sigma_var.set(str(self.default_config['guide3a_parameters']['ir_drop_3sigma']))
-                self.guide3a_vrm_efficiency_var.set(str(self.default_config['guide3a_parameters']['vrm_efficiency']))
-                self.guide3a_tec_cop_nominal_var.set(str(self.default_config['guide3a_parameters']['tec_cop_nominal']))
-                self.guide3a_tec_cop_3sigma_var.set(str(self.default_config['guide3a_parameters']['tec_cop_3sigma']))
-                self.guide3a_tec_power_efficiency_var.set(str(self.default_config['guide3a_parameters']['tec_power_efficiency']))
-                self.guide3a_driver_peripherals_power_var.set(str(self.default_config['guide3a_parameters']['driver_peripherals_power']))
-                self.guide3a_mcu_power_var.set(str(self.default_config['guide3a_parameters']['mcu_power']))
-                self.guide3a_misc_power_var.set(str(self.default_config['guide3a_parameters']['misc_power']))
-                self.guide3a_digital_core_efficiency_var.set(str(self.default_config['guide3a_parameters']['digital_core_efficiency']))
-                
-                # Copy module parameters to Analog, Digital, and Thermal specifications
-                # Analog Specifications
-                self.guide3a_idac_voltage_overhead_var.set(str(self.default_config['guide3a_parameters']['idac_voltage_overhead']))
-                self.guide3a_ir_drop_nominal_var.set(str(self.default_config['guide3a_parameters']['ir_drop_nominal']))
-                self.guide3a_ir_drop_3sigma_var.set(str(self.default_config['guide3a_parameters']['ir_drop_3sigma']))
-                self.guide3a_vrm_efficiency_var.set(str(self.default_config['guide3a_parameters']['vrm_efficiency']))
-                
-                # Digital Specifications
-                self.guide3a_driver_peripherals_power_var.set(str(self.default_config['guide3a_parameters']['driver_peripherals_power']))
-                self.guide3a_mcu_power_var.set(str(self.default_config['guide3a_parameters']['mcu_power']))
-                self.guide3a_misc_power_var.set(str(self.default_config['guide3a_parameters']['misc_power']))
-                self.guide3a_digital_core_efficiency_var.set(str(self.default_config['guide3a_parameters']['digital_core_efficiency']))
-                
-                # Thermal Specifications
-                self.guide3a_tec_cop_nominal_var.set(str(self.default_config['guide3a_parameters']['tec_cop_nominal']))
-                self.guide3a_tec_cop_3sigma_var.set(str(self.default_config['guide3a_parameters']['tec_cop_3sigma']))
-                self.guide3a_tec_power_efficiency_var.set(str(self.default_config['guide3a_parameters']['tec_power_efficiency']))
+                for name, key in _GUIDE3A_CONFIG_KEYS.items():
+                    self._guide3a_var_map[name].set(str(self.default_config['guide3a_parameters'][key]))
             
             messagebox.showinfo("Defaults Loaded", "Default configuration has been loaded successfully.")
             
@@ -877,52 +823,8 @@ class Guide3GUI(tk.Tk):
                 self.default_config['guide3a_parameters']['fiber_input_type'] = self.fiber_input_type_var.get()
                 self.default_config['guide3a_parameters']['pic_architecture'] = self.guide3a_architecture_var.get()
                 self.default_config['guide3a_parameters']['num_fibers'] = int(self.num_fibers_var.get())
-                self.default_config['guide3a_parameters']['operating_wavelength'] = float(self.guide3a_wavelength_var.get())
-                self.default_config['guide3a_parameters']['temperature'] = float(self.guide3a_temp_var.get())
-                self.default_config['guide3a_parameters']['io_in_loss'] = float(self.guide3a_io_in_loss_var.get())
-                self.default_config['guide3a_parameters']['io_out_loss'] = float(self.guide3a_io_out_loss_var.get())
-                self.default_config['guide3a_parameters']['connector_in_loss'] = float(self.guide3a_connector_in_loss_var.get())
-                self.default_config['guide3a_parameters']['connector_out_loss'] = float(self.guide3a_connector_out_loss_var.get())
-                self.default_config['guide3a_parameters']['wg_in_loss'] = float(self.guide3a_wg_in_loss_var.get())
-                self.default_config['guide3a_parameters']['wg_out_loss'] = float(self.guide3a_wg_out_loss_var.get())
-                self.default_config['guide3a_parameters']['psr_loss'] = float(self.guide3a_psr_loss_var.get())
-                self.default_config['guide3a_parameters']['phase_shifter_loss'] = float(self.guide3a_phase_shifter_loss_var.get())
-                self.default_config['guide3a_parameters']['coupler_loss'] = float(self.guide3a_coupler_loss_var.get())
-                self.default_config['guide3a_parameters']['target_pout'] = float(self.guide3a_target_pout_var.get())
-                self.default_config['guide3a_parameters']['soa_penalty'] = float(self.guide3a_soa_penalty_var.get())
-                self.default_config['guide3a_parameters']['target_pout_3sigma'] = float(self.guide3a_target_pout_3sigma_var.get())
-                self.default_config['guide3a_parameters']['soa_penalty_3sigma'] = float(self.guide3a_soa_penalty_3sigma_var.get())
-                
-                # Update module parameters
-                self.default_config['guide3a_parameters']['idac_voltage_overhead'] = float(self.guide3a_idac_voltage_overhead_var.get())
-                self.default_config['guide3a_parameters']['ir_drop_nominal'] = float(self.guide3a_ir_drop_nominal_var.get())
-                self.default_config['guide3a_parameters']['ir_drop_3sigma'] = float(self.guide3a_ir_drop_3sigma_var.get())
-                self.default_config['guide3a_parameters']['vrm_efficiency'] = float(self.guide3a_vrm_efficiency_var.get())
-                self.default_config['guide3a_parameters']['tec_cop_nominal'] = float(self.guide3a_tec_cop_nominal_var.get())
-                self.default_config['guide3a_parameters']['tec_cop_3sigma'] = float(self.guide3a_tec_cop_3sigma_var.get())
-                self.default_config['guide3a_parameters']['tec_power_efficiency'] = float(self.guide3a_tec_power_efficiency_var.get())
-                self.default_config['guide3a_parameters']['driver_peripherals_power'] = float(self.guide3a_driver_peripherals_power_var.get())
-                self.default_config['guide3a_parameters']['mcu_power'] = float(self.guide3a_mcu_power_var.get())
-                self.default_config['guide3a_parameters']['misc_power'] = float(self.guide3a_misc_power_var.get())
-                self.default_config['guide3a_parameters']['digital_core_efficiency'] = float(self.guide3a_digital_core_efficiency_var.get())
-                
-                # Update from Analog, Digital, and Thermal specifications
-                # Analog Specifications
-                self.default_config['guide3a_parameters']['idac_voltage_overhead'] = float(self.guide3a_idac_voltage_overhead_var.get())
-                self.default_config['guide3a_parameters']['ir_drop_nominal'] = float(self.guide3a_ir_drop_nominal_var.get())
-                self.default_config['guide3a_parameters']['ir_drop_3sigma'] = float(self.guide3a_ir_drop_3sigma_var.get())
-                self.default_config['guide3a_parameters']['vrm_efficiency'] = float(self.guide3a_vrm_efficiency_var.get())
-                
-                # Digital Specifications
-                self.default_config['guide3a_parameters']['driver_peripherals_power'] = float(self.guide3a_driver_peripherals_power_var.get())
-                self.default_config['guide3a_parameters']['mcu_power'] = float(self.guide3a_mcu_power_var.get())
-                self.default_config['guide3a_parameters']['misc_power'] = float(self.guide3a_misc_power_var.get())
-                self.default_config['guide3a_parameters']['digital_core_efficiency'] = float(self.guide3a_digital_core_efficiency_var.get())
-                
-                # Thermal Specifications
-                self.default_config['guide3a_parameters']['tec_cop_nominal'] = float(self.guide3a_tec_cop_nominal_var.get())
-                self.default_config['guide3a_parameters']['tec_cop_3sigma'] = float(self.guide3a_tec_cop_3sigma_var.get())
-                self.default_config['guide3a_parameters']['tec_power_efficiency'] = float(self.guide3a_tec_power_efficiency_var.get())
+                for name, key in _GUIDE3A_CONFIG_KEYS.items():
+                    self.default_config['guide3a_parameters'][key] = self._guide3a_float(name)
             
             messagebox.showinfo("Defaults Updated", "Default configuration has been updated with current values.")
             
@@ -938,8 +840,17 @@ class Guide3GUI(tk.Tk):
             )
             
             if filename:
-                with open(filename, 'r') as file:
-                    config = yaml.safe_load(file)
+                # Reuse the parsed file while it is unchanged on disk
+                stat = os.stat(filename)
+                file_key = (stat.st_mtime_ns, stat.st_size)
+                cached = self._config_file_cache.get(filename)
+                if cached is not None and cached[0] == file_key:
+                    config = cached[1]
+                else:
+                    # Parse the whole file from one bytes buffer; the loader also detects its encoding
+                    with open(filename, 'rb') as file:
+                        config = yaml.load(file.read(), Loader=_YamlLoader)
+                    self._config_file_cache[filename] = (file_key, config)
                 
                 # Load device parameters
                 if 'device_parameters' in config:
@@ -974,53 +885,8 @@ class Guide3GUI(tk.Tk):
                     self.fiber_input_type_var.set(config['guide3a_parameters'].get('fiber_input_type', 'pm'))
                     self.guide3a_architecture_var.set(config['guide3a_parameters'].get('pic_architecture', 'psrless'))
                     self.num_fibers_var.set(str(config['guide3a_parameters'].get('num_fibers', 40)))
-                    self.guide3a_wavelength_var.set(str(config['guide3a_parameters'].get('operating_wavelength', 1310)))
-                    self.guide3a_temp_var.set(str(config['guide3a_parameters'].get('temperature', 40)))
-                    self.guide3a_io_in_loss_var.set(str(config['guide3a_parameters'].get('io_in_loss', 1.5)))
-                    self.guide3a_io_out_loss_var.set(str(config['guide3a_parameters'].get('io_out_loss', 1.5)))
-                    self.guide3a_connector_in_loss_var.set(str(config['guide3a_parameters'].get('connector_in_loss', 0.25)))
-                    self.guide3a_connector_out_loss_var.set(str(config['guide3a_parameters'].get('connector_out_loss', 0.25)))
-                    self.guide3a_wg_in_loss_var.set(str(config['guide3a_parameters'].get('wg_in_loss', 0.25)))
-                    self.guide3a_wg_out_loss_var.set(str(config['guide3a_parameters'].get('wg_out_loss', 0.25)))
-                    self.guide3a_psr_loss_var.set(str(config['guide3a_parameters'].get('psr_loss', 0.5)))
-                    self.guide3a_phase_shifter_loss_var.set(str(config['guide3a_parameters'].get('phase_shifter_loss', 0.5)))
-                    self.guide3a_coupler_loss_var.set(str(config['guide3a_parameters'].get('coupler_loss', 0.2)))
-                    self.guide3a_target_pout_var.set(str(config['guide3a_parameters'].get('target_pout', -3.3)))
-                    self.guide3a_soa_penalty_var.set(str(config['guide3a_parameters'].get('soa_penalty', 2)))
-                    self.guide3a_target_pout_3sigma_var.set(str(config['guide3a_parameters'].get('target_pout_3sigma', -0.3)))
-                    self.guide3a_soa_penalty_3sigma_var.set(str(config['guide3a_parameters'].get('soa_penalty_3sigma', 2)))
-                
-                # Load module parameters
-                if 'guide3a_parameters' in config:
-                    self.guide3a_idac_voltage_overhead_var.set(str(config['guide3a_parameters'].get('idac_voltage_overhead', 0.4)))
-                    self.guide3a_ir_drop_nominal_var.set(str(config['guide3a_parameters'].get('ir_drop_nominal', 0.1)))
-                    self.guide3a_ir_drop_3sigma_var.set(str(config['guide3a_parameters'].get('ir_drop_3sigma', 0.2)))
-                    self.guide3a_vrm_efficiency_var.set(str(config['guide3a_parameters'].get('vrm_efficiency', 80)))
-                    self.guide3a_tec_cop_nominal_var.set(str(config['guide3a_parameters'].get('tec_cop_nominal', 4)))
-                    self.guide3a_tec_cop_3sigma_var.set(str(config['guide3a_parameters'].get('tec_cop_3sigma', 2)))
-                    self.guide3a_tec_power_efficiency_var.set(str(config['guide3a_parameters'].get('tec_power_efficiency', 80)))
-                    self.guide3a_driver_peripherals_power_var.set(str(config['guide3a_parameters'].get('driver_peripherals_power', 1.0)))
-                    self.guide3a_mcu_power_var.set(str(config['guide3a_parameters'].get('mcu_power', 0.5)))
-                    self.guide3a_misc_power_var.set(str(config['guide3a_parameters'].get('misc_power', 0.25)))
-                    self.guide3a_digital_core_efficiency_var.set(str(config['guide3a_parameters'].get('digital_core_efficiency', 80)))
-                    
-                    # Copy module parameters to Analog, Digital, and Thermal specifications
-                    # Analog Specifications
-                    self.guide3a_idac_voltage_overhead_var.set(str(config['guide3a_parameters'].get('idac_voltage_overhead', 0.4)))
-                    self.guide3a_ir_drop_nominal_var.set(str(config['guide3a_parameters'].get('ir_drop_nominal', 0.1)))
-                    self.guide3a_ir_drop_3sigma_var.set(str(config['guide3a_parameters'].get('ir_drop_3sigma', 0.2)))
-                    self.guide3a_vrm_efficiency_var.set(str(config['guide3a_parameters'].get('vrm_efficiency', 80)))
-                    
-                    # Digital Specifications
-                    self.guide3a_driver_peripherals_power_var.set(str(config['guide3a_parameters'].get('driver_peripherals_power', 1.0)))
-                    self.guide3a_mcu_power_var.set(str(config['guide3a_parameters'].get('mcu_power', 0.5)))
-                    self.guide3a_misc_power_var.set(str(config['guide3a_parameters'].get('misc_power', 0.25)))
-                    self.guide3a_digital_core_efficiency_var.set(str(config['guide3a_parameters'].get('digital_core_efficiency', 80)))
-                    
-                    # Thermal Specifications
-                    self.guide3a_tec_cop_nominal_var.set(str(config['guide3a_parameters'].get('tec_cop_nominal', 4)))
-                    self.guide3a_tec_cop_3sigma_var.set(str(config['guide3a_parameters'].get('tec_cop_3sigma', 2)))
-                    self.guide3a_tec_power_efficiency_var.set(str(config['guide3a_parameters'].get('tec_power_efficiency', 80)))
+                    for name, key in _GUIDE3A_CONFIG_KEYS.items():
+                        self._guide3a_var_map[name].set(str(config['guide3a_parameters'].get(key, _GUIDE3A_INPUT_DEFAULTS[name])))
                 
                 messagebox.showinfo("Config Loaded", f"Configuration loaded from {filename}")
                 
@@ -1061,61 +927,118 @@ class Guide3GUI(tk.Tk):
                         'fiber_input_type': self.fiber_input_type_var.get(),
                         'pic_architecture': self.guide3a_architecture_var.get(),
                         'num_fibers': int(self.num_fibers_var.get()),
-                        'operating_wavelength': float(self.guide3a_wavelength_var.get()),
-                        'temperature': float(self.guide3a_temp_var.get()),
-                        'io_in_loss': float(self.guide3a_io_in_loss_var.get()),
-                        'io_out_loss': float(self.guide3a_io_out_loss_var.get()),
-                        'connector_in_loss': float(self.guide3a_connector_in_loss_var.get()),
-                        'connector_out_loss': float(self.guide3a_connector_out_loss_var.get()),
-                        'wg_in_loss': float(self.guide3a_wg_in_loss_var.get()),
-                        'wg_out_loss': float(self.guide3a_wg_out_loss_var.get()),
-                        'psr_loss': float(self.guide3a_psr_loss_var.get()),
-                        'phase_shifter_loss': float(self.guide3a_phase_shifter_loss_var.get()),
-                        'coupler_loss': float(self.guide3a_coupler_loss_var.get()),
-                        'target_pout': float(self.guide3a_target_pout_var.get()),
-                        'soa_penalty': float(self.guide3a_soa_penalty_var.get()),
-                        'target_pout_3sigma': float(self.guide3a_target_pout_3sigma_var.get()),
-                        'soa_penalty_3sigma': float(self.guide3a_soa_penalty_3sigma_var.get()),
-                        'idac_voltage_overhead': float(self.guide3a_idac_voltage_overhead_var.get()),
-                        'ir_drop_nominal': float(self.guide3a_ir_drop_nominal_var.get()),
-                        'ir_drop_3sigma': float(self.guide3a_ir_drop_3sigma_var.get()),
-                        'vrm_efficiency': float(self.guide3a_vrm_efficiency_var.get()),
-                        'tec_cop_nominal': float(self.guide3a_tec_cop_nominal_var.get()),
-                        'tec_cop_3sigma': float(self.guide3a_tec_cop_3sigma_var.get()),
-                        'tec_power_efficiency': float(self.guide3a_tec_power_efficiency_var.get()),
-                        'driver_peripherals_power': float(self.guide3a_driver_peripherals_power_var.get()),
-                        'mcu_power': float(self.guide3a_mcu_power_var.get()),
-                        'misc_power': float(self.guide3a_misc_power_var.get()),
-                        'digital_core_efficiency': float(self.guide3a_digital_core_efficiency_var.get())
+                        **{key: self._guide3a_float(name) for name, key in _GUIDE3A_CONFIG_KEYS.items()}
                     }
                 }
                 
                 with open(filename, 'w') as file:
-                    yaml.dump(config, file, default_flow_style=False, indent=2)
+                    yaml.dump(config, file, Dumper=_YamlDumper, default_flow_style=False, indent=2)
                 
                 messagebox.showinfo("Config Saved", f"Configuration saved to {filename}")
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save configuration: {e}")
 
-    def create_wavelength_table(self, wavelengths, results_data, case_name):
-        """Create a formatted table for wavelength analysis results"""
-        table = f"\n{case_name} Wavelength Analysis:\n"
-        table += "=" * 80 + "\n"
-        table += f"{'Wavelength':<12} {'Unsaturated':<12} {'Saturation':<12} {'Required':<12} {'Gain':<12} {'WPE':<8}\n"
-        table += f"{'(nm)':<12} {'Gain (dB)':<12} {'Power (dBm)':<12} {'P_in (dBm)':<12} {'(dB)':<12} {'(%)':<8}\n"
-        table += "-" * 80 + "\n"
-        
-        for i, (wavelength, data) in enumerate(zip(wavelengths, results_data)):
-            if data['achievable']:
-                table += f"{wavelength:<12.2f} {data['unsaturated_gain']:<12.2f} {data['saturation_power']:<12.2f} "
-                table += f"{data['required_pin']:<12.2f} {data['saturated_gain']:<12.2f} {data['wpe']:<8.2f}\n"
+    def _bind_wheel_dispatch(self):
+        """Install one application-wide set of wheel bindings that scroll the canvas under the pointer"""
+        # The handlers are registered with Tcl once and get only the pointer position and wheel delta,
+        # so a wheel event does not build a full tkinter Event.
+        # X11 reports wheel notches as buttons 4 and 5 without a delta, so those pass a fixed ±120.
+        y_command = self.register(lambda x, y, delta: self._dispatch_wheel('y', int(x), int(y), int(delta)))
+        x_command = self.register(lambda x, y, delta: self._dispatch_wheel('x', int(x), int(y), int(delta)))
+        scripts = {"<MouseWheel>": f"{y_command} %X %Y %D",
+                   "<Button-4>": f"{y_command} %X %Y 120", "<Button-5>": f"{y_command} %X %Y -120",
+                   "<Shift-MouseWheel>": f"{x_command} %X %Y %D",
+                   "<Shift-Button-4>": f"{x_command} %X %Y 120", "<Shift-Button-5>": f"{x_command} %X %Y -120"}
+        for sequence in _WHEEL_SEQUENCES:
+            self.bind_all(sequence, scripts[sequence])
+
+    def _dispatch_wheel(self, axis, x_root, y_root, delta):
+        """Queue a wheel scroll for the wheel-scrolled canvas containing the pointer, if any"""
+        try:
+            widget = self.winfo_containing(x_root, y_root)
+        except KeyError:
+            # Pointer over a Tk-internal widget (e.g. a combobox dropdown) tkinter has no object for
+            return
+        while widget is not None and widget not in self._wheel_canvases:
+            widget = widget.master
+        if widget is None or (axis == 'x' and not self._wheel_canvases[widget]):
+            return
+        self._queue_wheel_scroll(widget, axis, delta)
+
+    def _queue_wheel_scroll(self, canvas, axis, delta):
+        """Accumulate a burst of wheel deltas and scroll the canvas once when Tk goes idle"""
+        key = (canvas, axis)
+        if key not in self._wheel_deltas:
+            self._wheel_deltas[key] = 0
+            self.after_idle(self._flush_wheel_scroll, canvas, axis)
+        self._wheel_deltas[key] += delta
+
+    def _flush_wheel_scroll(self, canvas, axis):
+        """Apply the accumulated wheel delta, 120 per unit as on the standard wheel"""
+        delta = self._wheel_deltas.pop((canvas, axis))
+        # Whole notches only, truncated toward zero; wheel up (positive delta) scrolls back
+        steps = abs(delta) // 120
+        units = -steps if delta > 0 else steps
+        if units:
+            if axis == 'y':
+                canvas.yview_scroll(units, "units")
             else:
-                table += f"{wavelength:<12.2f} {data['unsaturated_gain']:<12.2f} {data['saturation_power']:<12.2f} "
-                table += f"{'N/A':<12} {'N/A':<12} {'N/A':<8}\n"
-        
-        table += "=" * 80 + "\n"
-        return table
+                canvas.xview_scroll(units, "units")
+
+    def _queue_scroll_region_update(self, canvas):
+        """Recompute canvas's scrollregion once after a burst of <Configure> events"""
+        if canvas not in self._pending_scroll_regions:
+            self._pending_scroll_regions.add(canvas)
+            self.after_idle(self._update_scroll_region, canvas)
+
+    def _update_scroll_region(self, canvas):
+        """Fit canvas's scrollregion to its content, leaving it alone when the content extent is unchanged"""
+        self._pending_scroll_regions.discard(canvas)
+        region = canvas.bbox("all")
+        if region != self._scroll_regions.get(canvas):
+            self._scroll_regions[canvas] = region
+            canvas.configure(scrollregion=region)
+
+    def _bulk_set_text(self, widget, content):
+        """Replace a read-only results Text widget's content in one delete/insert pass"""
+        widget.configure(state='normal')
+        widget.delete('1.0', tk.END)
+        widget.insert('1.0', content)
+        widget.configure(state='disabled')
+
+    def _clear_wavelength_array_cache(self, *_):
+        """Drop the parsed wavelength entries after one of them changes"""
+        self._wavelength_array_cache = None
+
+    def _wavelength_array(self):
+        """All wavelength entries as float64 values (NaN when not a number) and a blank-entry mask"""
+        if self._wavelength_array_cache is None:
+            raw = [var.get() for var in self.wavelength_vars]
+            values = np.fromiter((_parse_or_nan(value) for value in raw), dtype=np.float64, count=len(raw))
+            blank = np.fromiter((not value.strip() for value in raw), dtype=bool, count=len(raw))
+            self._wavelength_array_cache = (values, blank)
+        return self._wavelength_array_cache
+
+    def _parse_wavelengths(self, n=None, skip_blank=False):
+        """Parse and range-check the first n wavelength entries (all when n is None); returns None after reporting an error"""
+        values, blank = self._wavelength_array()
+        if n is not None:
+            values, blank = values[:n], blank[:n]
+        # Entry numbers shown in error messages, which differ from array positions once blanks are skipped
+        index = np.flatnonzero(~blank) if skip_blank else np.arange(len(values))
+        wavelengths = values[index]
+        
+        invalid = np.flatnonzero(np.isnan(wavelengths))
+        if invalid.size:
+            messagebox.showerror("Invalid Input", f"Wavelength {index[invalid[0]]+1} must be a valid number")
+            return None
+        
+        bad = np.flatnonzero(~((wavelengths >= 1290) & (wavelengths <= 1330)))
+        if bad.size:
+            messagebox.showerror("Invalid Input", f"Wavelength {index[bad[0]]+1} must be between 1290 and 1330 nm")
+            return None
+        return wavelengths
 
     def calculate_soa(self):
         """Calculate SOA parameters based on input values using EuropaSOA class"""
@@ -1132,17 +1055,9 @@ class Guide3GUI(tk.Tk):
                 return
             
             # Get wavelength values
-            wavelengths = []
-            for i in range(num_wavelengths):
-                try:
-                    wavelength = float(self.wavelength_vars[i].get())
-                    if not (1290 <= wavelength <= 1330):
-                        messagebox.showerror("Invalid Input", f"Wavelength {i+1} must be between 1290 and 1330 nm")
-                        return
-                    wavelengths.append(wavelength)
-                except ValueError:
-                    messagebox.showerror("Invalid Input", f"Wavelength {i+1} must be a valid number")
-                    return
+            wavelengths = self._parse_wavelengths(num_wavelengths)
+            if wavelengths is None:
+                return
             
             # Check which link loss modes are selected
             median_selected = self.link_loss_modes["median-loss"].get()
@@ -1164,98 +1079,189 @@ class Guide3GUI(tk.Tk):
                 return
             
             # Get Guide3A SOA output requirements to use as target Pout
-            from Guide3A import Guide3A
-            
-            # Get Guide3A parameters from GUI
-            fiber_input_type = self.fiber_input_type_var.get()
-            pic_architecture = self.guide3a_architecture_var.get()
-            num_fibers = int(self.num_fibers_var.get())
-            operating_wavelength = float(self.guide3a_wavelength_var.get())
-            temperature = float(self.guide3a_temp_var.get())
-            io_in_loss = float(self.guide3a_io_in_loss_var.get())
-            io_out_loss = float(self.guide3a_io_out_loss_var.get())
-            psr_loss = float(self.guide3a_psr_loss_var.get())
-            phase_shifter_loss = float(self.guide3a_phase_shifter_loss_var.get())
-            coupler_loss = float(self.guide3a_coupler_loss_var.get())
-            target_pout = float(self.guide3a_target_pout_var.get())
-            target_pout_3sigma = float(self.guide3a_target_pout_3sigma_var.get())
-            soa_penalty = float(self.guide3a_soa_penalty_var.get())
-            soa_penalty_3sigma = float(self.guide3a_soa_penalty_3sigma_var.get())
-            
-            # Create Guide3A instance to get SOA output requirements
-            guide3a = Guide3A(
-                pic_architecture=pic_architecture,
-                fiber_input_type=fiber_input_type,
-                num_fibers=num_fibers,
-                operating_wavelength_nm=operating_wavelength,
-                temperature_c=temperature,
-                io_in_loss=io_in_loss,
-                io_out_loss=io_out_loss,
-                connector_in_loss=float(self.guide3a_connector_in_loss_var.get()),
-                connector_out_loss=float(self.guide3a_connector_out_loss_var.get()),
-                wg_in_loss=float(self.guide3a_wg_in_loss_var.get()),
-                wg_out_loss=float(self.guide3a_wg_out_loss_var.get()),
-                tap_in_loss=float(self.guide3a_tap_in_loss_var.get()),
-                tap_out_loss=float(self.guide3a_tap_out_loss_var.get()),
-                psr_loss=psr_loss,
-                phase_shifter_loss=phase_shifter_loss,
-                coupler_loss=coupler_loss,
-                target_pout=target_pout,
-                soa_penalty=soa_penalty,
-                soa_penalty_3sigma=soa_penalty_3sigma,
-                # Module parameters
-                idac_voltage_overhead=float(self.guide3a_idac_voltage_overhead_var.get()),
-                ir_drop_nominal=float(self.guide3a_ir_drop_nominal_var.get()),
-                ir_drop_3sigma=float(self.guide3a_ir_drop_3sigma_var.get()),
-                vrm_efficiency=float(self.guide3a_vrm_efficiency_var.get()),
-                tec_cop_nominal=float(self.guide3a_tec_cop_nominal_var.get()),
-                tec_cop_3sigma=float(self.guide3a_tec_cop_3sigma_var.get()),
-                tec_power_efficiency=float(self.guide3a_tec_power_efficiency_var.get()),
-                driver_peripherals_power=float(self.guide3a_driver_peripherals_power_var.get()),
-                mcu_power=float(self.guide3a_mcu_power_var.get()),
-                misc_power=float(self.guide3a_misc_power_var.get()),
-                digital_core_efficiency=float(self.guide3a_digital_core_efficiency_var.get())
-            )
-            
-            # Get SOA output requirements
-            soa_output_calculation = guide3a.calculate_target_pout_after_soa(
-                num_wavelengths=num_wavelengths,
-                target_pout_3sigma=target_pout_3sigma,
-                soa_penalty_3sigma=soa_penalty_3sigma
-            )
+            soa_output_calculation = self._get_soa_output_calculation(num_wavelengths)
+            med_case = soa_output_calculation['median_case']
+            sig_case = soa_output_calculation.get('sigma_case')
             
             # Create SOA instance
             soa = EuropaSOA(L_active_um=l_active, W_um=w_um, verbose=False)
             
-            # Clear results
-            self.median_results_text.delete(1.0, tk.END)
-            self.sigma_results_text.delete(1.0, tk.END)
-            
-            # Calculate and display results for each case
+            # Calculate results for each case; unselected cases are shown empty
+            median_results = ""
+            sigma_results = ""
             if median_selected:
-                median_results = self._calculate_soa_case_results(
+                median_results = self._get_soa_case_results(
                     soa, wavelengths, temp_c, "Median Loss",
-                    soa_output_calculation['median_case']['soa_output_requirement_db'],
+                    med_case['soa_output_requirement_db'],
                     float(self.j_density_median_var.get())
                 )
-                self.median_results_text.insert(1.0, median_results)
             
-            if sigma_selected and soa_output_calculation['sigma_case'] is not None:
-                sigma_results = self._calculate_soa_case_results(
+            if sigma_selected and sig_case is not None:
+                sigma_results = self._get_soa_case_results(
                     soa, wavelengths, temp_c, "3σ Loss",
-                    soa_output_calculation['sigma_case']['soa_output_requirement_db'],
+                    sig_case['soa_output_requirement_db'],
                     float(self.j_density_sigma_var.get())
                 )
-                self.sigma_results_text.insert(1.0, sigma_results)
+            
+            # Display results in respective text widgets
+            self._bulk_set_text(self.median_results_text, median_results)
+            self._bulk_set_text(self.sigma_results_text, sigma_results)
             
         except ValueError:
             messagebox.showerror("Input Error", "Please ensure all values are valid numbers.")
         except Exception as e:
             messagebox.showerror("Calculation Error", f"An error occurred during calculation: {e}")
 
+    def _create_scrollable_inputs(self, container, fit_width=False):
+        """Canvas with both scrollbars in container; returns the canvas and the frame that holds the inputs"""
+        input_canvas = tk.Canvas(container)
+        input_v_scrollbar = ttk.Scrollbar(container, orient="vertical", command=input_canvas.yview)
+        input_h_scrollbar = ttk.Scrollbar(container, orient="horizontal", command=input_canvas.xview)
+        input_scrollable_frame = ttk.Frame(input_canvas)
+
+        # Recompute the scroll region once per burst of size changes of the inputs frame
+        input_scrollable_frame.bind("<Configure>", lambda e: self._queue_scroll_region_update(input_canvas))
+
+        window_id = input_canvas.create_window((0, 0), window=input_scrollable_frame, anchor="nw")
+        input_canvas.configure(yscrollcommand=input_v_scrollbar.set, xscrollcommand=input_h_scrollbar.set)
+
+        if fit_width:
+            # Update the scrollable frame width to match canvas width
+            input_canvas.bind("<Configure>", lambda e: input_canvas.itemconfig(window_id, width=e.width))
+
+        # Pack the canvas and scrollbars
+        input_canvas.pack(side="left", fill="both", expand=True)
+        input_v_scrollbar.pack(side="right", fill="y")
+        input_h_scrollbar.pack(side="bottom", fill="x")
+        
+        # Scroll the inputs with the mouse wheel
+        self._wheel_canvases[input_canvas] = True
+        return input_canvas, input_scrollable_frame
+
+    def _guide3a_entry(self, parent, name, pady=0):
+        """Create and pack the Entry for a numeric Guide3A input and register its variable"""
+        var = self._guide3a_var_map[name] = tk.StringVar(value=_GUIDE3A_INPUT_DEFAULTS[name])
+        entry = ttk.Entry(parent, textvariable=var, width=15)
+        entry.pack(anchor='w', padx=5, pady=pady)
+        return entry
+
+    def _guide3a_fields(self, parent, fields):
+        """Lay out a column of labelled Guide3A entries from (parameter name, label) pairs"""
+        for name, label in fields:
+            ttk.Label(parent, text=label).pack(pady=(5, 2), anchor='w')
+            self._guide3a_entry(parent, name)
+
+    def _guide3a_float(self, name):
+        """Parsed value of a numeric Guide3A input, cached until the variable is written"""
+        value = self._guide3a_float_cache.get(name)
+        if value is None:
+            value = self._guide3a_float_cache[name] = float(self._guide3a_var_map[name].get())
+        return value
+
+    def _snapshot_guide3a_params(self):
+        """Read every numeric Guide3A input once"""
+        return {name: self._guide3a_float(name) for name in self._guide3a_var_map}
+
+    def _gather_guide3a_params(self):
+        """Collect the Guide3A constructor arguments from the Guide3A tab"""
+        params = self._snapshot_guide3a_params()
+        # target_pout_3sigma is passed per calculation rather than to the constructor
+        kwargs = {name: value for name, value in params.items() if name != 'target_pout_3sigma'}
+        return dict(
+            pic_architecture=self.guide3a_architecture_var.get(),
+            fiber_input_type=self.fiber_input_type_var.get(),
+            num_fibers=int(self.num_fibers_var.get()),
+            **kwargs
+        )
+
+    @property
+    def guide3a(self):
+        """Guide3A instance for the current inputs, built on first use and updated in place afterwards"""
+        if self._guide3a is None:
+            self._guide3a = Guide3A(**self._gather_guide3a_params())
+            self._guide3a_dirty.clear()
+            self._guide3a_results.clear()
+        elif self._guide3a_dirty:
+            # The 3σ target and penalty are per-calculation arguments, not Guide3A attributes
+            updates = {name: self._guide3a_float(name) for name in self._guide3a_dirty
+                       if name not in ('target_pout_3sigma', 'soa_penalty_3sigma')}
+            # A rejected update leaves the instance unchanged and the inputs queued for the next use
+            self._guide3a.update_parameters(**updates)
+            self._guide3a_dirty.clear()
+        return self._guide3a
+
+    def _invalidate_guide3a(self, *_):
+        """Drop the shared Guide3A instance, its memoized results and the SOA reports built from them"""
+        self._guide3a = None
+        self._guide3a_results.clear()
+        self._soa_result_cache.clear()
+
+    def _mark_guide3a_dirty(self, name):
+        """Drop the parsed value of a numeric Guide3A input and queue it for the shared instance"""
+        self._guide3a_float_cache.pop(name, None)
+        self._guide3a_dirty.add(name)
+        self._guide3a_results.clear()
+        # The SOA reports are keyed on targets derived from the Guide3A inputs
+        self._soa_result_cache.clear()
+
+    def _get_soa_output_calculation(self, num_wavelengths):
+        """Guide3A.calculate_target_pout_after_soa on the shared instance, reused until an input changes"""
+        target_pout_3sigma = self._guide3a_float('target_pout_3sigma')
+        soa_penalty_3sigma = self._guide3a_float('soa_penalty_3sigma')
+        args = (num_wavelengths, target_pout_3sigma, soa_penalty_3sigma)
+        cached = self._guide3a_results.get('soa_output')
+        if cached is not None and cached[0] == args:
+            return cached[1]
+        result = self.guide3a.calculate_target_pout_after_soa(
+            num_wavelengths=num_wavelengths,
+            target_pout_3sigma=target_pout_3sigma,
+            soa_penalty_3sigma=soa_penalty_3sigma
+        )
+        self._guide3a_results['soa_output'] = (args, result)
+        return result
+
+    def _get_optimum_current_calculation(self, num_wavelengths, wavelengths):
+        """Guide3A.estimate_optimum_soa_current_density on the shared instance, reused until an input changes"""
+        target_pout_3sigma = self._guide3a_float('target_pout_3sigma')
+        soa_penalty_3sigma = self._guide3a_float('soa_penalty_3sigma')
+        args = (num_wavelengths, target_pout_3sigma, soa_penalty_3sigma, tuple(wavelengths))
+        cached = self._guide3a_results.get('optimum_current')
+        if cached is not None and cached[0] == args:
+            return cached[1]
+        result = self.guide3a.estimate_optimum_soa_current_density(
+            num_wavelengths=num_wavelengths,
+            target_pout_3sigma=target_pout_3sigma,
+            soa_penalty_3sigma=soa_penalty_3sigma,
+            wavelengths=list(wavelengths)
+        )
+        self._guide3a_results['optimum_current'] = (args, result)
+        return result
+
+    def _get_guide3a_soa_requirements(self, num_wavelengths):
+        """SOA output requirement and optimum current density for the current Guide3A inputs"""
+        wavelengths = self._wavelength_array()[0][:num_wavelengths]
+        wavelengths = np.where(np.isnan(wavelengths), 1310.0, wavelengths).tolist()  # Default if invalid
+        
+        return (self._get_soa_output_calculation(num_wavelengths),
+                self._get_optimum_current_calculation(num_wavelengths, wavelengths))
+
+    def _clear_soa_result_cache(self, *_):
+        """Drop cached SOA reports after an input change"""
+        self._soa_result_cache.clear()
+
+    def _get_soa_case_results(self, soa, wavelengths, temp_c, case_name, target_pout_db, j_density):
+        """Return the SOA report for a case, reusing the cached text when the inputs are unchanged"""
+        key = (soa.W_um, soa.L_active_um, temp_c, tuple(wavelengths), case_name, target_pout_db, j_density)
+        results = self._soa_result_cache.get(key)
+        if results is None:
+            results = self._calculate_soa_case_results(soa, wavelengths, temp_c, case_name,
+                                                       target_pout_db, j_density)
+            self._soa_result_cache[key] = results
+        return results
+
     def _calculate_soa_case_results(self, soa, wavelengths, temp_c, case_name, target_pout_db, j_density):
         """Calculate and format SOA results for a specific case"""
-        results = f"""EuropaSOA Analysis Results - {case_name}
+        header = f"""EuropaSOA Analysis Results - {case_name}
 {'='*50}
 
 Device Parameters:
@@ -1270,37 +1276,25 @@ Wavelength Analysis:
         
         # Calculate current
         current_ma = soa.calculate_current_mA_from_J(j_density)
-        target_pout_mw = 10**(target_pout_db / 10.0)
-        
-        # Create wavelength table
-        results += f"{'Wavelength':<12} {'Unsaturated':<12} {'Saturation':<12} {'Required':<12} {'Gain':<12} {'WPE':<8}\n"
-        results += f"{'(nm)':<12} {'Gain (dB)':<12} {'Power (dBm)':<12} {'P_in (dBm)':<12} {'(dB)':<12} {'(%)':<8}\n"
-        results += "-" * 80 + "\n"
+        target_pout_mw = math.exp(target_pout_db * _LN10_OVER_10)
         
-        for wavelength in wavelengths:
-            # Get unsaturated gain
-            unsaturated_gain_db = soa.get_unsaturated_gain(wavelength, temp_c, j_density)
-            
-            # Get saturation power
-            saturation_power_dbm = soa.get_output_saturation_power_dBm(wavelength, j_density, temp_c)
-            
-            # Find required input power for target output
-            required_pin_mw = soa.find_Pin_for_target_Pout(target_pout_mw, current_ma, wavelength, temp_c)
-            
-            if required_pin_mw is not None:
-                # Calculate saturated gain
-                saturated_gain_db = soa.get_saturated_gain(wavelength, temp_c, j_density, required_pin_mw)
-                
-                # Calculate WPE
-                wpe = soa.calculate_wpe(current_ma, wavelength, temp_c, required_pin_mw)
-                
-                results += f"{wavelength:<12.2f} {unsaturated_gain_db:<12.2f} {saturation_power_dbm:<12.2f} "
-                results += f"{10*math.log10(required_pin_mw):<12.2f} {saturated_gain_db:<12.2f} {wpe:<8.2f}\n"
-            else:
-                results += f"{wavelength:<12.2f} {unsaturated_gain_db:<12.2f} {saturation_power_dbm:<12.2f} "
-                results += f"{'N/A':<12} {'N/A':<12} {'N/A':<8}\n"
+        # Evaluate every column for all wavelengths at once, leaving NaN where the target Pout is not achievable
+        ug_arr = soa.get_unsaturated_gain_vec(wavelengths, temp_c, j_density)
+        sp_arr = soa.get_output_saturation_power_dBm_vec(wavelengths, j_density, temp_c)
+        wpe_arr, sg_arr, pin_arr, _ = soa.sweep_wavelengths(wavelengths, current_ma, target_pout_mw, temp_c)
         
-        results += "=" * 80 + "\n"
+        # Create wavelength table
+        rows = [_NA_ROW_FMT.format(wl=wl, ug=ug, sp=sp, na='N/A') if math.isnan(pin) else
+                _ROW_FMT.format(wl=wl, ug=ug, sp=sp, pin=pin, sg=sg, wpe=wpe)
+                for wl, ug, sp, pin, sg, wpe in zip(wavelengths, ug_arr, sp_arr, pin_arr, sg_arr, wpe_arr)]
+        parts = [
+            header,
+            f"{'Wavelength':<12} {'Unsaturated':<12} {'Saturation':<12} {'Required':<12} {'Gain':<12} {'WPE':<8}\n",
+            f"{'(nm)':<12} {'Gain (dB)':<12} {'Power (dBm)':<12} {'P_in (dBm)':<12} {'(dB)':<12} {'(%)':<8}\n",
+            "-" * 80 + "\n",
+            "".join(rows),
+            "=" * 80 + "\n",
+        ]
         
         # Calculate PIC Power Consumption and related metrics
         operating_voltage_v = soa.get_operating_voltage(current_ma)
@@ -1325,7 +1319,7 @@ Wavelength Analysis:
         heat_load_w = heat_load_mw / 1000.0
         
         # Add summary information
-        results += f"""
+        parts.append(f"""
 Summary:
 - Operating Current: {current_ma:.1f} mA
 - Operating Voltage: {operating_voltage_v:.2f} V
@@ -1343,9 +1337,9 @@ PIC Efficiency and Heat Load:
 - Heat Load: {heat_load_w:.3f} W
 
 Note: Results are based on Guide3A SOA output requirements.
-"""
+""")
         
-        return results
+        return "".join(parts)
 
     def reset_soa(self):
         """Reset all SOA inputs to default values"""
@@ -1367,8 +1361,9 @@ Note: Results are based on Guide3A SOA output requirements.
         self.temp_var.set("40")
         self.link_loss_modes["median-loss"].set(True)
         self.link_loss_modes["3-sigma-loss"].set(True)
-        self.median_results_text.delete(1.0, tk.END)
-        self.sigma_results_text.delete(1.0, tk.END)
+        self._soa_result_cache.clear()
+        self._bulk_set_text(self.median_results_text, "")
+        self._bulk_set_text(self.sigma_results_text, "")
 
     def update_wavelength_inputs(self):
         """Update the wavelength input fields based on the number specified"""
@@ -1390,23 +1385,10 @@ Note: Results are based on Guide3A SOA output requirements.
     def save_wavelength_set(self):
         """Save the current wavelength set as defaults"""
         try:
-            # Get current wavelength values
-            new_defaults = []
-            for i, wavelength_var in enumerate(self.wavelength_vars):
-                wavelength_value = wavelength_var.get().strip()
-                if wavelength_value:  # Only save non-empty values
-                    try:
-                        wavelength_float = float(wavelength_value)
-                        if 1290 <= wavelength_float <= 1330:
-                            new_defaults.append(wavelength_value)
-                        else:
-                            messagebox.showerror("Invalid Wavelength", f"Wavelength {i+1} must be between 1290 and 1330 nm")
-                            return
-                    except ValueError:
-                        messagebox.showerror("Invalid Wavelength", f"Wavelength {i+1} must be a valid number")
-                        return
-                else:
-                    new_defaults.append("")  # Keep empty for unused wavelengths
+            # Validate the non-empty entries; empty ones are kept as unused wavelengths
+            if self._parse_wavelengths(skip_blank=True) is None:
+                return
+            new_defaults = [wavelength_var.get().strip() for wavelength_var in self.wavelength_vars]
             
             # Update the default wavelengths (extend to 32 if needed)
             self.default_wavelengths = new_defaults[:32]  # Limit to 32 wavelengths
@@ -1438,17 +1420,9 @@ Note: Results are based on Guide3A SOA output requirements.
                 return
             
             # Get wavelength values
-            wavelengths = []
-            for i in range(num_wavelengths):
-                try:
-                    wavelength = float(self.wavelength_vars[i].get())
-                    if not (1290 <= wavelength <= 1330):
-                        messagebox.showerror("Invalid Input", f"Wavelength {i+1} must be between 1290 and 1330 nm")
-                        return
-                    wavelengths.append(wavelength)
-                except ValueError:
-                    messagebox.showerror("Invalid Input", f"Wavelength {i+1} must be a valid number")
-                    return
+            wavelengths = self._parse_wavelengths(num_wavelengths)
+            if wavelengths is None:
+                return
             
             # Check which link loss modes are selected
             median_selected = self.link_loss_modes["median-loss"].get()
@@ -1458,88 +1432,71 @@ Note: Results are based on Guide3A SOA output requirements.
                 messagebox.showerror("Invalid Selection", "Please select at least one link loss mode.")
                 return
             
-            # Calculate Guide3A SOA output requirements to use as target Pout
-            from Guide3A import Guide3A
-            
-            # Get Guide3A parameters from GUI
-            fiber_input_type = self.fiber_input_type_var.get()
-            pic_architecture = self.guide3a_architecture_var.get()
-            num_fibers = int(self.num_fibers_var.get())
-            operating_wavelength = float(self.guide3a_wavelength_var.get())
-            temperature = float(self.guide3a_temp_var.get())
-            io_in_loss = float(self.guide3a_io_in_loss_var.get())
-            io_out_loss = float(self.guide3a_io_out_loss_var.get())
-            psr_loss = float(self.guide3a_psr_loss_var.get())
-            phase_shifter_loss = float(self.guide3a_phase_shifter_loss_var.get())
-            coupler_loss = float(self.guide3a_coupler_loss_var.get())
-            target_pout = float(self.guide3a_target_pout_var.get())
-            target_pout_3sigma = float(self.guide3a_target_pout_3sigma_var.get())
-            soa_penalty = float(self.guide3a_soa_penalty_var.get())
-            soa_penalty_3sigma = float(self.guide3a_soa_penalty_3sigma_var.get())
-            
-            # Create Guide3A instance
-            guide3a = Guide3A(
-                pic_architecture=pic_architecture,
-                fiber_input_type=fiber_input_type,
-                num_fibers=num_fibers,
-                operating_wavelength_nm=operating_wavelength,
-                temperature_c=temperature,
-                io_in_loss=io_in_loss,
-                io_out_loss=io_out_loss,
-                connector_in_loss=float(self.guide3a_connector_in_loss_var.get()),
-                connector_out_loss=float(self.guide3a_connector_out_loss_var.get()),
-                wg_in_loss=float(self.guide3a_wg_in_loss_var.get()),
-                wg_out_loss=float(self.guide3a_wg_out_loss_var.get()),
-                tap_in_loss=float(self.guide3a_tap_in_loss_var.get()),
-                tap_out_loss=float(self.guide3a_tap_out_loss_var.get()),
-                psr_loss=psr_loss,
-                phase_shifter_loss=phase_shifter_loss,
-                coupler_loss=coupler_loss,
-                target_pout=target_pout,
-                soa_penalty=soa_penalty,
-                soa_penalty_3sigma=soa_penalty_3sigma,
-                # Module parameters
-                idac_voltage_overhead=float(self.guide3a_idac_voltage_overhead_var.get()),
-                ir_drop_nominal=float(self.guide3a_ir_drop_nominal_var.get()),
-                ir_drop_3sigma=float(self.guide3a_ir_drop_3sigma_var.get()),
-                vrm_efficiency=float(self.guide3a_vrm_efficiency_var.get()),
-                tec_cop_nominal=float(self.guide3a_tec_cop_nominal_var.get()),
-                tec_cop_3sigma=float(self.guide3a_tec_cop_3sigma_var.get()),
-                tec_power_efficiency=float(self.guide3a_tec_power_efficiency_var.get()),
-                driver_peripherals_power=float(self.guide3a_driver_peripherals_power_var.get()),
-                mcu_power=float(self.guide3a_mcu_power_var.get()),
-                misc_power=float(self.guide3a_misc_power_var.get()),
-                digital_core_efficiency=float(self.guide3a_digital_core_efficiency_var.get())
-            )
-            
-            # Get SOA output requirements
-            soa_output_calculation = guide3a.calculate_target_pout_after_soa(
-                num_wavelengths=num_wavelengths,
-                target_pout_3sigma=target_pout_3sigma,
-                soa_penalty_3sigma=soa_penalty_3sigma
-            )
+            # Get Guide3A SOA output requirements to use as target Pout
+            soa_output_calculation = self._get_soa_output_calculation(num_wavelengths)
+            med_case = soa_output_calculation['median_case']
+            sig_case = soa_output_calculation.get('sigma_case')
             
             # Use SOA output requirements as target Pout for plots
-            pout_median = soa_output_calculation['median_case']['soa_output_requirement_db'] if median_selected else None
-            pout_sigma = soa_output_calculation['sigma_case']['soa_output_requirement_db'] if sigma_selected and soa_output_calculation['sigma_case'] is not None else None
+            pout_median = med_case['soa_output_requirement_db'] if median_selected else None
+            pout_sigma = sig_case['soa_output_requirement_db'] if sigma_selected and sig_case is not None else None
             j_density_median = float(self.j_density_median_var.get()) if median_selected else None
             j_density_sigma = float(self.j_density_sigma_var.get()) if sigma_selected else None
             
+            # Nothing changed since the last figure was built
+            plot_inputs_key = (tuple(selected_plots), w_um, l_active, temp_c, tuple(wavelengths.tolist()),
+                               median_selected, sigma_selected,
+                               pout_median, pout_sigma, j_density_median, j_density_sigma)
+            if self._plot_figure is not None and self._plot_inputs_key == plot_inputs_key:
+                self._plot_figure.show()
+                return
+            
             # Create SOA instance
             soa = EuropaSOA(L_active_um=l_active, W_um=w_um, verbose=False)
             
-            # Generate plots
-            self._create_plots(soa, selected_plots, wavelengths, temp_c, 
-                             median_selected, sigma_selected,
-                             pout_median, pout_sigma, j_density_median, j_density_sigma)
+            # Generate plots on the worker thread
+            future = self._plot_executor.submit(
+                self._create_plots, soa, selected_plots, wavelengths, temp_c,
+                median_selected, sigma_selected,
+                pout_median, pout_sigma, j_density_median, j_density_sigma,
+                self._plot_figure, self._plot_figure_key)
+            self.generate_plots_button.state(['disabled'])
+            self.plot_progress.grid()
+            self.plot_progress.start(10)
+            self.after(50, self._poll_plot_future, future, plot_inputs_key)
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate plots: {e}")
     
+    def _poll_plot_future(self, future, plot_inputs_key):
+        """Wait for the plot worker from the Tk thread and show the figure once it is ready"""
+        if not future.done():
+            self.after(50, self._poll_plot_future, future, plot_inputs_key)
+            return
+        
+        self.plot_progress.stop()
+        self.plot_progress.grid_remove()
+        self.generate_plots_button.state(['!disabled'])
+        try:
+            fig, layout_key = future.result()
+        except Exception as e:
+            self._plot_inputs_key = None
+            messagebox.showerror("Error", f"Failed to generate plots: {e}")
+            return
+        self._plot_figure, self._plot_figure_key = fig, layout_key
+        self._plot_inputs_key = plot_inputs_key
+        fig.show()
+    
+    def _on_close(self):
+        """Stop the plot worker, dropping any queued build, before destroying the window"""
+        self._plot_executor.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+    
     def _create_plots(self, soa, selected_plots, wavelengths, temp_c,
                      median_selected, sigma_selected, pout_median, pout_sigma, 
-                     j_density_median, j_density_sigma):
-        """Create the selected plots"""
+                     j_density_median, j_density_sigma, figure=None, figure_key=None):
+        """Create the selected plots and return (figure, layout key), updating figure in place when figure_key matches (runs on the plot worker thread)"""
+        go, make_subplots = _get_plotly()
         # Define active length range for length-based plots
         l_active_range = np.linspace(40, 880, 50)
         
@@ -1548,383 +1505,214 @@ Note: Results are based on Guide3A SOA output requirements.
         cols = min(3, num_plots)
         rows = (num_plots + cols - 1) // cols
         
-        fig = make_subplots(
-            rows=rows, cols=cols,
-            subplot_titles=[plot_name.replace('_', ' ').replace('vs', 'vs').title() 
-                          for plot_name in selected_plots],
-            specs=[[{"secondary_y": False}] * cols] * rows
-        )
-        
-        plot_idx = 0
-        for plot_name in selected_plots:
+        # All length plots share one root-find per length and case
+        length_sweeps = {}
+        if any(plot_name.endswith('_vs_length') for plot_name in selected_plots):
+            if median_selected:
+                length_sweeps['median'] = self._length_sweep(
+                    soa, l_active_range, wavelengths[0], temp_c,
+                    j_density_median, math.exp(pout_median * _LN10_OVER_10))
+            if sigma_selected:
+                length_sweeps['sigma'] = self._length_sweep(
+                    soa, l_active_range, wavelengths[0], temp_c,
+                    j_density_sigma, math.exp(pout_sigma * _LN10_OVER_10))
+        
+        # All wavelength plots share one fused sweep per case
+        wavelength_curves = {}
+        if any(plot_name.endswith('_vs_wavelength') for plot_name in selected_plots):
+            wavelength_curves = self._compute_all_curves(
+                soa, temp_c, wavelengths, median_selected, sigma_selected,
+                pout_median, pout_sigma, j_density_median, j_density_sigma)
+        
+        # Collect every trace and axis title first and add them to the figure in one batch
+        all_traces = []
+        axis_titles = {}
+        for plot_idx, plot_name in enumerate(selected_plots):
             row = plot_idx // cols + 1
             col = plot_idx % cols + 1
             
             if plot_name == 'wpe_vs_length':
-                self._plot_wpe_vs_length(fig, soa, l_active_range, row, col, temp_c, wavelengths,
-                                       median_selected, sigma_selected, pout_median, pout_sigma,
-                                       j_density_median, j_density_sigma)
+                traces = self._plot_wpe_vs_length(l_active_range, row, col, length_sweeps)
             elif plot_name == 'gain_vs_length':
-                self._plot_gain_vs_length(fig, soa, l_active_range, row, col, temp_c, wavelengths,
-                                        median_selected, sigma_selected, pout_median, pout_sigma,
-                                        j_density_median, j_density_sigma)
+                traces = self._plot_gain_vs_length(l_active_range, row, col, length_sweeps)
             elif plot_name == 'pin_vs_length':
-                self._plot_pin_vs_length(fig, soa, l_active_range, row, col, temp_c, wavelengths,
-                                       median_selected, sigma_selected, pout_median, pout_sigma,
-                                       j_density_median, j_density_sigma)
+                traces = self._plot_pin_vs_length(l_active_range, row, col, length_sweeps)
             elif plot_name == 'wpe_vs_wavelength':
-                self._plot_wpe_vs_wavelength(fig, soa, row, col, temp_c, wavelengths,
-                                           median_selected, sigma_selected, pout_median, pout_sigma,
-                                           j_density_median, j_density_sigma)
+                traces = self._plot_wpe_vs_wavelength(wavelengths, row, col, wavelength_curves)
             elif plot_name == 'gain_vs_wavelength':
-                self._plot_gain_vs_wavelength(fig, soa, row, col, temp_c, wavelengths,
-                                            median_selected, sigma_selected, pout_median, pout_sigma,
-                                            j_density_median, j_density_sigma)
+                traces = self._plot_gain_vs_wavelength(wavelengths, row, col, wavelength_curves)
             elif plot_name == 'pin_vs_wavelength':
-                self._plot_pin_vs_wavelength(fig, soa, row, col, temp_c, wavelengths,
-                                           median_selected, sigma_selected, pout_median, pout_sigma,
-                                           j_density_median, j_density_sigma)
+                traces = self._plot_pin_vs_wavelength(wavelengths, row, col, wavelength_curves)
             elif plot_name == 'saturation_vs_wavelength':
-                self._plot_saturation_vs_wavelength(fig, soa, row, col, temp_c, wavelengths,
-                                                  median_selected, sigma_selected, j_density_median, j_density_sigma)
-            
-            plot_idx += 1
+                traces = self._plot_saturation_vs_wavelength(wavelengths, row, col, wavelength_curves)
+            all_traces.extend(traces)
+            
+            # make_subplots numbers the axes row-major: xaxis, xaxis2, ...
+            axis_suffix = plot_idx + 1 if plot_idx else ''
+            x_title, y_title = _PLOT_AXIS_TITLES[plot_name]
+            axis_titles[f'xaxis{axis_suffix}_title_text'] = x_title
+            axis_titles[f'yaxis{axis_suffix}_title_text'] = y_title
+        
+        # The same plot selection and cases give the same subplots and traces, so the last figure
+        # only needs its data swapped in
+        layout_key = (tuple(selected_plots), median_selected, sigma_selected)
+        if figure is not None and figure_key == layout_key:
+            with figure.batch_update():
+                for trace, (kw, _, _) in zip(figure.data, all_traces):
+                    trace.x = kw['x']
+                    trace.y = kw['y']
+            return figure, layout_key
+        
+        fig = make_subplots(
+            rows=rows, cols=cols,
+            subplot_titles=[_PLOT_DISPLAY_NAMES[plot_name] for plot_name in selected_plots],
+            specs=[[{"secondary_y": False}] * cols] * rows
+        )
+        # Every trace renders through WebGL so the figure needs no SVG trace layer
+        fig.add_traces([go.Scattergl(**kw) for kw, _, _ in all_traces],
+                       rows=[r for _, r, _ in all_traces], cols=[c for _, _, c in all_traces])
         
         # Update layout
         fig.update_layout(
             height=200 * rows + 100,
             width=400 * cols,
             title_text="SOA Performance Analysis",
-            showlegend=True
+            showlegend=True,
+            **axis_titles
         )
         
-        # Show the plot
-        fig.show()
+        return fig, layout_key
     
-    def _plot_wpe_vs_length(self, fig, soa, l_active_range, row, col, temp_c, wavelengths,
-                           median_selected, sigma_selected, pout_median, pout_sigma,
-                           j_density_median, j_density_sigma):
-        """Plot WPE vs Active Length"""
-        wpe_median = []
-        wpe_sigma = []
-        
-        for l_active in l_active_range:
+    def _length_sweep(self, soa, l_active_range, wavelength, temp_c, j_density, target_pout_mw):
+        """Required P_in (dBm), saturated gain (dB) and WPE (%) across active lengths for one case"""
+        n = len(l_active_range)
+        current_ma_arr = soa.calculate_current_mA_from_J_vectorized(j_density, l_active_range)
+        pin_mw = np.full(n, np.nan)
+        gain = np.full(n, np.nan)
+        wpe = np.full(n, np.nan)
+        
+        for i, l_active in enumerate(l_active_range):
             # Create SOA instance for this length
             soa_temp = EuropaSOA(L_active_um=l_active, W_um=soa.W_um, verbose=False)
-            
-            if median_selected:
-                current_ma = soa_temp.calculate_current_mA_from_J(j_density_median)
-                target_pout_mw = 10**(pout_median / 10.0)
-                required_pin_mw = soa_temp.find_Pin_for_target_Pout(
-                    target_pout_mw, current_ma, wavelengths[0], temp_c)
-                if required_pin_mw is not None:
-                    wpe = soa_temp.calculate_wpe(current_ma, wavelengths[0], temp_c, required_pin_mw)
-                    wpe_median.append(wpe)
-                else:
-                    wpe_median.append(None)
-            
-            if sigma_selected:
-                current_ma = soa_temp.calculate_current_mA_from_J(j_density_sigma)
-                target_pout_mw = 10**(pout_sigma / 10.0)
-                required_pin_mw = soa_temp.find_Pin_for_target_Pout(
-                    target_pout_mw, current_ma, wavelengths[0], temp_c)
-                if required_pin_mw is not None:
-                    wpe = soa_temp.calculate_wpe(current_ma, wavelengths[0], temp_c, required_pin_mw)
-                    wpe_sigma.append(wpe)
-                else:
-                    wpe_sigma.append(None)
-        
-        if median_selected:
-            fig.add_trace(
-                go.Scatter(x=l_active_range, y=wpe_median, mode='lines', 
-                          name='Median Loss', line=dict(color='blue')),
-                row=row, col=col
-            )
-        
-        if sigma_selected:
-            fig.add_trace(
-                go.Scatter(x=l_active_range, y=wpe_sigma, mode='lines', 
-                          name='3σ Loss', line=dict(color='red')),
-                row=row, col=col
-            )
+            current_ma = current_ma_arr[i]
+            required_pin_mw = soa_temp.find_Pin_for_target_Pout(
+                target_pout_mw, current_ma, wavelength, temp_c)
+            if required_pin_mw is not None:
+                pin_mw[i] = required_pin_mw
+                gain[i] = soa_temp.get_saturated_gain(wavelength, temp_c, j_density, required_pin_mw)
+                wpe[i] = soa_temp.calculate_wpe(current_ma, wavelength, temp_c, required_pin_mw)
         
-        fig.update_xaxes(title_text="Active Length (µm)", row=row, col=col)
-        fig.update_yaxes(title_text="Wall Plug Efficiency (%)", row=row, col=col)
+        # One vector log10 for the whole sweep; NaN entries stay NaN and plot as gaps
+        pin_dbm = 10.0 * np.log10(pin_mw)
+        return pin_dbm, gain, wpe
     
-    def _plot_gain_vs_length(self, fig, soa, l_active_range, row, col, temp_c, wavelengths,
-                            median_selected, sigma_selected, pout_median, pout_sigma,
-                            j_density_median, j_density_sigma):
-        """Plot SOA Gain vs Active Length"""
-        gain_median = []
-        gain_sigma = []
-        
-        for l_active in l_active_range:
-            # Create SOA instance for this length
-            soa_temp = EuropaSOA(L_active_um=l_active, W_um=soa.W_um, verbose=False)
-            
-            if median_selected:
-                current_ma = soa_temp.calculate_current_mA_from_J(j_density_median)
-                target_pout_mw = 10**(pout_median / 10.0)
-                required_pin_mw = soa_temp.find_Pin_for_target_Pout(
-                    target_pout_mw, current_ma, wavelengths[0], temp_c)
-                if required_pin_mw is not None:
-                    gain = soa_temp.get_saturated_gain(
-                        wavelengths[0], temp_c, j_density_median, required_pin_mw)
-                    gain_median.append(gain)
-                else:
-                    gain_median.append(None)
-            
-            if sigma_selected:
-                current_ma = soa_temp.calculate_current_mA_from_J(j_density_sigma)
-                target_pout_mw = 10**(pout_sigma / 10.0)
-                required_pin_mw = soa_temp.find_Pin_for_target_Pout(
-                    target_pout_mw, current_ma, wavelengths[0], temp_c)
-                if required_pin_mw is not None:
-                    gain = soa_temp.get_saturated_gain(
-                        wavelengths[0], temp_c, j_density_sigma, required_pin_mw)
-                    gain_sigma.append(gain)
-                else:
-                    gain_sigma.append(None)
-        
+    def _compute_all_curves(self, soa, temp_c, wavelengths, median_selected, sigma_selected,
+                            pout_median, pout_sigma, j_density_median, j_density_sigma):
+        """WPE, gain, P_in and saturation power vs wavelength per selected case, one sweep per case"""
+        cases = []
         if median_selected:
-            fig.add_trace(
-                go.Scatter(x=l_active_range, y=gain_median, mode='lines', 
-                          name='Median Loss', line=dict(color='blue'), showlegend=False),
-                row=row, col=col
-            )
-        
+            cases.append(('median', pout_median, j_density_median))
         if sigma_selected:
-            fig.add_trace(
-                go.Scatter(x=l_active_range, y=gain_sigma, mode='lines', 
-                          name='3σ Loss', line=dict(color='red'), showlegend=False),
-                row=row, col=col
-            )
-        
-        fig.update_xaxes(title_text="Active Length (µm)", row=row, col=col)
-        fig.update_yaxes(title_text="Gain (dB)", row=row, col=col)
+            cases.append(('sigma', pout_sigma, j_density_sigma))
+        
+        curves = {}
+        for case, pout, j_density in cases:
+            wpe, gain, pin, saturation = soa.sweep_wavelengths(
+                wavelengths, soa.calculate_current_mA_from_J(j_density),
+                math.exp(pout * _LN10_OVER_10), temp_c)
+            curves[case] = {'wpe': wpe, 'gain': gain, 'pin': pin, 'saturation': saturation}
+        return curves
     
-    def _plot_pin_vs_length(self, fig, soa, l_active_range, row, col, temp_c, wavelengths,
-                           median_selected, sigma_selected, pout_median, pout_sigma,
-                           j_density_median, j_density_sigma):
-        """Plot P_in vs Active Length"""
-        pin_median = []
-        pin_sigma = []
-        
-        for l_active in l_active_range:
-            # Create SOA instance for this length
-            soa_temp = EuropaSOA(L_active_um=l_active, W_um=soa.W_um, verbose=False)
-            
-            if median_selected:
-                current_ma = soa_temp.calculate_current_mA_from_J(j_density_median)
-                target_pout_mw = 10**(pout_median / 10.0)
-                required_pin_mw = soa_temp.find_Pin_for_target_Pout(
-                    target_pout_mw, current_ma, wavelengths[0], temp_c)
-                if required_pin_mw is not None:
-                    pin_median.append(10 * np.log10(required_pin_mw))
-                else:
-                    pin_median.append(None)
-            
-            if sigma_selected:
-                current_ma = soa_temp.calculate_current_mA_from_J(j_density_sigma)
-                target_pout_mw = 10**(pout_sigma / 10.0)
-                required_pin_mw = soa_temp.find_Pin_for_target_Pout(
-                    target_pout_mw, current_ma, wavelengths[0], temp_c)
-                if required_pin_mw is not None:
-                    pin_sigma.append(10 * np.log10(required_pin_mw))
-                else:
-                    pin_sigma.append(None)
-        
-        if median_selected:
-            fig.add_trace(
-                go.Scatter(x=l_active_range, y=pin_median, mode='lines', 
-                          name='Median Loss', line=dict(color='blue'), showlegend=False),
-                row=row, col=col
-            )
-        
-        if sigma_selected:
-            fig.add_trace(
-                go.Scatter(x=l_active_range, y=pin_sigma, mode='lines', 
-                          name='3σ Loss', line=dict(color='red'), showlegend=False),
-                row=row, col=col
-            )
-        
-        fig.update_xaxes(title_text="Active Length (µm)", row=row, col=col)
-        fig.update_yaxes(title_text="Required P_in (dBm)", row=row, col=col)
+    def _plot_wpe_vs_length(self, l_active_range, row, col, length_sweeps):
+        """Plot WPE vs Active Length; returns (trace_kwargs, row, col) tuples"""
+        traces = []
+        if 'median' in length_sweeps:
+            traces.append((dict(x=l_active_range, y=length_sweeps['median'][2], mode='lines', 
+                                name='Median Loss', line=dict(color='blue')), row, col))
+        
+        if 'sigma' in length_sweeps:
+            traces.append((dict(x=l_active_range, y=length_sweeps['sigma'][2], mode='lines', 
+                                name='3σ Loss', line=dict(color='red')), row, col))
+        
+        return traces
     
-    def _plot_wpe_vs_wavelength(self, fig, soa, row, col, temp_c, wavelengths,
-                               median_selected, sigma_selected, pout_median, pout_sigma,
-                               j_density_median, j_density_sigma):
-        """Plot WPE vs Wavelength"""
-        wpe_median = []
-        wpe_sigma = []
-        
-        for wavelength in wavelengths:
-            if median_selected:
-                current_ma = soa.calculate_current_mA_from_J(j_density_median)
-                target_pout_mw = 10**(pout_median / 10.0)
-                required_pin_mw = soa.find_Pin_for_target_Pout(
-                    target_pout_mw, current_ma, wavelength, temp_c)
-                if required_pin_mw is not None:
-                    wpe = soa.calculate_wpe(current_ma, wavelength, temp_c, required_pin_mw)
-                    wpe_median.append(wpe)
-                else:
-                    wpe_median.append(None)
-            
-            if sigma_selected:
-                current_ma = soa.calculate_current_mA_from_J(j_density_sigma)
-                target_pout_mw = 10**(pout_sigma / 10.0)
-                required_pin_mw = soa.find_Pin_for_target_Pout(
-                    target_pout_mw, current_ma, wavelength, temp_c)
-                if required_pin_mw is not None:
-                    wpe = soa.calculate_wpe(current_ma, wavelength, temp_c, required_pin_mw)
-                    wpe_sigma.append(wpe)
-                else:
-                    wpe_sigma.append(None)
-        
-        if median_selected:
-            fig.add_trace(
-                go.Scatter(x=wavelengths, y=wpe_median, mode='lines+markers', 
-                          name='Median Loss', line=dict(color='blue'), showlegend=False),
-                row=row, col=col
-            )
-        
-        if sigma_selected:
-            fig.add_trace(
-                go.Scatter(x=wavelengths, y=wpe_sigma, mode='lines+markers', 
-                          name='3σ Loss', line=dict(color='red'), showlegend=False),
-                row=row, col=col
-            )
-        
-        fig.update_xaxes(title_text="Wavelength (nm)", row=row, col=col)
-        fig.update_yaxes(title_text="Wall Plug Efficiency (%)", row=row, col=col)
+    def _plot_gain_vs_length(self, l_active_range, row, col, length_sweeps):
+        """Plot SOA Gain vs Active Length; returns (trace_kwargs, row, col) tuples"""
+        traces = []
+        if 'median' in length_sweeps:
+            traces.append((dict(x=l_active_range, y=length_sweeps['median'][1], mode='lines', 
+                                name='Median Loss', line=dict(color='blue'), showlegend=False), row, col))
+        
+        if 'sigma' in length_sweeps:
+            traces.append((dict(x=l_active_range, y=length_sweeps['sigma'][1], mode='lines', 
+                                name='3σ Loss', line=dict(color='red'), showlegend=False), row, col))
+        
+        return traces
     
-    def _plot_gain_vs_wavelength(self, fig, soa, row, col, temp_c, wavelengths,
-                                median_selected, sigma_selected, pout_median, pout_sigma,
-                                j_density_median, j_density_sigma):
-        """Plot SOA Gain vs Wavelength"""
-        gain_median = []
-        gain_sigma = []
-        
-        for wavelength in wavelengths:
-            if median_selected:
-                current_ma = soa.calculate_current_mA_from_J(j_density_median)
-                target_pout_mw = 10**(pout_median / 10.0)
-                required_pin_mw = soa.find_Pin_for_target_Pout(
-                    target_pout_mw, current_ma, wavelength, temp_c)
-                if required_pin_mw is not None:
-                    gain = soa.get_saturated_gain(
-                        wavelength, temp_c, j_density_median, required_pin_mw)
-                    gain_median.append(gain)
-                else:
-                    gain_median.append(None)
-            
-            if sigma_selected:
-                current_ma = soa.calculate_current_mA_from_J(j_density_sigma)
-                target_pout_mw = 10**(pout_sigma / 10.0)
-                required_pin_mw = soa.find_Pin_for_target_Pout(
-                    target_pout_mw, current_ma, wavelength, temp_c)
-                if required_pin_mw is not None:
-                    gain = soa.get_saturated_gain(
-                        wavelength, temp_c, j_density_sigma, required_pin_mw)
-                    gain_sigma.append(gain)
-                else:
-                    gain_sigma.append(None)
-        
-        if median_selected:
-            fig.add_trace(
-                go.Scatter(x=wavelengths, y=gain_median, mode='lines+markers', 
-                          name='Median Loss', line=dict(color='blue'), showlegend=False),
-                row=row, col=col
-            )
-        
-        if sigma_selected:
-            fig.add_trace(
-                go.Scatter(x=wavelengths, y=gain_sigma, mode='lines+markers', 
-                          name='3σ Loss', line=dict(color='red'), showlegend=False),
-                row=row, col=col
-            )
-        
-        fig.update_xaxes(title_text="Wavelength (nm)", row=row, col=col)
-        fig.update_yaxes(title_text="Gain (dB)", row=row, col=col)
+    def _plot_pin_vs_length(self, l_active_range, row, col, length_sweeps):
+        """Plot P_in vs Active Length; returns (trace_kwargs, row, col) tuples"""
+        traces = []
+        if 'median' in length_sweeps:
+            traces.append((dict(x=l_active_range, y=length_sweeps['median'][0], mode='lines', 
+                                name='Median Loss', line=dict(color='blue'), showlegend=False), row, col))
+        
+        if 'sigma' in length_sweeps:
+            traces.append((dict(x=l_active_range, y=length_sweeps['sigma'][0], mode='lines', 
+                                name='3σ Loss', line=dict(color='red'), showlegend=False), row, col))
+        
+        return traces
     
-    def _plot_pin_vs_wavelength(self, fig, soa, row, col, temp_c, wavelengths,
-                               median_selected, sigma_selected, pout_median, pout_sigma,
-                               j_density_median, j_density_sigma):
-        """Plot P_in vs Wavelength"""
-        pin_median = []
-        pin_sigma = []
-        
-        for wavelength in wavelengths:
-            if median_selected:
-                current_ma = soa.calculate_current_mA_from_J(j_density_median)
-                target_pout_mw = 10**(pout_median / 10.0)
-                required_pin_mw = soa.find_Pin_for_target_Pout(
-                    target_pout_mw, current_ma, wavelength, temp_c)
-                if required_pin_mw is not None:
-                    pin_median.append(10 * np.log10(required_pin_mw))
-                else:
-                    pin_median.append(None)
-            
-            if sigma_selected:
-                current_ma = soa.calculate_current_mA_from_J(j_density_sigma)
-                target_pout_mw = 10**(pout_sigma / 10.0)
-                required_pin_mw = soa.find_Pin_for_target_Pout(
-                    target_pout_mw, current_ma, wavelength, temp_c)
-                if required_pin_mw is not None:
-                    pin_sigma.append(10 * np.log10(required_pin_mw))
-                else:
-                    pin_sigma.append(None)
-        
-        if median_selected:
-            fig.add_trace(
-                go.Scatter(x=wavelengths, y=pin_median, mode='lines+markers', 
-                          name='Median Loss', line=dict(color='blue'), showlegend=False),
-                row=row, col=col
-            )
-        
-        if sigma_selected:
-            fig.add_trace(
-                go.Scatter(x=wavelengths, y=pin_sigma, mode='lines+markers', 
-                          name='3σ Loss', line=dict(color='red'), showlegend=False),
-                row=row, col=col
-            )
-        
-        fig.update_xaxes(title_text="Wavelength (nm)", row=row, col=col)
-        fig.update_yaxes(title_text="Required P_in (dBm)", row=row, col=col)
+    def _plot_wpe_vs_wavelength(self, wavelengths, row, col, wavelength_curves):
+        """Plot WPE vs Wavelength; returns (trace_kwargs, row, col) tuples"""
+        traces = []
+        if 'median' in wavelength_curves:
+            traces.append((dict(x=wavelengths, y=wavelength_curves['median']['wpe'], mode='lines+markers', 
+                                name='Median Loss', line=dict(color='blue'), showlegend=False), row, col))
+        
+        if 'sigma' in wavelength_curves:
+            traces.append((dict(x=wavelengths, y=wavelength_curves['sigma']['wpe'], mode='lines+markers', 
+                                name='3σ Loss', line=dict(color='red'), showlegend=False), row, col))
+        
+        return traces
     
-    def _plot_saturation_vs_wavelength(self, fig, soa, row, col, temp_c, wavelengths,
-                                      median_selected, sigma_selected, j_density_median, j_density_sigma):
-        """Plot Saturation Power vs Wavelength"""
-        saturation_median = []
-        saturation_sigma = []
-        
-        for wavelength in wavelengths:
-            if median_selected:
-                saturation = soa.get_output_saturation_power_dBm(
-                    wavelength, j_density_median, temp_c)
-                saturation_median.append(saturation)
-            
-            if sigma_selected:
-                saturation = soa.get_output_saturation_power_dBm(
-                    wavelength, j_density_sigma, temp_c)
-                saturation_sigma.append(saturation)
-        
-        if median_selected:
-            fig.add_trace(
-                go.Scatter(x=wavelengths, y=saturation_median, mode='lines+markers', 
-                          name='Median Loss', line=dict(color='blue'), showlegend=False),
-                row=row, col=col
-            )
+    def _plot_gain_vs_wavelength(self, wavelengths, row, col, wavelength_curves):
+        """Plot SOA Gain vs Wavelength; returns (trace_kwargs, row, col) tuples"""
+        traces = []
+        if 'median' in wavelength_curves:
+            traces.append((dict(x=wavelengths, y=wavelength_curves['median']['gain'], mode='lines+markers', 
+                                name='Median Loss', line=dict(color='blue'), showlegend=False), row, col))
+        
+        if 'sigma' in wavelength_curves:
+            traces.append((dict(x=wavelengths, y=wavelength_curves['sigma']['gain'], mode='lines+markers', 
+                                name='3σ Loss', line=dict(color='red'), showlegend=False), row, col))
+        
+        return traces
+    
+    def _plot_pin_vs_wavelength(self, wavelengths, row, col, wavelength_curves):
+        """Plot P_in vs Wavelength; returns (trace_kwargs, row, col) tuples"""
+        traces = []
+        if 'median' in wavelength_curves:
+            traces.append((dict(x=wavelengths, y=wavelength_curves['median']['pin'], mode='lines+markers', 
+                                name='Median Loss', line=dict(color='blue'), showlegend=False), row, col))
+        
+        if 'sigma' in wavelength_curves:
+            traces.append((dict(x=wavelengths, y=wavelength_curves['sigma']['pin'], mode='lines+markers', 
+                                name='3σ Loss', line=dict(color='red'), showlegend=False), row, col))
+        
+        return traces
+    
+    def _plot_saturation_vs_wavelength(self, wavelengths, row, col, wavelength_curves):
+        """Plot Saturation Power vs Wavelength; returns (trace_kwargs, row, col) tuples"""
+        traces = []
+        if 'median' in wavelength_curves:
+            traces.append((dict(x=wavelengths, y=wavelength_curves['median']['saturation'], mode='lines+markers', 
+                                name='Median Loss', line=dict(color='blue'), showlegend=False), row, col))
         
-        if sigma_selected:
-            fig.add_trace(
-                go.Scatter(x=wavelengths, y=saturation_sigma, mode='lines+markers', 
-                          name='3σ Loss', line=dict(color='red'), showlegend=False),
-                row=row, col=col
-            )
+        if 'sigma' in wavelength_curves:
+            traces.append((dict(x=wavelengths, y=wavelength_curves['sigma']['saturation'], mode='lines+markers', 
+                                name='3σ Loss', line=dict(color='red'), showlegend=False), row, col))
         
-        fig.update_xaxes(title_text="Wavelength (nm)", row=row, col=col)
-        fig.update_yaxes(title_text="Saturation Power (dBm)", row=row, col=col)
+        return traces
 
     def calculate_guide3a(self):
         """Calculate Guide3A parameters based on input values"""
@@ -1940,18 +1728,11 @@ Note: Results are based on Guide3A SOA output requirements.
                 messagebox.showerror("Invalid Input", "Number of wavelengths must be between 1 and 32")
                 return
             
-            # Get wavelength values
-            wavelengths = []
-            for i in range(num_wavelengths):
-                try:
-                    wavelength = float(self.wavelength_vars[i].get())
-                    if not (1290 <= wavelength <= 1330):
-                        messagebox.showerror("Invalid Input", f"Wavelength {i+1} must be between 1290 and 1330 nm")
-                        return
-                    wavelengths.append(wavelength)
-                except ValueError:
-                    messagebox.showerror("Invalid Input", f"Wavelength {i+1} must be a valid number")
-                    return
+            # Get wavelength values; Guide3A takes them as a list of floats
+            wavelengths = self._parse_wavelengths(num_wavelengths)
+            if wavelengths is None:
+                return
+            wavelengths = wavelengths.tolist()
             
             # Check which link loss modes are selected
             median_selected = self.link_loss_modes["median-loss"].get()
@@ -1972,43 +1753,11 @@ Note: Results are based on Guide3A SOA output requirements.
                 messagebox.showerror("Invalid Input", "Temperature must be between 25 and 80 °C")
                 return
             
-            # Calculate Guide3A parameters
-            from Guide3A import Guide3A
-            
-            # Create Guide3A instance
-            guide3a = Guide3A(
-                pic_architecture=self.guide3a_architecture_var.get(),
-                fiber_input_type=self.fiber_input_type_var.get(),
-                num_fibers=int(self.num_fibers_var.get()),
-                operating_wavelength_nm=float(self.guide3a_wavelength_var.get()),
-                temperature_c=float(self.guide3a_temp_var.get()),
-                io_in_loss=float(self.guide3a_io_in_loss_var.get()),
-                io_out_loss=float(self.guide3a_io_out_loss_var.get()),
-                connector_in_loss=float(self.guide3a_connector_in_loss_var.get()),
-                connector_out_loss=float(self.guide3a_connector_out_loss_var.get()),
-                wg_in_loss=float(self.guide3a_wg_in_loss_var.get()),
-                wg_out_loss=float(self.guide3a_wg_out_loss_var.get()),
-                tap_in_loss=float(self.guide3a_tap_in_loss_var.get()),
-                tap_out_loss=float(self.guide3a_tap_out_loss_var.get()),
-                psr_loss=float(self.guide3a_psr_loss_var.get()),
-                phase_shifter_loss=float(self.guide3a_phase_shifter_loss_var.get()),
-                coupler_loss=float(self.guide3a_coupler_loss_var.get()),
-                target_pout=float(self.guide3a_target_pout_var.get()),
-                soa_penalty=float(self.guide3a_soa_penalty_var.get()),
-                soa_penalty_3sigma=float(self.guide3a_soa_penalty_3sigma_var.get()),
-                # Module parameters
-                idac_voltage_overhead=float(self.guide3a_idac_voltage_overhead_var.get()),
-                ir_drop_nominal=float(self.guide3a_ir_drop_nominal_var.get()),
-                ir_drop_3sigma=float(self.guide3a_ir_drop_3sigma_var.get()),
-                vrm_efficiency=float(self.guide3a_vrm_efficiency_var.get()),
-                tec_cop_nominal=float(self.guide3a_tec_cop_nominal_var.get()),
-                tec_cop_3sigma=float(self.guide3a_tec_cop_3sigma_var.get()),
-                tec_power_efficiency=float(self.guide3a_tec_power_efficiency_var.get()),
-                driver_peripherals_power=float(self.guide3a_driver_peripherals_power_var.get()),
-                mcu_power=float(self.guide3a_mcu_power_var.get()),
-                misc_power=float(self.guide3a_misc_power_var.get()),
-                digital_core_efficiency=float(self.guide3a_digital_core_efficiency_var.get())
-            )
+            # Read the Guide3A inputs once; the instance and its SOA output and current density results are
+            # shared with the SOA tab, the plots and the transfer buttons, and only the inputs changed since
+            # the last use are applied to it
+            params = self._snapshot_guide3a_params()
+            guide3a = self.guide3a
             
             # Get comprehensive analysis
             total_loss = guide3a.get_total_loss()
@@ -2017,25 +1766,16 @@ Note: Results are based on Guide3A SOA output requirements.
             module_config = guide3a.get_module_configuration()
             
             # Calculate target Pout for all wavelengths
-            target_pout_calculation = guide3a.calculate_target_pout_after_soa(
-                num_wavelengths=num_wavelengths,
-                target_pout_3sigma=float(self.guide3a_target_pout_3sigma_var.get()),
-                soa_penalty_3sigma=float(self.guide3a_soa_penalty_3sigma_var.get())
-            )
+            target_pout_calculation = self._get_soa_output_calculation(num_wavelengths)
             
             # Calculate optimum SOA current density
-            optimum_current_calculation = guide3a.estimate_optimum_soa_current_density(
-                num_wavelengths=num_wavelengths,
-                target_pout_3sigma=float(self.guide3a_target_pout_3sigma_var.get()),
-                soa_penalty_3sigma=float(self.guide3a_soa_penalty_3sigma_var.get()),
-                wavelengths=wavelengths
-            )
+            optimum_current_calculation = self._get_optimum_current_calculation(num_wavelengths, wavelengths)
             
             # Calculate comprehensive performance including PIC and module performance
             comprehensive_performance = guide3a.calculate_comprehensive_performance(
                 num_wavelengths=num_wavelengths,
-                target_pout_3sigma=float(self.guide3a_target_pout_3sigma_var.get()),
-                soa_penalty_3sigma=float(self.guide3a_soa_penalty_3sigma_var.get()),
+                target_pout_3sigma=params['target_pout_3sigma'],
+                soa_penalty_3sigma=params['soa_penalty_3sigma'],
                 wavelengths=wavelengths,
                 soa_active_length_um=l_active,
                 soa_width_um=w_um
@@ -2054,15 +1794,19 @@ Note: Results are based on Guide3A SOA output requirements.
                 sigma_pic_efficiency = comprehensive_performance['sigma_case']['pic_efficiency']
                 sigma_module_performance = comprehensive_performance['sigma_case']['module_performance']
             
-            # Clear results
-            self.guide3a_median_results_text.delete(1.0, tk.END)
-            self.guide3a_sigma_results_text.delete(1.0, tk.END)
+            # Bind the nested result dicts once for the header
+            connector_losses = loss_breakdown['connector_losses']
+            io_losses = loss_breakdown['io_losses']
+            wg_losses = loss_breakdown['waveguide_routing_losses']
+            arch_specific = loss_breakdown['architecture_specific']
+            effective_architecture = module_config['effective_architecture']
+            median_target = target_pout_calculation['median_case']
             
             # Create common header information
-            common_header = f"""Module Configuration:
+            header_parts = [f"""Module Configuration:
 - Fiber Input Type: {module_config['fiber_input_type'].upper()}
 - PIC Architecture: {module_config['pic_architecture'].upper()}
-- Effective Architecture: {module_config['effective_architecture'].upper()}
+- Effective Architecture: {effective_architecture.upper()}
 - Number of Fibers: {module_config['num_fibers']}
 - Number of SOAs: {module_config['num_soas']}
 - Number of PICs: {module_config['num_pics']}
@@ -2070,70 +1814,67 @@ Note: Results are based on Guide3A SOA output requirements.
 - SOAs per PIC: 20
 
 Operating Wavelengths:
-"""
+"""]
             
             # Add operating wavelengths
             for i, wavelength in enumerate(wavelengths):
-                common_header += f"- λ{i+1}: {wavelength:.2f} nm\n"
+                header_parts.append(f"- λ{i+1}: {wavelength:.2f} nm\n")
             
-            common_header += f"""
+            header_parts.append(f"""
 Component Count:
-"""
+""")
             
-            for component, count in component_count.items():
-                common_header += f"- {component.replace('_', ' ').title()}: {count}\n"
+            header_parts.append(_format_component_count(tuple(component_count.items())))
             
-            common_header += f"""
+            header_parts.append(f"""
 Loss Breakdown:
-- Connector Input Loss: {loss_breakdown['connector_losses']['connector_in_loss']:.2f} dB
-- Connector Output Loss: {loss_breakdown['connector_losses']['connector_out_loss']:.2f} dB
-- Total Connector Loss: {loss_breakdown['connector_losses']['total_connector_loss']:.2f} dB
-- I/O Input Loss: {loss_breakdown['io_losses']['io_in_loss']:.2f} dB
-- I/O Output Loss: {loss_breakdown['io_losses']['io_out_loss']:.2f} dB
-- Total I/O Loss: {loss_breakdown['io_losses']['total_io_loss']:.2f} dB
-- Waveguide Input Loss: {loss_breakdown['waveguide_routing_losses']['wg_in_loss']:.2f} dB
-- Waveguide Output Loss: {loss_breakdown['waveguide_routing_losses']['wg_out_loss']:.2f} dB
-- Total Waveguide Routing Loss: {loss_breakdown['waveguide_routing_losses']['total_wg_routing_loss']:.2f} dB
-"""
+- Connector Input Loss: {connector_losses['connector_in_loss']:.2f} dB
+- Connector Output Loss: {connector_losses['connector_out_loss']:.2f} dB
+- Total Connector Loss: {connector_losses['total_connector_loss']:.2f} dB
+- I/O Input Loss: {io_losses['io_in_loss']:.2f} dB
+- I/O Output Loss: {io_losses['io_out_loss']:.2f} dB
+- Total I/O Loss: {io_losses['total_io_loss']:.2f} dB
+- Waveguide Input Loss: {wg_losses['wg_in_loss']:.2f} dB
+- Waveguide Output Loss: {wg_losses['wg_out_loss']:.2f} dB
+- Total Waveguide Routing Loss: {wg_losses['total_wg_routing_loss']:.2f} dB
+""")
             
             # Add architecture-specific losses
-            if 'architecture_specific' in loss_breakdown and loss_breakdown['architecture_specific']:
-                arch_specific = loss_breakdown['architecture_specific']
+            if arch_specific:
                 if 'tap_in_loss' in arch_specific:
-                    common_header += f"- Tap Input Loss: {arch_specific['tap_in_loss']:.2f} dB\n"
-                    common_header += f"- Tap Output Loss: {arch_specific['tap_out_loss']:.2f} dB\n"
-                    common_header += f"- Total Tap Loss: {arch_specific['total_tap_loss']:.2f} dB\n"
+                    header_parts.append(f"- Tap Input Loss: {arch_specific['tap_in_loss']:.2f} dB\n")
+                    header_parts.append(f"- Tap Output Loss: {arch_specific['tap_out_loss']:.2f} dB\n")
+                    header_parts.append(f"- Total Tap Loss: {arch_specific['total_tap_loss']:.2f} dB\n")
                 if 'psr_loss' in arch_specific:
-                    common_header += f"- PSR Loss: {arch_specific['psr_loss']:.2f} dB\n"
-                    common_header += f"- Total PSR Loss: {arch_specific['total_psr_loss']:.2f} dB\n"
+                    header_parts.append(f"- PSR Loss: {arch_specific['psr_loss']:.2f} dB\n")
+                    header_parts.append(f"- Total PSR Loss: {arch_specific['total_psr_loss']:.2f} dB\n")
                 if 'phase_shifter_loss' in arch_specific:
-                    common_header += f"- Phase Shifter Loss: {arch_specific['phase_shifter_loss']:.2f} dB\n"
-                    common_header += f"- Total Phase Shifter Loss: {arch_specific['total_phase_shifter_loss']:.2f} dB\n"
+                    header_parts.append(f"- Phase Shifter Loss: {arch_specific['phase_shifter_loss']:.2f} dB\n")
+                    header_parts.append(f"- Total Phase Shifter Loss: {arch_specific['total_phase_shifter_loss']:.2f} dB\n")
                 if 'coupler_loss' in arch_specific:
-                    common_header += f"- Coupler Loss: {arch_specific['coupler_loss']:.2f} dB\n"
-                    common_header += f"- Total Coupler Loss: {arch_specific['total_coupler_loss']:.2f} dB\n"
+                    header_parts.append(f"- Coupler Loss: {arch_specific['coupler_loss']:.2f} dB\n")
+                    header_parts.append(f"- Total Coupler Loss: {arch_specific['total_coupler_loss']:.2f} dB\n")
             
-            common_header += f"- Total System Loss: {loss_breakdown['total_loss']:.2f} dB\n\n"
+            header_parts.append(f"- Total System Loss: {loss_breakdown['total_loss']:.2f} dB\n\n")
             
             # Add detailed SOA to output loss calculation breakdown
-            soa_to_output_breakdown = target_pout_calculation['median_case']['loss_breakdown']
+            soa_to_output_breakdown = median_target['loss_breakdown']
             
             # Get architecture-specific details
-            arch_specific = loss_breakdown['architecture_specific']
             arch_details = ""
-            if module_config['effective_architecture'] == 'psr':
+            if effective_architecture == 'psr':
                 arch_details = f"PSR Loss ({arch_specific.get('total_psr_loss', 0):.2f} dB)"
                 if 'tap_out_loss' in arch_specific and arch_specific['tap_out_loss'] > 0:
                     arch_details += f" + Tap Output Loss ({arch_specific['tap_out_loss']:.2f} dB)"
-            elif module_config['effective_architecture'] == 'pol_control':
+            elif effective_architecture == 'pol_control':
                 arch_details = f"PSR Loss ({arch_specific.get('total_psr_loss', 0):.2f} dB) + Phase Shifter Loss ({arch_specific.get('total_phase_shifter_loss', 0):.2f} dB) + Coupler Loss ({arch_specific.get('total_coupler_loss', 0):.2f} dB)"
-            elif module_config['effective_architecture'] == 'psrless':
+            elif effective_architecture == 'psrless':
                 if 'tap_out_loss' in arch_specific and arch_specific['tap_out_loss'] > 0:
                     arch_details = f"Tap Output Loss ({arch_specific['tap_out_loss']:.2f} dB)"
                 else:
                     arch_details = "No additional architecture-specific losses"
             
-            common_header += f"""SOA to Output Loss Calculation:
+            header_parts.append(f"""SOA to Output Loss Calculation:
 The loss from SOA to output of Guide3A is calculated by summing all losses that occur after the SOA in the signal path:
 
 Signal Path: Input → [Input Losses] → SOA → [Output Losses] → Output
@@ -2145,148 +1886,95 @@ Losses AFTER SOA (included in calculation):
 4. Architecture-Specific Loss: {soa_to_output_breakdown['architecture_loss']:.2f} dB
    ({arch_details})
 
-Total Loss from SOA to Output: {target_pout_calculation['median_case']['soa_to_output_loss_db']:.2f} dB
+Total Loss from SOA to Output: {median_target['soa_to_output_loss_db']:.2f} dB
 
 Note: This calculation includes only losses that occur AFTER the SOA in the signal path.
 Input losses (before SOA) are not included as they don't affect the SOA output requirement.
 
-"""
+""")
+            
+            common_header = "".join(header_parts)
             
             # Create median case content
-            median_content = common_header + f"""MEDIAN LOSS CASE ANALYSIS
+            median_parts = [common_header, f"""MEDIAN LOSS CASE ANALYSIS
 {'='*30}
 
 Performance Parameters:
-- Target Pout - Median: {float(self.guide3a_target_pout_var.get()):.2f} dBm
-- SOA Penalty - Median: {float(self.guide3a_soa_penalty_var.get()):.1f} dB
-
-Target Pout Calculation for SOA:
-- Base Target Pout: {target_pout_calculation['median_case']['base_target_pout_db']:.2f} dBm
-- SOA Penalty: {target_pout_calculation['median_case']['soa_penalty_db']:.1f} dB
-- Wavelength Penalty (10*log10({num_wavelengths})): {target_pout_calculation['median_case']['wavelength_penalty_db']:.2f} dB
-- Loss from SOA to Output: {target_pout_calculation['median_case']['soa_to_output_loss_db']:.2f} dB
-- Target Pout of SOA: {target_pout_calculation['median_case']['soa_output_requirement_db']:.2f} dBm
-  (Calculated as: Base Target Pout + SOA Penalty + Wavelength Penalty + Loss from SOA to Output)
-
-SOA Current Analysis:
-- Target Pout of SOA: {target_pout_calculation['median_case']['soa_output_requirement_db']:.2f} dBm
-- Optimum Current Density: {optimum_current_calculation['median_case']['current_density_kA_cm2']:.2f} kA/cm²
-- Optimum Current: {optimum_current_calculation['median_case']['current_ma']:.1f} mA
-- Target Saturation Power: {optimum_current_calculation['median_case']['target_saturation_power_mw']:.2f} mW (2dB above target Pout)
-- Average Saturation Power: {optimum_current_calculation['median_case']['avg_saturation_power_mw']:.2f} mW ({optimum_current_calculation['median_case']['avg_saturation_power_db']:.2f} dBm)
-- Power Margin: {optimum_current_calculation['median_case']['margin_db']:.2f} dB
+- Target Pout - Median: {params['target_pout']:.2f} dBm
+- SOA Penalty - Median: {params['soa_penalty']:.1f} dB
 
-PIC Performance:
-"""
+"""]
+            # Target Pout and optimum current fields of one case, merged once for the templates
+            median_soa = {**target_pout_calculation['median_case'],
+                          **optimum_current_calculation['median_case'], 'num_wavelengths': num_wavelengths}
+            median_parts.append(_GUIDE3A_TARGET_POUT_TEMPLATE.format_map(median_soa))
+            median_parts.append(_GUIDE3A_SOA_CURRENT_TEMPLATE.format_map(median_soa))
             
             if 'error' not in median_pic_power:
-                median_content += f"""- SOA Current: {median_pic_power['current_ma']:.1f} mA
-- Operating Voltage: {median_pic_power['operating_voltage_v']:.2f} V
-- Electrical Power per SOA: {median_pic_power['electrical_power_mw']:.1f} mW
-- SOAs per PIC: {median_pic_power['soas_per_pic']}
-- Total PIC Power Consumption: {median_pic_power['total_pic_power_mw']:.1f} mW ({float(median_pic_power['total_pic_power_mw'])/1000:.3f} W)
-"""
+                median_parts.append(_GUIDE3A_PIC_POWER_TEMPLATE.format_map(
+                    {**median_pic_power, 'total_pic_power_w': float(median_pic_power['total_pic_power_mw'])/1000}))
                 
                 if median_pic_efficiency and 'error' not in median_pic_efficiency:
-                    median_content += f"""- Target Pout per Fiber: {median_pic_efficiency['target_pout_mw']:.3f} mW
-- Total Optical Power: {median_pic_efficiency['total_optical_power_mw']:.1f} mW
-- PIC Efficiency: {median_pic_efficiency['pic_efficiency_percent']:.2f}%
-- Heat Load: {median_pic_efficiency['heat_load_w']:.3f} W
-"""
+                    median_parts.append(_GUIDE3A_PIC_EFFICIENCY_TEMPLATE.format_map(median_pic_efficiency))
                 else:
-                    median_content += f"- Error calculating efficiency and heat load: {median_pic_efficiency['error'] if median_pic_efficiency else 'Not available'}\n"
+                    median_parts.append(f"- Error calculating efficiency and heat load: {median_pic_efficiency['error'] if median_pic_efficiency else 'Not available'}\n")
             else:
-                median_content += f"- Error calculating power consumption: {median_pic_power['error']}\n"
+                median_parts.append(f"- Error calculating power consumption: {median_pic_power['error']}\n")
             
             # Add Module Performance section for median case
-            median_content += f"""
-Module Performance:
-"""
+            median_parts.append("\nModule Performance:\n")
             if median_module_performance and 'error' not in median_module_performance:
-                median_content += f"""- Digital Core Power: {median_module_performance['digital_core_power_w']:.3f} W
-- Analog Core Power: {median_module_performance['analog_core_power_w']:.3f} W
-- Thermal Power: {median_module_performance['thermal_power_w']:.3f} W
-- Total Module Power: {median_module_performance['total_module_power_w']:.3f} W
-- Total Optical Power: {median_module_performance['total_optical_power_w']:.3f} W
-- Module Efficiency: {median_module_performance['module_efficiency_percent']:.2f}%
-"""
+                median_parts.append(_GUIDE3A_MODULE_TEMPLATE.format_map(median_module_performance))
             else:
-                median_content += f"- Error calculating module performance: {median_module_performance['error'] if median_module_performance else 'Not available'}\n"
+                median_parts.append(f"- Error calculating module performance: {median_module_performance['error'] if median_module_performance else 'Not available'}\n")
+            
+            median_content = "".join(median_parts)
             
             # Create 3σ case content
-            sigma_content = common_header + f"""3σ LOSS CASE ANALYSIS
+            sigma_parts = [common_header, f"""3σ LOSS CASE ANALYSIS
 {'='*30}
 
 Performance Parameters:
-- Target Pout - 3σ: {float(self.guide3a_target_pout_3sigma_var.get()):.2f} dBm
-- SOA Penalty - 3σ: {float(self.guide3a_soa_penalty_3sigma_var.get()):.1f} dB
+- Target Pout - 3σ: {params['target_pout_3sigma']:.2f} dBm
+- SOA Penalty - 3σ: {params['soa_penalty_3sigma']:.1f} dB
 
-"""
+"""]
             
             if target_pout_calculation['sigma_case'] is not None:
-                sigma_content += f"""Target Pout Calculation for SOA:
-- Base Target Pout: {target_pout_calculation['sigma_case']['base_target_pout_db']:.2f} dBm
-- SOA Penalty: {target_pout_calculation['sigma_case']['soa_penalty_db']:.1f} dB
-- Wavelength Penalty (10*log10({num_wavelengths})): {target_pout_calculation['sigma_case']['wavelength_penalty_db']:.2f} dB
-- Loss from SOA to Output: {target_pout_calculation['sigma_case']['soa_to_output_loss_db']:.2f} dB
-- Target Pout of SOA: {target_pout_calculation['sigma_case']['soa_output_requirement_db']:.2f} dBm
-  (Calculated as: Base Target Pout + SOA Penalty + Wavelength Penalty + Loss from SOA to Output)
-
-"""
+                sigma_parts.append(_GUIDE3A_TARGET_POUT_TEMPLATE.format_map(
+                    {**target_pout_calculation['sigma_case'], 'num_wavelengths': num_wavelengths}))
             else:
-                sigma_content += "Target Pout Calculation for SOA: Not available\n\n"
+                sigma_parts.append("Target Pout Calculation for SOA: Not available\n\n")
             
             if optimum_current_calculation['sigma_case'] is not None:
-                sigma_content += f"""SOA Current Analysis:
-- Target Pout of SOA: {target_pout_calculation['sigma_case']['soa_output_requirement_db']:.2f} dBm
-- Optimum Current Density: {optimum_current_calculation['sigma_case']['current_density_kA_cm2']:.2f} kA/cm²
-- Optimum Current: {optimum_current_calculation['sigma_case']['current_ma']:.1f} mA
-- Target Saturation Power: {optimum_current_calculation['sigma_case']['target_saturation_power_mw']:.2f} mW (2dB above target Pout)
-- Average Saturation Power: {optimum_current_calculation['sigma_case']['avg_saturation_power_mw']:.2f} mW ({optimum_current_calculation['sigma_case']['avg_saturation_power_db']:.2f} dBm)
-- Power Margin: {optimum_current_calculation['sigma_case']['margin_db']:.2f} dB
-
-PIC Performance:
-"""
+                sigma_soa = {**target_pout_calculation['sigma_case'], **optimum_current_calculation['sigma_case']}
+                sigma_parts.append(_GUIDE3A_SOA_CURRENT_TEMPLATE.format_map(sigma_soa))
                 
                 if sigma_pic_power and 'error' not in sigma_pic_power:
-                    sigma_content += f"""- SOA Current: {sigma_pic_power['current_ma']:.1f} mA
-- Operating Voltage: {sigma_pic_power['operating_voltage_v']:.2f} V
-- Electrical Power per SOA: {sigma_pic_power['electrical_power_mw']:.1f} mW
-- SOAs per PIC: {sigma_pic_power['soas_per_pic']}
-- Total PIC Power Consumption: {sigma_pic_power['total_pic_power_mw']:.1f} mW ({float(sigma_pic_power['total_pic_power_mw'])/1000:.3f} W)
-"""
+                    sigma_parts.append(_GUIDE3A_PIC_POWER_TEMPLATE.format_map(
+                        {**sigma_pic_power, 'total_pic_power_w': float(sigma_pic_power['total_pic_power_mw'])/1000}))
                     
                     if sigma_pic_efficiency and 'error' not in sigma_pic_efficiency:
-                        sigma_content += f"""- Target Pout per Fiber: {sigma_pic_efficiency['target_pout_mw']:.3f} mW
-- Total Optical Power: {sigma_pic_efficiency['total_optical_power_mw']:.1f} mW
-- PIC Efficiency: {sigma_pic_efficiency['pic_efficiency_percent']:.2f}%
-- Heat Load: {sigma_pic_efficiency['heat_load_w']:.3f} W
-"""
+                        sigma_parts.append(_GUIDE3A_PIC_EFFICIENCY_TEMPLATE.format_map(sigma_pic_efficiency))
                     else:
-                        sigma_content += f"- Error calculating efficiency and heat load: {sigma_pic_efficiency['error'] if sigma_pic_efficiency else 'Not available'}\n"
+                        sigma_parts.append(f"- Error calculating efficiency and heat load: {sigma_pic_efficiency['error'] if sigma_pic_efficiency else 'Not available'}\n")
                 else:
-                    sigma_content += f"- Error calculating power consumption: {sigma_pic_power['error'] if sigma_pic_power else 'Not available'}\n"
+                    sigma_parts.append(f"- Error calculating power consumption: {sigma_pic_power['error'] if sigma_pic_power else 'Not available'}\n")
             else:
-                sigma_content += "SOA Current Analysis: Not available\n\nPIC Performance: Not available"
+                sigma_parts.append("SOA Current Analysis: Not available\n\nPIC Performance: Not available")
             
             # Add Module Performance section for sigma case
-            sigma_content += f"""
-Module Performance:
-"""
+            sigma_parts.append("\nModule Performance:\n")
             if sigma_module_performance and 'error' not in sigma_module_performance:
-                sigma_content += f"""- Digital Core Power: {sigma_module_performance['digital_core_power_w']:.3f} W
-- Analog Core Power: {sigma_module_performance['analog_core_power_w']:.3f} W
-- Thermal Power: {sigma_module_performance['thermal_power_w']:.3f} W
-- Total Module Power: {sigma_module_performance['total_module_power_w']:.3f} W
-- Total Optical Power: {sigma_module_performance['total_optical_power_w']:.3f} W
-- Module Efficiency: {sigma_module_performance['module_efficiency_percent']:.2f}%
-"""
+                sigma_parts.append(_GUIDE3A_MODULE_TEMPLATE.format_map(sigma_module_performance))
             else:
-                sigma_content += f"- Error calculating module performance: {sigma_module_performance['error'] if sigma_module_performance else 'Not available'}\n"
+                sigma_parts.append(f"- Error calculating module performance: {sigma_module_performance['error'] if sigma_module_performance else 'Not available'}\n")
+            
+            sigma_content = "".join(sigma_parts)
             
             # Display results in respective text widgets
-            self.guide3a_median_results_text.insert(1.0, median_content)
-            self.guide3a_sigma_results_text.insert(1.0, sigma_content)
+            self._bulk_set_text(self.guide3a_median_results_text, median_content)
+            self._bulk_set_text(self.guide3a_sigma_results_text, sigma_content)
             
         except ValueError:
             messagebox.showerror("Input Error", "Please ensure all values are valid numbers.")
@@ -2299,169 +1987,84 @@ Module Performance:
         self.guide3a_architecture_var.set("psrless")
         self.num_fibers_var.set("40")
         
-        # Reset performance parameters (matching EuropaSOA defaults)
-        self.guide3a_wavelength_var.set("1310")
-        self.guide3a_temp_var.set("40")
-        
-        # Reset loss components
-        self.guide3a_io_in_loss_var.set("1.5")
-        self.guide3a_io_out_loss_var.set("1.5")
-        self.guide3a_connector_in_loss_var.set("0.25")
-        self.guide3a_connector_out_loss_var.set("0.25")
-        self.guide3a_wg_in_loss_var.set("0.25")
-        self.guide3a_wg_out_loss_var.set("0.25")
-        self.guide3a_tap_in_loss_var.set("0.3")
-        self.guide3a_tap_out_loss_var.set("0.3")
-        self.guide3a_psr_loss_var.set("0.5")
-        self.guide3a_phase_shifter_loss_var.set("0.5")
-        self.guide3a_coupler_loss_var.set("0.2")
-        
-        # Reset link requirements
-        self.guide3a_target_pout_var.set("-3.3")
-        self.guide3a_target_pout_3sigma_var.set("-0.3")
-        self.guide3a_soa_penalty_var.set("2")
-        self.guide3a_soa_penalty_3sigma_var.set("2")
-        
-        # Reset module parameters
-        self.guide3a_idac_voltage_overhead_var.set("0.4")
-        self.guide3a_ir_drop_nominal_var.set("0.1")
-        self.guide3a_ir_drop_3sigma_var.set("0.2")
-        self.guide3a_vrm_efficiency_var.set("80")
-        self.guide3a_tec_cop_nominal_var.set("4")
-        self.guide3a_tec_cop_3sigma_var.set("2")
-        self.guide3a_tec_power_efficiency_var.set("80")
-        self.guide3a_driver_peripherals_power_var.set("1.0")
-        self.guide3a_mcu_power_var.set("0.5")
-        self.guide3a_misc_power_var.set("0.25")
-        self.guide3a_digital_core_efficiency_var.set("80")
-        
-        self.guide3a_median_results_text.delete(1.0, tk.END)
-        self.guide3a_sigma_results_text.delete(1.0, tk.END)
+        # Reset the numeric inputs (performance parameters match the EuropaSOA defaults)
+        for name, var in self._guide3a_var_map.items():
+            var.set(_GUIDE3A_INPUT_DEFAULTS[name])
+        
+        self._bulk_set_text(self.guide3a_median_results_text, "")
+        self._bulk_set_text(self.guide3a_sigma_results_text, "")
+
+    def _apply_soa_outputs(self, soa_output_calculation, optimum_current_calculation):
+        """Copy the Guide3A SOA output requirements and current densities into the EuropaSOA tab"""
+        median_soa_output = soa_output_calculation['median_case']['soa_output_requirement_db']
+        median_current_density = optimum_current_calculation['median_case']['current_density_kA_cm2']
+        sigma_soa_output = None
+        sigma_current_density = None
+        if soa_output_calculation['sigma_case'] is not None:
+            sigma_soa_output = soa_output_calculation['sigma_case']['soa_output_requirement_db']
+        if optimum_current_calculation['sigma_case'] is not None:
+            sigma_current_density = optimum_current_calculation['sigma_case']['current_density_kA_cm2']
+        
+        # Update the EuropaSOA target Pout and current density fields back to back, then redraw once
+        self.pout_median_var.set(f"{median_soa_output:.2f}")
+        self.j_density_median_var.set(f"{median_current_density:.2f}")
+        if sigma_soa_output is not None:
+            self.pout_sigma_var.set(f"{sigma_soa_output:.2f}")
+        if sigma_current_density is not None:
+            self.j_density_sigma_var.set(f"{sigma_current_density:.2f}")
+        self.update_idletasks()
+        
+        # Create update message
+        if sigma_soa_output is not None and sigma_current_density is not None:
+            sigma_msg = f"{sigma_soa_output:.2f} dBm, {sigma_current_density:.2f} kA/cm²"
+        else:
+            sigma_msg = "Not available"
+        update_msg = _SOA_UPDATE_MSG_TEMPLATE.format(
+            median_pout=median_soa_output, median_j=median_current_density, sigma=sigma_msg)
+        
+        messagebox.showinfo("Updated", update_msg)
 
     def transfer_to_europasoa(self):
         """Transfer calculated SOA output requirements and current density from Guide3A to EuropaSOA tab"""
         try:
-            # Get current Guide3A parameters
-            from Guide3A import Guide3A
-            
-            # Create Guide3A instance with current parameters
-            guide3a = Guide3A(
-                pic_architecture=self.guide3a_architecture_var.get(),
-                fiber_input_type=self.fiber_input_type_var.get(),
-                num_fibers=int(self.num_fibers_var.get()),
-                operating_wavelength_nm=float(self.guide3a_wavelength_var.get()),
-                temperature_c=float(self.guide3a_temp_var.get()),
-                io_in_loss=float(self.guide3a_io_in_loss_var.get()),
-                io_out_loss=float(self.guide3a_io_out_loss_var.get()),
-                connector_in_loss=float(self.guide3a_connector_in_loss_var.get()),
-                connector_out_loss=float(self.guide3a_connector_out_loss_var.get()),
-                wg_in_loss=float(self.guide3a_wg_in_loss_var.get()),
-                wg_out_loss=float(self.guide3a_wg_out_loss_var.get()),
-                tap_in_loss=float(self.guide3a_tap_in_loss_var.get()),
-                tap_out_loss=float(self.guide3a_tap_out_loss_var.get()),
-                psr_loss=float(self.guide3a_psr_loss_var.get()),
-                phase_shifter_loss=float(self.guide3a_phase_shifter_loss_var.get()),
-                coupler_loss=float(self.guide3a_coupler_loss_var.get()),
-                target_pout=float(self.guide3a_target_pout_var.get()),
-                soa_penalty=float(self.guide3a_soa_penalty_var.get()),
-                soa_penalty_3sigma=float(self.guide3a_soa_penalty_3sigma_var.get()),
-                # Module parameters
-                idac_voltage_overhead=float(self.guide3a_idac_voltage_overhead_var.get()),
-                ir_drop_nominal=float(self.guide3a_ir_drop_nominal_var.get()),
-                ir_drop_3sigma=float(self.guide3a_ir_drop_3sigma_var.get()),
-                vrm_efficiency=float(self.guide3a_vrm_efficiency_var.get()),
-                tec_cop_nominal=float(self.guide3a_tec_cop_nominal_var.get()),
-                tec_cop_3sigma=float(self.guide3a_tec_cop_3sigma_var.get()),
-                tec_power_efficiency=float(self.guide3a_tec_power_efficiency_var.get()),
-                driver_peripherals_power=float(self.guide3a_driver_peripherals_power_var.get()),
-                mcu_power=float(self.guide3a_mcu_power_var.get()),
-                misc_power=float(self.guide3a_misc_power_var.get()),
-                digital_core_efficiency=float(self.guide3a_digital_core_efficiency_var.get())
-            )
-            
-            # Calculate SOA output requirements
-            num_wavelengths = int(self.num_fibers_var.get())
-            soa_output_calculation = guide3a.calculate_target_pout_after_soa(
-                num_wavelengths=num_wavelengths,
-                target_pout_3sigma=float(self.guide3a_target_pout_3sigma_var.get()),
-                soa_penalty_3sigma=float(self.guide3a_soa_penalty_3sigma_var.get())
-            )
-            
-            # Calculate optimum current density
-            wavelengths = []
-            for i in range(num_wavelengths):
-                try:
-                    wavelength = float(self.wavelength_vars[i].get())
-                    wavelengths.append(wavelength)
-                except ValueError:
-                    wavelengths.append(1310.0)  # Default if invalid
-            
-            optimum_current_calculation = guide3a.estimate_optimum_soa_current_density(
-                num_wavelengths=num_wavelengths,
-                target_pout_3sigma=float(self.guide3a_target_pout_3sigma_var.get()),
-                soa_penalty_3sigma=float(self.guide3a_soa_penalty_3sigma_var.get()),
-                wavelengths=wavelengths
-            )
-            
-            # Update EuropaSOA target Pout values
-            median_soa_output = soa_output_calculation['median_case']['soa_output_requirement_db']
-            self.pout_median_var.set(f"{median_soa_output:.2f}")
-            
-            # Update EuropaSOA current density values
-            median_current_density = optimum_current_calculation['median_case']['current_density_kA_cm2']
-            self.j_density_median_var.set(f"{median_current_density:.2f}")
-            
-            sigma_soa_output = None
-            sigma_current_density = None
-            if soa_output_calculation['sigma_case'] is not None:
-                sigma_soa_output = soa_output_calculation['sigma_case']['soa_output_requirement_db']
-                self.pout_sigma_var.set(f"{sigma_soa_output:.2f}")
-            
-            if optimum_current_calculation['sigma_case'] is not None:
-                sigma_current_density = optimum_current_calculation['sigma_case']['current_density_kA_cm2']
-                self.j_density_sigma_var.set(f"{sigma_current_density:.2f}")
-            
-            # Create update message
-            update_msg = f"EuropaSOA target Pout and current density values updated:\n"
-            update_msg += f"Median: {median_soa_output:.2f} dBm, {median_current_density:.2f} kA/cm²\n"
-            if sigma_soa_output is not None and sigma_current_density is not None:
-                update_msg += f"3σ: {sigma_soa_output:.2f} dBm, {sigma_current_density:.2f} kA/cm²"
-            else:
-                update_msg += f"3σ: Not available"
-            
-            messagebox.showinfo("Updated", update_msg)
-            
-        except Exception as e:
+            # Memoized on the Guide3A inputs, so this is free right after a Calculate
+            num_wavelengths = int(self.num_wavelengths_var.get())
+            soa_output_calculation, optimum_current_calculation = self._get_guide3a_soa_requirements(num_wavelengths)
+        except (ValueError, ArithmeticError) as e:
+            # Unparseable inputs, Guide3A parameter validation, or a degenerate SOA operating point
             messagebox.showerror("Update Error", f"Failed to update EuropaSOA values: {e}")
+            return
+        
+        self._apply_soa_outputs(soa_output_calculation, optimum_current_calculation)
 
     def on_fiber_type_change(self, event):
         """Callback function to update PIC architecture when fiber input type changes"""
+        # Coalesce a burst of selections into a single update
+        if self._pending_fiber_type_id is not None:
+            self.after_cancel(self._pending_fiber_type_id)
+        self._pending_fiber_type_id = self.after(150, self._do_fiber_type_change)
+
+    def _do_fiber_type_change(self):
+        """Apply the fiber input type to the PIC architecture and dependent fields"""
+        self._pending_fiber_type_id = None
         fiber_type = self.fiber_input_type_var.get()
+        options = self._PM_ARCHITECTURES if fiber_type == "pm" else self._SM_ARCHITECTURES
+        
+        # Re-selecting the current fiber type keeps a valid architecture choice and the combobox as they are
+        if fiber_type == self._last_fiber_type and self.guide3a_architecture_var.get() in options:
+            return
+        self._last_fiber_type = fiber_type
         
         if fiber_type == "pm":
-            # For PM fiber, automatically set to psrless
+            # For PM fiber, automatically set to psrless, the only option
             self.guide3a_architecture_var.set("psrless")
-            # Update combobox values to only show psrless
-            self.guide3a_architecture_combo['values'] = ["psrless"]
-            self.guide3a_architecture_combo['state'] = "disabled"
-            
-            # Disable PSR, Phase Shifter, and Coupler input fields for PM fiber
-            self.guide3a_psr_loss_entry.config(state='disabled')
-            self.guide3a_phase_shifter_entry.config(state='disabled')
-            self.guide3a_coupler_loss_entry.config(state='disabled')
+            self.guide3a_architecture_combo.configure(values=options, state="disabled")
         else:
             # For SM fiber, allow psr or pol_control
             self.guide3a_architecture_var.set("psr")
-            # Update combobox values to show psr and pol_control
-            self.guide3a_architecture_combo['values'] = ["psr", "pol_control"]
-            self.guide3a_architecture_combo['state'] = "readonly"
-            
-            # Enable PSR, Phase Shifter, and Coupler input fields for SM fiber
-            self.guide3a_psr_loss_entry.config(state='normal')
-            self.guide3a_phase_shifter_entry.config(state='normal')
-            self.guide3a_coupler_loss_entry.config(state='normal')
+            self.guide3a_architecture_combo.configure(values=options, state="readonly")
         
-        # Also check if architecture is psrless and disable accordingly
+        # Disable PSR, Phase Shifter, and Coupler input fields for PM fiber or psrless architecture
         self._update_architecture_dependent_fields()
     
     def _update_architecture_dependent_fields(self):
@@ -2483,99 +2086,24 @@ Module Performance:
 
     def use_guide3a_results(self):
         """Use the calculated SOA output requirements and current density from Guide3A as target Pout in EuropaSOA"""
+        # Coalesce repeated clicks into a single update
+        if self._pending_update_id is not None:
+            self.after_cancel(self._pending_update_id)
+        self._pending_update_id = self.after(150, self._do_use_guide3a_results)
+
+    def _do_use_guide3a_results(self):
+        """Copy the Guide3A SOA requirements into EuropaSOA"""
+        self._pending_update_id = None
         try:
-            # Get current Guide3A parameters
-            from Guide3A import Guide3A
-            
-            # Create Guide3A instance with current parameters
-            guide3a = Guide3A(
-                pic_architecture=self.guide3a_architecture_var.get(),
-                fiber_input_type=self.fiber_input_type_var.get(),
-                num_fibers=int(self.num_fibers_var.get()),
-                operating_wavelength_nm=float(self.guide3a_wavelength_var.get()),
-                temperature_c=float(self.guide3a_temp_var.get()),
-                io_in_loss=float(self.guide3a_io_in_loss_var.get()),
-                io_out_loss=float(self.guide3a_io_out_loss_var.get()),
-                connector_in_loss=float(self.guide3a_connector_in_loss_var.get()),
-                connector_out_loss=float(self.guide3a_connector_out_loss_var.get()),
-                wg_in_loss=float(self.guide3a_wg_in_loss_var.get()),
-                wg_out_loss=float(self.guide3a_wg_out_loss_var.get()),
-                tap_in_loss=float(self.guide3a_tap_in_loss_var.get()),
-                tap_out_loss=float(self.guide3a_tap_out_loss_var.get()),
-                psr_loss=float(self.guide3a_psr_loss_var.get()),
-                phase_shifter_loss=float(self.guide3a_phase_shifter_loss_var.get()),
-                coupler_loss=float(self.guide3a_coupler_loss_var.get()),
-                target_pout=float(self.guide3a_target_pout_var.get()),
-                soa_penalty=float(self.guide3a_soa_penalty_var.get()),
-                soa_penalty_3sigma=float(self.guide3a_soa_penalty_3sigma_var.get()),
-                # Module parameters
-                idac_voltage_overhead=float(self.guide3a_idac_voltage_overhead_var.get()),
-                ir_drop_nominal=float(self.guide3a_ir_drop_nominal_var.get()),
-                ir_drop_3sigma=float(self.guide3a_ir_drop_3sigma_var.get()),
-                vrm_efficiency=float(self.guide3a_vrm_efficiency_var.get()),
-                tec_cop_nominal=float(self.guide3a_tec_cop_nominal_var.get()),
-                tec_cop_3sigma=float(self.guide3a_tec_cop_3sigma_var.get()),
-                tec_power_efficiency=float(self.guide3a_tec_power_efficiency_var.get()),
-                driver_peripherals_power=float(self.guide3a_driver_peripherals_power_var.get()),
-                mcu_power=float(self.guide3a_mcu_power_var.get()),
-                misc_power=float(self.guide3a_misc_power_var.get()),
-                digital_core_efficiency=float(self.guide3a_digital_core_efficiency_var.get())
-            )
-            
-            # Calculate SOA output requirements
-            num_wavelengths = int(self.num_fibers_var.get())
-            soa_output_calculation = guide3a.calculate_target_pout_after_soa(
-                num_wavelengths=num_wavelengths,
-                target_pout_3sigma=float(self.guide3a_target_pout_3sigma_var.get()),
-                soa_penalty_3sigma=float(self.guide3a_soa_penalty_3sigma_var.get())
-            )
-            
-            # Calculate optimum current density
-            wavelengths = []
-            for i in range(num_wavelengths):
-                try:
-                    wavelength = float(self.wavelength_vars[i].get())
-                    wavelengths.append(wavelength)
-                except ValueError:
-                    wavelengths.append(1310.0)  # Default if invalid
-            
-            optimum_current_calculation = guide3a.estimate_optimum_soa_current_density(
-                num_wavelengths=num_wavelengths,
-                target_pout_3sigma=float(self.guide3a_target_pout_3sigma_var.get()),
-                soa_penalty_3sigma=float(self.guide3a_soa_penalty_3sigma_var.get()),
-                wavelengths=wavelengths
-            )
-            
-            # Update EuropaSOA target Pout values
-            median_soa_output = soa_output_calculation['median_case']['soa_output_requirement_db']
-            self.pout_median_var.set(f"{median_soa_output:.2f}")
-            
-            # Update EuropaSOA current density values
-            median_current_density = optimum_current_calculation['median_case']['current_density_kA_cm2']
-            self.j_density_median_var.set(f"{median_current_density:.2f}")
-            
-            sigma_soa_output = None
-            sigma_current_density = None
-            if soa_output_calculation['sigma_case'] is not None:
-                sigma_soa_output = soa_output_calculation['sigma_case']['soa_output_requirement_db']
-                self.pout_sigma_var.set(f"{sigma_soa_output:.2f}")
-            
-            if optimum_current_calculation['sigma_case'] is not None:
-                sigma_current_density = optimum_current_calculation['sigma_case']['current_density_kA_cm2']
-                self.j_density_sigma_var.set(f"{sigma_current_density:.2f}")
-            
-            # Create update message
-            update_msg = f"EuropaSOA target Pout and current density values updated:\n"
-            update_msg += f"Median: {median_soa_output:.2f} dBm, {median_current_density:.2f} kA/cm²\n"
-            if sigma_soa_output is not None and sigma_current_density is not None:
-                update_msg += f"3σ: {sigma_soa_output:.2f} dBm, {sigma_current_density:.2f} kA/cm²"
-            else:
-                update_msg += f"3σ: Not available"
-            
-            messagebox.showinfo("Updated", update_msg)
-            
-        except Exception as e:
+            # Memoized on the Guide3A inputs, so this is free right after a Calculate
+            num_wavelengths = int(self.num_wavelengths_var.get())
+            soa_output_calculation, optimum_current_calculation = self._get_guide3a_soa_requirements(num_wavelengths)
+        except (ValueError, ArithmeticError) as e:
+            # Unparseable inputs, Guide3A parameter validation, or a degenerate SOA operating point
             messagebox.showerror("Update Error", f"Failed to update EuropaSOA values: {e}")
+            return
+        
+        self._apply_soa_outputs(soa_output_calculation, optimum_current_calculation)
 
     def on_architecture_change(self, event):
         """Callback function to update field states when architecture changes"""